@@ -0,0 +1,118 @@
+"""
+কম্পাইল করা সিঙ্গেল-পাস যোগাযোগ স্ক্যানার (scan_contact_info) বনাম পুরনো check_for_contact_info-এর
+মাইক্রো-বেঞ্চমার্ক। বাস্তবসম্মত বিস্তারিত রেকর্ডের উপর দুটো পদ্ধতি চালিয়ে সময় ও ফলাফলের মিল দেখায়।
+
+ব্যবহার: python benchmarks/bench_contact_scanner.py [চাকরির সংখ্যা] [পুনরাবৃত্তি]
+"""
+import contextlib
+import io
+import re
+import sys
+import time
+from html.parser import HTMLParser
+
+from common import load_sync_module, make_job_detail
+
+SCANNED_FIELDS = [
+    'JobDescription', 'EducationRequirements', 'experience', 'AdditionJobRequirements',
+    'RecruitmentProcessingInformation', 'ApplyInstruction', 'ApplyEmail',
+]
+
+
+class LegacyHTMLStripper(HTMLParser):
+    """পরিবর্তনের আগের HTMLStripper (তুলনার জন্য হুবহু রাখা)।"""
+    def __init__(self):
+        super().__init__()
+        self.reset()
+        self.strict = False
+        self.convert_charrefs = True
+        self.fed = []
+
+    def handle_data(self, d):
+        self.fed.append(d)
+
+    def get_data(self):
+        return ''.join(self.fed)
+
+
+def legacy_strip_html_tags(html_content: str) -> str:
+    """পরিবর্তনের আগের strip_html_tags (তুলনার জন্য হুবহু রাখা)।"""
+    if not html_content:
+        return ""
+    try:
+        stripper = LegacyHTMLStripper()
+        stripper.feed(html_content)
+        return stripper.get_data().strip().replace('\n', ' ').replace('\r', '').strip()
+    except Exception:
+        return html_content
+
+
+def legacy_check_for_contact_info(text: str) -> bool:
+    """পরিবর্তনের আগের check_for_contact_info (তুলনার জন্য হুবহু রাখা)।"""
+    if not text:
+        return False
+    cleaned_phone_text = re.sub(r'[\s\-\(\)\.\+\/]', '', text)
+    phone_pattern_11_digit = r'\b(01[3-9]\d{8})\b'
+    phone_pattern_13_digit = r'\b(\+8801[3-9]\d{8})\b'
+    if re.search(phone_pattern_11_digit, cleaned_phone_text) or re.search(phone_pattern_13_digit, text):
+        print("       ✅ যোগাযোগ তথ্য পাওয়া গেছে: বৈধ বাংলাদেশি ফোন নাম্বার।")
+        return True
+    email_pattern = r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
+    all_emails = re.findall(email_pattern, text, re.IGNORECASE)
+    if not all_emails:
+        print("       ❌ কোনো বৈধ যোগাযোগের তথ্য (Gmail বা ফোন) পাওয়া যায়নি।")
+        return False
+    for email in all_emails:
+        if email.lower().endswith('@gmail.com'):
+            print("       ✅ যোগাযোগ তথ্য পাওয়া গেছে: বৈধ Gmail.")
+            return True
+    print("       ❌ কঠোরতা: শুধুমাত্র অন্য ডোমেইনের ইমেইল পাওয়া গেছে, যা বৈধ নয়। বাতিল করা হলো।")
+    return False
+
+
+def run_legacy(module, details_list):
+    verdicts = []
+    for details in details_list:
+        all_text_content = " ".join(details.get(field, '') for field in SCANNED_FIELDS)
+        clean_text = legacy_strip_html_tags(all_text_content).strip()
+        verdicts.append(legacy_check_for_contact_info(clean_text))
+    return verdicts
+
+
+def run_scanner(module, details_list):
+    verdicts = []
+    for details in details_list:
+        matches = module.scan_contact_info({field: details.get(field, '') for field in SCANNED_FIELDS})
+        verdicts.append(module.contact_rejection_reason(matches) is None)
+    return verdicts
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    job_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    module = load_sync_module()
+    details_list = [make_job_detail(i) for i in range(job_count)]
+
+    legacy_time, legacy_verdicts = best_of(lambda: run_legacy(module, details_list), repeat)
+    scanner_time, scanner_verdicts = best_of(lambda: run_scanner(module, details_list), repeat)
+
+    agree = sum(1 for a, b in zip(legacy_verdicts, scanner_verdicts) if a == b)
+    print(f"jobs: {job_count}, best of {repeat}")
+    print(f"  legacy check_for_contact_info : {legacy_time * 1000:8.1f} ms  ({job_count / legacy_time:9.0f} jobs/sec), accepted {sum(legacy_verdicts)}")
+    print(f"  scan_contact_info             : {scanner_time * 1000:8.1f} ms  ({job_count / scanner_time:9.0f} jobs/sec), accepted {sum(scanner_verdicts)}")
+    print(f"  speedup: {legacy_time / scanner_time:.2f}x, same verdict on {agree}/{job_count} jobs")
+
+
+if __name__ == '__main__':
+    main()
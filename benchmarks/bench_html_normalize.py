@@ -0,0 +1,114 @@
+"""
+বিস্তারিত HTML নর্মালাইজেশনের (টেক্সট বের করা, যোগাযোগ স্ক্যান ও sanitize) মাইক্রো-বেঞ্চমার্ক। বড় ব্যাচে
+তিনটি পদ্ধতি তুলনা করে:
+  - legacy  : পরিবর্তনের আগের পথ — প্রতি ফিল্ডে html_to_text ও পুরনো একক CONTACT_PATTERN দিয়ে স্ক্যান, তারপর
+              গ্রহণযোগ্য চাকরির HTML রেন্ডারের সময় sanitize
+  - inline  : normalize_job_details_batch, একই প্রসেসে
+  - pool    : normalize_job_details_batch, প্রসেস পুলে (chunk আকারে)
+সব পদ্ধতিতে বাতিল চাকরির HTML sanitize হয় না (প্রোডাকশনের মতো skip_rejected_html)। প্রতিটি চাকরির বর্ণনায়
+আলাদা লেখা যোগ করা হয়, যাতে sanitize_job_html-এর ক্যাশ ফলাফলে প্রভাব না ফেলে।
+
+ব্যবহার: python benchmarks/bench_html_normalize.py [চাকরির সংখ্যা] [--processes N] [--repeat R]
+"""
+import argparse
+import contextlib
+import io
+import os
+import re
+import time
+
+from common import load_sync_module, make_job_detail
+
+
+def make_details(job_count: int):
+    details_list = []
+    for i in range(job_count):
+        details = make_job_detail(i)
+        details['JobDescription'] = details.get('JobDescription', '') + f'<p>Ref {i}</p>'
+        details_list.append(details)
+    return details_list
+
+
+def legacy_contact_pattern(module):
+    """পরিবর্তনের আগের CONTACT_PATTERN (শুরুর lookahead ছাড়া; তুলনার জন্য হুবহু রাখা)।"""
+    sep = module._PHONE_SEP
+    return re.compile(
+        r'(?P<phone>(?<!\w)(?:\+?88' + sep + r')?0' + sep + r'1' + sep + r'[3-9](?:' + sep + r'\d){8}(?!\w))'
+        r'|(?P<email>\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b)'
+    )
+
+
+def legacy_scan_contact_info(module, pattern, fields):
+    """পরিবর্তনের আগের scan_contact_info (তুলনার জন্য হুবহু রাখা)।"""
+    matches = []
+    for field, html_content in fields.items():
+        if not html_content:
+            continue
+        for match in pattern.finditer(module.html_to_text(html_content)):
+            if match.lastgroup == 'phone':
+                digits = module._NON_DIGIT_PATTERN.sub('', match.group())
+                matches.append(module.ContactMatch('phone', digits[-11:], field))
+            else:
+                email = match.group()
+                kind = 'gmail' if email.lower().endswith('@gmail.com') else 'email'
+                matches.append(module.ContactMatch(kind, email, field))
+    return matches
+
+
+def run_legacy(module, details_list):
+    pattern = legacy_contact_pattern(module)
+    results = []
+    for details in details_list:
+        contacts = legacy_scan_contact_info(module, pattern, {field: details.get(field, '') for field in module.DETAIL_HTML_FIELDS})
+        html = {}
+        if module.contact_rejection_reason(contacts) is None:
+            html = {field: module.sanitize_job_html(details.get(field)) for field in module.DETAIL_HTML_FIELDS}
+        results.append((contacts, html))
+    return results
+
+
+def best_of(module, func, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        module.sanitize_job_html.cache_clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('jobs', nargs='?', type=int, default=10000)
+    parser.add_argument('--processes', type=int, default=max(2, os.cpu_count() or 1), help='pool পদ্ধতির প্রসেস সংখ্যা')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    module = load_sync_module()
+    details_list = make_details(args.jobs)
+
+    modes = [
+        ('legacy', lambda: run_legacy(module, details_list)),
+        ('inline', lambda: module.normalize_job_details_batch(details_list, processes=0, skip_rejected_html=True)),
+        (f'pool x{args.processes}', lambda: module.normalize_job_details_batch(details_list, processes=args.processes, skip_rejected_html=True)),
+    ]
+    print(f"jobs: {args.jobs}, best of {args.repeat} (cpu count: {os.cpu_count()})")
+    results = {}
+    baseline = None
+    for name, func in modes:
+        elapsed, results[name] = best_of(module, func, args.repeat)
+        baseline = baseline or elapsed
+        print(f"  {name:<10}: {elapsed * 1000:8.1f} ms  ({args.jobs / elapsed:9.0f} jobs/sec, {baseline / elapsed:.2f}x)")
+
+    inline = results['inline']
+    pooled = results[modes[-1][0]]
+    same = sum(1 for a, b in zip(inline, pooled) if a == b)
+    same_html = sum(1 for (_, html), normalized in zip(results['legacy'], inline) if html == normalized.html)
+    same_contacts = sum(1 for (contacts, _), normalized in zip(results['legacy'], inline) if contacts == normalized.contacts)
+    print(f"  inline == pool on {same}/{args.jobs} jobs; vs legacy: same html {same_html}, same contacts {same_contacts}")
+
+
+if __name__ == '__main__':
+    main()
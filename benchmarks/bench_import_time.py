@@ -0,0 +1,111 @@
+"""
+স্ক্রিপ্টের কোল্ড-স্টার্ট (ইমপোর্ট) সময়ের বেঞ্চমার্ক। প্রতিবার নতুন পাইথন প্রসেসে মডিউলটি লোড করে মাপা হয়,
+যাতে আগের রানের ইমপোর্ট ক্যাশ ফলাফলে প্রভাব না ফেলে। আলাদাভাবে দেখায়:
+  - import  : শুধু মডিউল লোড (গুগল ক্লায়েন্ট লাইব্রেরি এই সময়ে লোড হওয়া উচিত নয়)
+  - service : মডিউল লোড + স্ট্যাটিক discovery ডকুমেন্ট থেকে ব্লগার ক্লায়েন্ট তৈরি (নেটওয়ার্ক ছাড়া)
+
+ব্যবহার:
+    python benchmarks/bench_import_time.py                 # প্রতিটি মাপ ১০ বার
+    python benchmarks/bench_import_time.py 20 --top 15     # সবচেয়ে ধীর ১৫টি ইমপোর্টও দেখাবে (-X importtime)
+    python benchmarks/bench_import_time.py --max-ms 400    # import এর মিডিয়ান এর বেশি হলে exit code 1 (CI-র জন্য)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from common import BENCHMARK_DIR
+
+# চাইল্ড প্রসেসে চালানো কোড; ফলাফল JSON হিসেবে stdout-এর শেষ লাইনে আসে
+IMPORT_SNIPPET = '''
+import json, sys, time
+started = time.perf_counter()
+from common import load_sync_module
+module = load_sync_module()
+imported = time.perf_counter()
+google_loaded = any(name.split('.')[0] in ('google', 'googleapiclient', 'google_auth_oauthlib') for name in sys.modules)
+service_s = None
+if {build_service}:
+    from google.oauth2.credentials import Credentials
+    module.build_blogger_client(Credentials('benchmark-token'))
+    service_s = time.perf_counter() - started
+print(json.dumps({{'import_s': imported - started, 'service_s': service_s, 'google_loaded': google_loaded}}))
+'''
+
+
+def run_child(build_service: bool) -> dict:
+    snippet = IMPORT_SNIPPET.format(build_service=build_service)
+    output = subprocess.run(
+        [sys.executable, '-c', snippet], cwd=BENCHMARK_DIR, check=True,
+        capture_output=True, text=True, encoding='utf-8',
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int):
+    """-X importtime আউটপুট থেকে ক্রমযোজিত (cumulative) সময় অনুযায়ী সবচেয়ে ধীর টপ-লেভেল ইমপোর্টগুলো।"""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'from common import load_sync_module; load_sync_module()'],
+        cwd=BENCHMARK_DIR, check=True, capture_output=True, text=True, encoding='utf-8',
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # নেস্টেড ইমপোর্ট বাদ দিয়ে শুধু সরাসরি ইমপোর্ট হওয়া প্যাকেজ (ইনডেন্ট ছাড়া)
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def summarize(samples):
+    return {
+        'min_ms': min(samples) * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'max_ms': max(samples) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('repeat', nargs='?', type=int, default=10)
+    parser.add_argument('--top', type=int, default=0, help='সবচেয়ে ধীর এতগুলো টপ-লেভেল ইমপোর্ট দেখাবে')
+    parser.add_argument('--max-ms', type=float, default=0.0, help='import মিডিয়ানের সীমা (ms); ছাড়িয়ে গেলে exit code 1')
+    parser.add_argument('--json', dest='json_path', help='ফলাফল এই ফাইলে JSON হিসেবে লেখা হবে')
+    args = parser.parse_args()
+
+    import_runs = [run_child(build_service=False) for _ in range(args.repeat)]
+    service_runs = [run_child(build_service=True) for _ in range(args.repeat)]
+    result = {
+        'repeat': args.repeat,
+        'python': sys.version.split()[0],
+        'import': summarize([run['import_s'] for run in import_runs]),
+        'service': summarize([run['service_s'] for run in service_runs]),
+        'google_loaded_at_import': any(run['google_loaded'] for run in import_runs),
+    }
+
+    print(f"cold start, {args.repeat} fresh processes each (Python {result['python']})")
+    for name in ('import', 'service'):
+        stats = result[name]
+        print(f"  {name:<8} min {stats['min_ms']:7.1f} ms, median {stats['median_ms']:7.1f} ms, max {stats['max_ms']:7.1f} ms")
+    print(f"  google client loaded at import: {'yes' if result['google_loaded_at_import'] else 'no'}")
+
+    if args.top:
+        print(f"\nslowest top-level imports (cumulative):")
+        for elapsed_ms, name in slowest_imports(args.top):
+            print(f"  {elapsed_ms:8.1f} ms  {name}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    if args.max_ms and result['import']['median_ms'] > args.max_ms:
+        print(f"\n❌ import median {result['import']['median_ms']:.1f} ms exceeds {args.max_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
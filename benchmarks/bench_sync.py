@@ -0,0 +1,186 @@
+"""
+run_synchronization-এর অফলাইন বেঞ্চমার্ক। রেকর্ড করা bdjobs ফিক্সচার লোকাল সার্ভার থেকে রিপ্লে করা হয় এবং
+ব্লগার API-র জায়গায় ইন-মেমরি FakeBloggerService ব্যবহার হয়, তাই কোনো ক্রেডেনশিয়াল বা ইন্টারনেট লাগে না।
+প্রতিটি আকারের (চাকরির সংখ্যা) জন্য মোট সময়, রিকোয়েস্ট সংখ্যা ও ধাপভিত্তিক লেটেন্সি দেখায়।
+
+ব্যবহার:
+    python benchmarks/bench_sync.py                      # 100, 1000, 10000 জব
+    python benchmarks/bench_sync.py 500 --json out.json  # নির্দিষ্ট আকার, ফলাফল JSON-এ
+    python benchmarks/bench_sync.py 1000 --engine async  # asyncio/aiohttp ইঞ্জিন
+    python benchmarks/bench_sync.py 1000 --companies mixed  # কোম্পানি ও যোগাযোগ তথ্য সম্পর্কহীন (common.make_list_item দেখুন)
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from common import FakeBloggerService, FixtureServer, JOB_ID_BASE, load_sync_module, make_list_item
+
+# সময় মাপা হবে এমন ধাপ (মডিউলের ফাংশন, না থাকলে রানের মেট্রিক্সের ধাপের নাম); তালিকা সংগ্রহ স্ট্রিমিং পাইপলাইনে
+# perform_addition-এর ভেতরে চলে, তাই fetch_job_list_page সব পেজ ফেচের মোট সময় (একসাথে চলা ফেচ যোগ করে)
+STAGES = ['fetch_blogger_posts', 'perform_deletion', 'fetch_job_list_page', 'perform_addition']
+# প্রতিটি কলের লেটেন্সি আলাদাভাবে মাপা হবে এমন ফাংশন (বিস্তারিত API কল, যাচাই ও ব্যাচ রেন্ডারিং)
+PER_CALL = ['fetch_job_detail_payload', 'screen_job_details', 'build_post_bodies']
+
+
+def seed_blog(module, service: FakeBloggerService, job_count: int):
+    """
+    ব্লগে আগে থেকে থাকা পোস্ট তৈরি করে: ১০% চলমান চাকরি (ডুপ্লিকেট এড়ানো যাচাই), যার মধ্যে ২% এর ডেডলাইন
+    তালিকায় একদিন বাড়ানো হয়েছে (patch যাচাই), এবং ৫% মেয়াদ উত্তীর্ণ।
+    """
+    today = date.today()
+    for i in range(0, job_count, 10):
+        # তালিকা থেকে সিঙ্ক যে তারিখ বের করবে, লেবেলেও ঠিক সেটিই রাখা হয়
+        deadline = module.parse_api_deadline(make_list_item(i, today)['deadlineDB'])
+        if i % 50 == 0:
+            deadline -= timedelta(days=1)
+        end_date = module.format_label_date(deadline)
+        service.add_post({'title': f'Existing #{i}', 'labels': [
+            'জব সার্কুলার', 'প্রাইভেট চাকরি', f'BdJobID:{JOB_ID_BASE + i}', f'BdEndDate:{end_date}']})
+    for i in range(max(1, job_count // 20)):
+        end_date = (today - timedelta(days=2 + i % 10)).strftime('%d-%m-%Y')
+        service.add_post({'title': f'Expired #{i}', 'labels': [
+            'জব সার্কুলার', 'প্রাইভেট চাকরি', f'BdJobID:{JOB_ID_BASE - 1 - i}', f'BdEndDate:{end_date}']})
+    service.reset_counters()
+
+
+@contextlib.contextmanager
+def instrumented(module, timings, call_latencies):
+    originals = {}
+
+    def wrap(name, record):
+        original = getattr(module, name)
+        originals[name] = original
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - started)
+        setattr(module, name, wrapper)
+
+    for name in STAGES:
+        if hasattr(module, name):
+            wrap(name, lambda n, d: timings.__setitem__(n, timings.get(n, 0.0) + d))
+    for name in PER_CALL:
+        if hasattr(module, name):
+            wrap(name, lambda n, d: call_latencies.setdefault(n, []).append(d))
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(module, name, original)
+
+
+def configure(module, server: FixtureServer, work_dir: str, service: FakeBloggerService, rate_per_host: float):
+    module.API_BDS_LIST = server.list_url
+    module.API_BDS_DETAILS = server.details_url
+    module.APPLY_URL_BASE = 'https://jobs.example.invalid/details/{job_id}'
+    module.BLOG_ID = 'bench-blog'
+    module.MAX_PAGES_TO_FETCH = 0
+    module.DETAIL_FETCH_RATE_PER_HOST = rate_per_host
+    module.DETAIL_CACHE_PATH = os.path.join(work_dir, 'job_details.sqlite3')
+    module.BLOGGER_SNAPSHOT_PATH = os.path.join(work_dir, 'blogger_{blog_id}.json')
+    module.SYNC_JOURNAL_PATH = os.path.join(work_dir, 'sync_journal.jsonl')
+    module.SYNC_METRICS_PATH = os.path.join(work_dir, 'sync_metrics.json')
+    module.get_blogger_service = lambda *args, **kwargs: service
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_once(module, job_count: int, page_size: int, blogger_latency: float, rate_per_host: float, engine: str = 'sync', companies: str = 'default'):
+    service = FakeBloggerService(latency=blogger_latency)
+    seed_blog(module, service, job_count)
+    timings, call_latencies = {}, {}
+
+    with FixtureServer(job_count, page_size, companies) as server, tempfile.TemporaryDirectory() as work_dir:
+        configure(module, server, work_dir, service, rate_per_host)
+        with instrumented(module, timings, call_latencies), contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            module.run_synchronization(engine=engine)
+            wall_time = time.perf_counter() - started
+
+        counters = module.metrics.counters
+        # async ইঞ্জিনের ধাপ ও ফাংশনের নামে নয় এমন ধাপ মোড়ানো দিয়ে ধরা যায় না; সেগুলো রানের মেট্রিক্স থেকে নেওয়া হয়
+        for name in STAGES:
+            if name not in timings and name in module.metrics.stages:
+                timings[name] = module.metrics.stages[name]['total_s']
+        return {
+            'jobs': job_count,
+            'engine': engine,
+            'wall_time_s': round(wall_time, 3),
+            'first_listing_page_s': round(counters.get('first_listing_page_s', 0.0), 3),
+            'first_post_published_s': round(counters.get('first_post_published_s', 0.0), 3),
+            'http_requests': dict(server.counts),
+            'http_bytes': server.bytes_sent,
+            'blogger_calls': dict(service.counts),
+            'blogger_round_trips': service.round_trips,
+            'blogger_posts_after': len(service.posts_by_id),
+            'post_content_bytes': int(counters.get('post_content_bytes', 0)),
+            'sleep_s': round(counters.get('sleep_seconds', 0.0), 3),
+            'jobs_postponed': int(counters.get('jobs_postponed', 0)),
+            'stages_s': {name: round(timings[name], 3) for name in STAGES if name in timings},
+            'per_call_ms': {
+                name: {
+                    'count': len(values),
+                    'mean': round(statistics.mean(values) * 1000, 3),
+                    'p95': round(percentile(values, 0.95) * 1000, 3),
+                }
+                for name, values in call_latencies.items()
+            },
+        }
+
+
+def print_report(result):
+    print(f"\n=== {result['jobs']} jobs ({result['engine']}): {result['wall_time_s']:.2f} s ===")
+    print(f"  first page at {result['first_listing_page_s']:.2f} s, first post live at {result['first_post_published_s']:.2f} s")
+    print(f"  bdjobs requests: {result['http_requests']}  ({result['http_bytes'] / 1024:.0f} KiB)")
+    print(f"  blogger calls  : {result['blogger_calls']}  (round trips: {result['blogger_round_trips']})")
+    print(f"  post content   : {result['post_content_bytes'] / 1024:.0f} KiB uploaded")
+    print(f"  rate-limit wait: {result['sleep_s']:.2f} s (summed over workers)")
+    print(f"  pre-screening  : {result['jobs_postponed']} jobs postponed before any detail call")
+    for name, seconds in result['stages_s'].items():
+        print(f"  {name:<28} {seconds:8.3f} s")
+    for name, stats in result['per_call_ms'].items():
+        print(f"  {name:<28} {stats['count']:6d} calls, mean {stats['mean']:.2f} ms, p95 {stats['p95']:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('sizes', nargs='*', type=int, default=[100, 1000, 10000])
+    parser.add_argument('--page-size', type=int, default=50, help='তালিকার প্রতি পেজে চাকরির সংখ্যা')
+    parser.add_argument('--blogger-latency-ms', type=float, default=20.0, help='প্রতি ব্লগার HTTP রাউন্ড-ট্রিপের কৃত্রিম লেটেন্সি')
+    parser.add_argument('--rate-per-host', type=float, default=0.0, help='DETAIL_FETCH_RATE_PER_HOST (0 = সীমাহীন)')
+    parser.add_argument('--engine', choices=['sync', 'async'], default='sync', help='run_synchronization-এর এক্সিকিউশন ইঞ্জিন')
+    parser.add_argument('--companies', choices=['default', 'mixed', 'consistent'], default='default',
+                        help='কোম্পানির নাম ও যোগাযোগ তথ্যের সম্পর্ক (common.make_list_item দেখুন)')
+    parser.add_argument('--json', dest='json_path', help='ফলাফল এই ফাইলে JSON হিসেবে লেখা হবে')
+    args = parser.parse_args()
+
+    module = load_sync_module()
+    results = []
+    for job_count in args.sizes:
+        result = run_once(module, job_count, args.page_size, args.blogger_latency_ms / 1000, args.rate_per_host, args.engine, args.companies)
+        print_report(result)
+        results.append(result)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+"""বেঞ্চমার্ক স্ক্রিপ্টগুলোর জন্য সাধারণ সহায়ক ফাংশন ও ফিক্সচার লোডার।"""
+import copy
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+FIXTURE_DIR = os.path.join(BENCHMARK_DIR, 'fixtures')
+SCRIPT_PATH = os.path.join(REPO_ROOT, 'pri-job-test.py')
+MODULE_NAME = 'pri_job_test'
+JOB_ID_BASE = 1300000
+
+# ApplyInstruction-এ যোগ করা যোগাযোগের ধরন; বাস্তব তালিকার মতো বেশিরভাগ পোস্টেই বৈধ যোগাযোগ থাকে না
+CONTACT_VARIANTS = [
+    '',
+    '<p>Send your CV to <a href="mailto:career{i}@abctrading.com.bd">career{i}@abctrading.com.bd</a></p>',
+    '<p>For details call: <strong>01{op}-{i:08d}</strong></p>',
+    '',
+    '<p>সিভি পাঠান: <b>hr.abc{i}@gmail.com</b></p>',
+    '<p>Apply through the online system only.</p>',
+]
+
+
+def load_sync_module():
+    """হাইফেনযুক্ত নামের মূল স্ক্রিপ্টটি `pri_job_test` মডিউল হিসেবে লোড করে।"""
+    if MODULE_NAME in sys.modules:
+        return sys.modules[MODULE_NAME]
+    spec = importlib.util.spec_from_file_location(MODULE_NAME, SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[MODULE_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_fixture(name: str) -> Dict[str, Any]:
+    with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_DETAIL_TEMPLATE = None
+
+
+def make_job_detail(i: int) -> Dict[str, Any]:
+    """রেকর্ড করা বিস্তারিত রেসপন্সের উপর ভিত্তি করে i-তম চাকরির বিস্তারিত রেকর্ড তৈরি করে।"""
+    global _DETAIL_TEMPLATE
+    if _DETAIL_TEMPLATE is None:
+        _DETAIL_TEMPLATE = load_fixture('job_detail.json')['data'][0]
+    detail = copy.copy(_DETAIL_TEMPLATE)
+    contact = CONTACT_VARIANTS[i % len(CONTACT_VARIANTS)].format(i=i, op=3 + i % 7)
+    detail['ApplyInstruction'] = detail['ApplyInstruction'] + contact
+    detail['JobTitle'] = f"{detail['JobTitle']} #{i}"
+    return detail
+
+
+_LIST_TEMPLATES = None
+
+
+def make_list_item(i: int, today: date, companies: str = 'default') -> Dict[str, Any]:
+    """
+    রেকর্ড করা তালিকা পেজের আইটেম থেকে i-তম চাকরির তালিকা আইটেম তৈরি করে (ডেডলাইন আজকের পরে)।
+    companies ঠিক করে কোম্পানির নাম ও যোগাযোগ তথ্যের (make_job_detail-এর CONTACT_VARIANTS) সম্পর্ক:
+      - default    : পুরনো নামকরণ (টেমপ্লেট + i % 97)। নামের চক্র 194, যা 6 দিয়ে ভাগ করলে 2 থাকে, তাই অর্ধেক
+                     কোম্পানি কখনো যোগাযোগ তথ্যসহ চাকরি পায় না — এটি আংশিক সম্পর্কযুক্ত, নিরপেক্ষ নয়
+      - mixed      : প্রতিটি কোম্পানি সব ধরনের যোগাযোগ তথ্য সমান হারে পায় (কোম্পানি থেকে কোনো পূর্বাভাস নেই)
+      - consistent : প্রতিটি কোম্পানির সব চাকরিতে একই ধরনের যোগাযোগ তথ্য (কোম্পানি নিখুঁত পূর্বাভাস দেয়)
+    """
+    global _LIST_TEMPLATES
+    if _LIST_TEMPLATES is None:
+        _LIST_TEMPLATES = load_fixture('job_list_page.json')['data']
+    item = copy.copy(_LIST_TEMPLATES[i % len(_LIST_TEMPLATES)])
+    deadline = today + timedelta(days=1 + i % 30)
+    item['Jobid'] = JOB_ID_BASE + i
+    item['jobTitle'] = f"{item['jobTitle']} #{i}"
+    if companies == 'consistent':
+        variant = i % len(CONTACT_VARIANTS)
+        item['companyName'] = f"{item['companyName']} {variant}-{i // len(CONTACT_VARIANTS) % 16}"
+    elif companies == 'mixed':
+        # পরপর len(CONTACT_VARIANTS)টি চাকরি একই কোম্পানির, তাই প্রতিটি কোম্পানি সব ধরন একবার করে পায়
+        item['companyName'] = f"{_LIST_TEMPLATES[0]['companyName']} {i // len(CONTACT_VARIANTS) % 97}"
+    else:
+        item['companyName'] = f"{item['companyName']} {i % 97}"
+    if '/' in item['deadlineDB']:
+        item['deadlineDB'] = deadline.strftime('%m/%d/%Y') + ' 18:00:00'
+    else:
+        item['deadlineDB'] = deadline.strftime('%Y-%m-%d') + 'T18:00:00Z'
+    return item
+
+
+class FixtureServer:
+    """
+    API_BDS_LIST ও API_BDS_DETAILS-এর লোকাল বিকল্প সার্ভার। ফিক্সচার থেকে job_count টি চাকরি
+    page_size করে পেজে ভাগ করে দেয় এবং রিকোয়েস্ট সংখ্যা ও পাঠানো বাইট গণনা করে।
+    """
+
+    def __init__(self, job_count: int, page_size: int = 50, companies: str = 'default'):
+        self.job_count = job_count
+        self.page_size = page_size
+        self.companies = companies
+        self.today = date.today()
+        self.counts = {'list': 0, 'details': 0}
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self._httpd.server_port}'
+
+    @property
+    def list_url(self) -> str:
+        return self.base_url + '/list?pg={page_num}'
+
+    @property
+    def details_url(self) -> str:
+        return self.base_url + '/details?jobId={job_id}'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset_counters(self):
+        with self._lock:
+            self.counts = {'list': 0, 'details': 0}
+            self.bytes_sent = 0
+
+    def _list_page(self, page_num: int) -> Optional[Dict[str, Any]]:
+        start = (page_num - 1) * self.page_size
+        if page_num < 1 or start >= self.job_count:
+            return None
+        end = min(self.job_count, start + self.page_size)
+        return {'statuscode': '0', 'message': 'Success', 'data': [make_list_item(i, self.today, self.companies) for i in range(start, end)]}
+
+    def _details(self, job_id: int) -> Optional[Dict[str, Any]]:
+        i = job_id - JOB_ID_BASE
+        if i < 0 or i >= self.job_count:
+            return None
+        return {'statuscode': '0', 'message': 'Success', 'data': [make_job_detail(i)]}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                payload = None
+                if url.path == '/list':
+                    kind = 'list'
+                    payload = server._list_page(int(query.get('pg', ['0'])[0]))
+                elif url.path == '/details':
+                    kind = 'details'
+                    payload = server._details(int(query.get('jobId', ['0'])[0]))
+                else:
+                    kind = None
+
+                if payload is None:
+                    # বাস্তব API-র মতো শেষ পেজের পরে খালি তালিকা
+                    body = json.dumps({'statuscode': '1', 'message': 'No data', 'data': []}).encode('utf-8')
+                else:
+                    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+                self.send_response(200 if kind else 404)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    if kind:
+                        server.counts[kind] += 1
+                    server.bytes_sent += len(body)
+
+        return Handler
+
+
+class _FakeRequest:
+    def __init__(self, service: 'FakeBloggerService', method: str, func):
+        self._service = service
+        self._method = method
+        self._func = func
+
+    def execute(self, num_retries: int = 0):
+        self._service.round_trip()
+        return self._run()
+
+    def _run(self):
+        self._service.count(self._method)
+        return self._func()
+
+
+class _FakeBatch:
+    def __init__(self, service: 'FakeBloggerService', callback):
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self._requests.append((request_id or str(len(self._requests)), request, callback or self._callback))
+
+    def execute(self, http=None):
+        self._service.count('batch')
+        self._service.round_trip()
+        for request_id, request, callback in self._requests:
+            try:
+                response, error = request._run(), None
+            except Exception as e:
+                response, error = None, e
+            if callback:
+                callback(request_id, response, error)
+
+
+class _FakePosts:
+    def __init__(self, service: 'FakeBloggerService'):
+        self._service = service
+
+    def list(self, blogId, labels=None, maxResults=500, pageToken=None, **kwargs):
+        def run():
+            items = [post for post in self._service.posts_by_id.values()
+                     if not labels or labels in post.get('labels', [])]
+            start = int(pageToken or 0)
+            end = start + int(maxResults)
+            page = [{'id': p['id'], 'title': p['title'], 'labels': list(p.get('labels', []))} for p in items[start:end]]
+            response = {'items': page}
+            if end < len(items):
+                response['nextPageToken'] = str(end)
+            return response
+        return _FakeRequest(self._service, 'list', run)
+
+    def insert(self, blogId, body, **kwargs):
+        def run():
+            return self._service.add_post(body)
+        return _FakeRequest(self._service, 'insert', run)
+
+    def delete(self, blogId, postId, **kwargs):
+        def run():
+            if self._service.posts_by_id.pop(postId, None) is None:
+                raise _http_error(404)
+            return ''
+        return _FakeRequest(self._service, 'delete', run)
+
+    def patch(self, blogId, postId, body, **kwargs):
+        def run():
+            post = self._service.posts_by_id.get(postId)
+            if post is None:
+                raise _http_error(404)
+            post.update(body)
+            return dict(post)
+        return _FakeRequest(self._service, 'patch', run)
+
+
+def _http_error(status: int):
+    from googleapiclient.errors import HttpError
+    import httplib2
+    return HttpError(httplib2.Response({'status': status}), b'{}')
+
+
+class FakeBloggerService:
+    """
+    googleapiclient ব্লগার সার্ভিসের ইন-মেমরি বিকল্প: posts().list/insert/delete/patch এবং
+    new_batch_http_request সমর্থন করে, প্রতিটি কল গণনা করে এবং প্রতি HTTP রাউন্ড-ট্রিপে
+    নির্দিষ্ট লেটেন্সি যোগ করে।
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.posts_by_id: Dict[str, Dict[str, Any]] = {}
+        self.counts: Dict[str, int] = {}
+        self.round_trips = 0
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def posts(self):
+        return _FakePosts(self)
+
+    def new_batch_http_request(self, callback=None):
+        return _FakeBatch(self, callback)
+
+    def count(self, method: str):
+        with self._lock:
+            self.counts[method] = self.counts.get(method, 0) + 1
+
+    def round_trip(self):
+        with self._lock:
+            self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def add_post(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            post_id = str(7000000000000000000 + self._next_id)
+            self._next_id += 1
+        post = dict(body, id=post_id)
+        self.posts_by_id[post_id] = post
+        return dict(post)
+
+    def reset_counters(self):
+        with self._lock:
+            self.counts = {}
+            self.round_trips = 0
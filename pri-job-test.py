@@ -1,28 +1,27 @@
 import os
 import requests
 import re
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from string import Template
 import time
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta, date
-from html.parser import HTMLParser
+import threading
+import asyncio
+import random
+import argparse
+from collections import deque
+import functools
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional, Any, Tuple, NamedTuple, Pattern
+from datetime import datetime, timedelta, date, timezone
+from html import unescape as html_unescape
 import json
-
-# =========================================================
-# ফোল্ডার এবং ফাইল পাথ সেটআপ
-# =========================================================
-
-def get_blogger_service() -> Optional[Any]:
-    creds = None
-    token_json = os.environ.get('BLOGGER_TOKEN_JSON') 
-    client_secret_json = os.environ.get('CLIENT_SECRET_JSON')
-
-    if token_json:
-        info = json.loads(token_json)
-        creds = Credentials.from_authorized_user_info(info, SCOPES)
+import sqlite3
+import heapq
+import hashlib
 
 # =========================================================
 # কনফিগারেশন সেটিংস এবং API Endpoints
@@ -32,12 +31,90 @@ API_BDS_DETAILS = os.environ.get('API_BDS_DETAILS')
 APPLY_URL_BASE = os.environ.get('APPLY_URL_BASE')
 BLOG_ID = os.environ.get('BLOG_ID')
 
+# একাধিক ব্লগ/ক্যাটাগরিতে একসাথে সিঙ্ক করার টার্গেট তালিকা (JSON); খালি থাকলে শুধু BLOG_ID-তে সিঙ্ক হয়
+SYNC_TARGETS = os.environ.get('SYNC_TARGETS', '')
+# প্রতিটি পোস্টে যুক্ত ক্যাটাগরি লেবেল এবং ব্লগার থেকে স্ক্রিপ্টের পোস্টগুলো খুঁজে পাওয়ার লেবেল (ডিফল্ট টার্গেট)
+DEFAULT_POST_LABELS = ('জব সার্কুলার', 'প্রাইভেট চাকরি')
+DEFAULT_LIST_LABEL = 'প্রাইভেট চাকরি'
+
 SCOPES = ['https://www.googleapis.com/auth/blogger']
-DELAY_AFTER_OPERATION = 10 
+# ব্লগার API-র discovery ডকুমেন্টের লোকাল কপি (JSON ফাইল); না দিলে googleapiclient-এর সাথে আসা স্ট্যাটিক কপি ব্যবহার হয়
+BLOGGER_DISCOVERY_DOC = os.environ.get('BLOGGER_DISCOVERY_DOC', '')
+
+# ব্লগার ডিলিট/ইনসার্ট একসাথে কতগুলো করে ব্যাচে যাবে, এবং রেট লিমিট পেলে অপেক্ষার প্রাথমিক ও সর্বোচ্চ সময় (সেকেন্ড;
+# সর্বোচ্চ সময় Retry-After-এর ক্ষেত্রেও প্রযোজ্য)
+BLOGGER_BATCH_SIZE = int(os.environ.get('BLOGGER_BATCH_SIZE', '20'))
+BLOGGER_BACKOFF_INITIAL = float(os.environ.get('BLOGGER_BACKOFF_INITIAL', '2'))
+BLOGGER_BACKOFF_MAX = float(os.environ.get('BLOGGER_BACKOFF_MAX', '64'))
+BLOGGER_MAX_RETRIES = int(os.environ.get('BLOGGER_MAX_RETRIES', '5'))
+
+# বিস্তারিত API কল একসাথে কতগুলো থ্রেডে চলবে এবং শুরুতে প্রতি সেকেন্ডে কতগুলো রিকোয়েস্ট যাবে (0 = সীমাহীন)
+DETAIL_FETCH_WORKERS = int(os.environ.get('DETAIL_FETCH_WORKERS', '8'))
+DETAIL_FETCH_RATE_PER_HOST = float(os.environ.get('DETAIL_FETCH_RATE_PER_HOST', '5'))
+# তালিকা API (রিকোয়েস্ট/সেকেন্ড) ও ব্লগার মিউটেশনের (পোস্ট/সেকেন্ড) শুরুর রেট; 0 = প্রথম থ্রটলিং পর্যন্ত সীমাহীন
+LIST_FETCH_RATE = float(os.environ.get('LIST_FETCH_RATE', '0'))
+BLOGGER_MUTATION_RATE = float(os.environ.get('BLOGGER_MUTATION_RATE', '0'))
+
+# অ্যাডাপ্টিভ রেট (AIMD): প্রতিটি সুস্থ রেসপন্সে রেট শুরুর রেটের কত অংশ বাড়ে, 429/5xx-এ কত গুণ হয়ে যায়,
+# শুরুর রেটের সর্বোচ্চ কত গুণ পর্যন্ত উঠতে পারে এবং সর্বনিম্ন রেট (রিকোয়েস্ট/সেকেন্ড)
+RATE_LIMIT_INCREASE = float(os.environ.get('RATE_LIMIT_INCREASE', '0.05'))
+RATE_LIMIT_DECREASE = float(os.environ.get('RATE_LIMIT_DECREASE', '0.5'))
+RATE_LIMIT_CEILING_FACTOR = float(os.environ.get('RATE_LIMIT_CEILING_FACTOR', '4'))
+RATE_LIMIT_MIN = float(os.environ.get('RATE_LIMIT_MIN', '0.2'))
+
+# bdjobs HTTP রিট্রাই: সংযোগ ত্রুটি, 429 ও 5xx এ জিটারসহ এক্সপোনেনশিয়াল ব্যাকঅফে আবার চেষ্টা (Retry-After মানা হয়,
+# তবে HTTP_BACKOFF_MAX পর্যন্ত)
+HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', '4'))
+HTTP_BACKOFF_FACTOR = float(os.environ.get('HTTP_BACKOFF_FACTOR', '0.5'))
+HTTP_BACKOFF_MAX = float(os.environ.get('HTTP_BACKOFF_MAX', '30'))
+HTTP_TIMEOUT = float(os.environ.get('HTTP_TIMEOUT', '20'))
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# ETag/Last-Modified সহ সংরক্ষিত তালিকা পেজ কতদিন রাখা হবে
+HTTP_CACHE_MAX_AGE_DAYS = int(os.environ.get('HTTP_CACHE_MAX_AGE_DAYS', '7'))
+# রিট্রাইয়ের পরেও পরপর এতগুলো তালিকা পেজ ব্যর্থ হলে সংগ্রহ থামানো হয়
+LIST_MAX_CONSECUTIVE_FAILURES = int(os.environ.get('LIST_MAX_CONSECUTIVE_FAILURES', '3'))
+
+# তালিকার সর্বোচ্চ কতগুলো পেজ সংগ্রহ করা হবে (0 দিলে প্রথম খালি পেজ পর্যন্ত সব) এবং একসাথে কতগুলো পেজ ফেচ হবে
+MAX_PAGES_TO_FETCH = int(os.environ.get('MAX_PAGES_TO_FETCH', '100'))
+PAGE_FETCH_CONCURRENCY = int(os.environ.get('PAGE_FETCH_CONCURRENCY', '4'))
+
+# স্ট্রিমিং পাইপলাইন: একসাথে কতগুলো পোস্টের বিস্তারিত ফেচ চলমান থাকতে পারে (০ = DETAIL_FETCH_WORKERS-এর দ্বিগুণ)
+# এবং প্রথম পোস্ট বাফারে আসার কত সেকেন্ড পর অসম্পূর্ণ ব্যাচও প্রকাশ করে দেওয়া হবে
+DETAIL_FETCH_WINDOW = int(os.environ.get('DETAIL_FETCH_WINDOW', '0'))
+PUBLISH_FLUSH_SECONDS = float(os.environ.get('PUBLISH_FLUSH_SECONDS', '5'))
+
+# বিস্তারিত HTML নর্মালাইজেশন (টেক্সট বের করা, যোগাযোগ স্ক্যান ও sanitize) কতগুলো প্রসেসে চলবে;
+# ০ বা ১ হলে প্রসেস পুল ছাড়াই বিস্তারিত ফেচের থ্রেডে চলে
+HTML_NORMALIZE_PROCESSES = int(os.environ.get('HTML_NORMALIZE_PROCESSES', '0'))
+
+# বিস্তারিত ডেটা ও যাচাই ফলাফলের লোকাল ক্যাশ (খালি রাখলে ক্যাশ বন্ধ)
+DETAIL_CACHE_PATH = os.environ.get('DETAIL_CACHE_PATH', 'cache/job_details.sqlite3')
+
+# বিস্তারিত আনার আগে প্রাক-যাচাই (তালিকার কোম্পানি ও তার আগের যাচাই ফলাফল): কতগুলো চাকরির ভাগে সম্ভাব্য গৃহীতগুলো
+# আগে আনা হবে (০ বা ১ = তালিকার ক্রম), কোম্পানির স্কোর এর নিচে হলে চাকরিটি স্থগিত হবে (০ = কখনো নয়), এবং
+# স্থগিত চাকরির বিস্তারিত কতদিন পর আবার আনা হবে
+PRESCREEN_WINDOW = int(os.environ.get('PRESCREEN_WINDOW', '100'))
+PRESCREEN_SKIP_BELOW = float(os.environ.get('PRESCREEN_SKIP_BELOW', '0.15'))
+PRESCREEN_RECHECK_DAYS = int(os.environ.get('PRESCREEN_RECHECK_DAYS', '3'))
+# প্রতি রানে সর্বোচ্চ কতগুলো বিস্তারিত API কল হবে (০ = সীমাহীন); বাকি চাকরিগুলো পরের রানে আনা হয়
+DETAIL_CALL_BUDGET = int(os.environ.get('DETAIL_CALL_BUDGET', '0'))
+
+# অসমাপ্ত রান থেকে পুনরায় শুরুর চেকপয়েন্ট জার্নাল (খালি রাখলে বন্ধ), এবং কত ঘণ্টার পুরনো জার্নালের
+# তালিকা পেজ ও যাচাই ফলাফল আর ব্যবহার হবে না (সম্পন্ন মিউটেশনের রেকর্ড সবসময় ব্যবহার হয়)
+SYNC_JOURNAL_PATH = os.environ.get('SYNC_JOURNAL_PATH', 'cache/sync_journal.jsonl')
+SYNC_JOURNAL_MAX_AGE_HOURS = float(os.environ.get('SYNC_JOURNAL_MAX_AGE_HOURS', '24'))
+
+# ব্লগার ইনভেন্টরি: প্রতি রিকোয়েস্টে সর্বোচ্চ পোস্ট, লোকাল স্ন্যাপশট (খালি রাখলে প্রতিবার সম্পূর্ণ তালিকা আনা হবে)
+# এবং কত ঘণ্টা পরপর স্ন্যাপশট বাদ দিয়ে সম্পূর্ণ তালিকা আবার আনা হবে। স্ন্যাপশটের পরের ডেল্টায় শুধু নতুন প্রকাশিত
+# পোস্ট আসে; স্ক্রিপ্টের বাইরে মুছে ফেলা বা বদলানো পুরনো পোস্ট কেবল সম্পূর্ণ তালিকাতেই ধরা পড়ে
+BLOGGER_LIST_PAGE_SIZE = int(os.environ.get('BLOGGER_LIST_PAGE_SIZE', '500'))
+BLOGGER_SNAPSHOT_PATH = os.environ.get('BLOGGER_SNAPSHOT_PATH', 'cache/blogger_{blog_id}.json')
+BLOGGER_FULL_REFRESH_HOURS = float(os.environ.get('BLOGGER_FULL_REFRESH_HOURS', '24'))
 
 JOB_ID_LABEL_PREFIX = "BdJobID:"
 END_DATE_LABEL_PREFIX = "BdEndDate:"
-API_DATE_FORMATS = ['%Y-%m-%dT%H:%M:%SZ', '%m/%d/%Y %H:%M:%S']
+# তালিকার তথ্যের (শিরোনাম, কোম্পানি, ডেডলাইন) হ্যাশ; বদলালে পোস্টটি নতুন করে না দিয়ে patch করা হয়
+CONTENT_HASH_LABEL_PREFIX = "BdHash:"
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
@@ -46,33 +123,661 @@ HEADERS = {
     'Referer': 'https://www.bdjobs.com/',
 }
 
+# রানের পরিমাপ (সময়, রিকোয়েস্ট, অপেক্ষা ইত্যাদি) JSON আকারে যেখানে লেখা হবে (খালি রাখলে লেখা হবে না)
+SYNC_METRICS_PATH = os.environ.get('SYNC_METRICS_PATH', 'sync_metrics.json')
+
+# ডিফল্ট এক্সিকিউশন ইঞ্জিন: 'sync' (requests + থ্রেড পুল) অথবা 'async' (asyncio + aiohttp, ঐচ্ছিক নির্ভরতা)
+SYNC_ENGINE = os.environ.get('SYNC_ENGINE', 'sync')
+
+# =========================================================
+# সিঙ্ক টার্গেট (একাধিক ব্লগ/ক্যাটাগরি)
+# =========================================================
+
+class SyncTarget(NamedTuple):
+    """
+    একটি ব্লগ টার্গেট: কোন ব্লগে, কোন লেবেলসহ এবং তালিকার কোন চাকরিগুলো প্রকাশ হবে। listing_filter একটি
+    কম্পাইল করা রেগুলার এক্সপ্রেশন, যা পোস্টের শিরোনামে ("পদ - কোম্পানি") খোঁজা হয় (বড়/ছোট হাতের অক্ষর নির্বিশেষে)।
+    """
+    name: str
+    blog_id: str
+    labels: Tuple[str, ...] = DEFAULT_POST_LABELS
+    list_label: str = DEFAULT_LIST_LABEL
+    listing_filter: Optional[Pattern[str]] = None
+
+    def accepts(self, data: Dict[str, Any]) -> bool:
+        return self.listing_filter is None or self.listing_filter.search(data['title']) is not None
+
+def load_sync_targets(path: Optional[str] = None) -> List[SyncTarget]:
+    """
+    --targets ফাইল, অথবা SYNC_TARGETS এনভায়রনমেন্ট ভ্যারিয়েবলের JSON থেকে টার্গেট তালিকা পড়ে। কিছুই না থাকলে
+    BLOG_ID দিয়ে একটি ডিফল্ট টার্গেট। প্রতিটি এন্ট্রি: {"name", "blog_id", "labels", "list_label", "listing_filter"}।
+    """
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    elif SYNC_TARGETS.strip():
+        entries = json.loads(SYNC_TARGETS)
+    else:
+        return [SyncTarget('default', BLOG_ID)]
+
+    targets = []
+    for index, entry in enumerate(entries):
+        name = entry.get('name') or f"target-{index + 1}"
+        labels = entry.get('labels')
+        listing_filter = entry.get('listing_filter') or None
+        # ভুল রেগুলার এক্সপ্রেশন এখানেই ধরা পড়ে, ব্লগারে কোনো পরিবর্তন পাঠানোর আগে
+        if listing_filter:
+            try:
+                listing_filter = re.compile(listing_filter, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"টার্গেট '{name}'-এর listing_filter সঠিক রেগুলার এক্সপ্রেশন নয়: {e}") from e
+        targets.append(SyncTarget(
+            name=name,
+            blog_id=entry.get('blog_id') or BLOG_ID,
+            labels=tuple(labels) if labels else DEFAULT_POST_LABELS,
+            list_label=entry.get('list_label') or DEFAULT_LIST_LABEL,
+            listing_filter=listing_filter,
+        ))
+    if not targets:
+        raise ValueError("টার্গেট তালিকা খালি")
+    # প্রতিটি ব্লগের স্ন্যাপশট আলাদা ফাইলে থাকে, তাই একই ব্লগ দুটি টার্গেটে থাকতে পারে না
+    for key in ('name', 'blog_id'):
+        values = [getattr(target, key) for target in targets]
+        if len(set(values)) != len(values):
+            raise ValueError(f"টার্গেটের {key} অবশ্যই আলাদা হতে হবে: {values}")
+    return targets
+
+
+# =========================================================
+# পরিমাপ (Metrics / Instrumentation)
+# =========================================================
+
+class SyncMetrics:
+    """
+    একটি রানের ধাপভিত্তিক সময়, HTTP কল ও বাইট, রিট্রাই, অপেক্ষার সময় এবং গ্রহণ/বাতিল সংখ্যা সংগ্রহ করে (থ্রেড-সেফ)।
+    ধাপের 'total_s' একই ধাপের সমস্ত কলের যোগফল, তাই সমান্তরাল ধাপে এটি রানের মোট সময়ের চেয়ে বেশি হতে পারে।
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, float] = {}
+        self.http: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                entry = self.stages.setdefault(name, {'calls': 0, 'total_s': 0.0, 'max_s': 0.0})
+                entry['calls'] += 1
+                entry['total_s'] += elapsed
+                entry['max_s'] = max(entry['max_s'], elapsed)
+
+    def increment(self, name: str, amount: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_http(self, response: requests.Response, *args, **kwargs):
+        """requests Session-এর response hook: হোস্টভিত্তিক কল, বাইট ও স্ট্যাটাস কোড গণনা করে।"""
+        self.record_request(urlsplit(response.url).netloc, response.status_code, len(response.content or b''))
+
+    def record_request(self, host: str, status_code: int, size: int):
+        with self._lock:
+            entry = self.http.setdefault(host, {'requests': 0, 'bytes': 0, 'status': {}})
+            entry['requests'] += 1
+            entry['bytes'] += size
+            status = str(status_code)
+            entry['status'][status] = entry['status'].get(status, 0) + 1
+
+    def mark_once(self, name: str):
+        """রান শুরুর কত সেকেন্ড পর কোনো ঘটনা প্রথমবার ঘটল তা কাউন্টারে রাখে (যেমন প্রথম পোস্ট প্রকাশ)।"""
+        with self._lock:
+            self.counters.setdefault(name, time.perf_counter() - self._started)
+
+    def record_sleep(self, seconds: float, endpoint: Optional[str] = None):
+        """অপেক্ষার সময় মোট হিসাবে এবং endpoint দিলে সেই এন্ডপয়েন্টের আলাদা হিসাবেও যোগ করে।"""
+        self.increment('sleep_seconds', seconds)
+        if endpoint:
+            self.increment(f'sleep_seconds_{endpoint}', seconds)
+
+    def sleep(self, seconds: float, endpoint: Optional[str] = None):
+        """time.sleep-এর বিকল্প, যা অপেক্ষার মোট সময়ও হিসাব রাখে।"""
+        if seconds <= 0:
+            return
+        self.record_sleep(seconds, endpoint)
+        time.sleep(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'finished_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'wall_time_s': round(time.perf_counter() - self._started, 3),
+                'stages': {
+                    name: {'calls': int(entry['calls']), 'total_s': round(entry['total_s'], 3), 'max_s': round(entry['max_s'], 3)}
+                    for name, entry in self.stages.items()
+                },
+                'counters': {name: (round(value, 3) if isinstance(value, float) else value) for name, value in self.counters.items()},
+                'http': self.http,
+            }
+
+    def write(self, path: str):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+metrics = SyncMetrics()
+
+def timed_stage(name: str):
+    """ফাংশনের প্রতিটি কলকে metrics-এ নির্দিষ্ট ধাপ হিসেবে মাপার ডেকোরেটর।"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with metrics.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 # =========================================================
 # সহায়ক ফাংশন (Helper Functions)
 # =========================================================
 
-class HTMLStripper(HTMLParser):
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After হেডার (সেকেন্ড অথবা HTTP-date) থেকে অপেক্ষার সময় বের করে।"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+class AdaptiveRateLimiter:
+    """
+    একটি এন্ডপয়েন্টের টোকেন বাকেট (সর্বোচ্চ এক সেকেন্ডের টোকেন জমে), যার রেট সার্ভারের আচরণ অনুযায়ী বদলায়
+    (AIMD): প্রতিটি সুস্থ রেসপন্সে রেট একটু করে বাড়ে, আর 429/5xx পেলে গুণফলে কমে এবং Retry-After (না থাকলে
+    ক্রমবর্ধমান ব্যাকঅফ) শেষ না হওয়া পর্যন্ত এন্ডপয়েন্টের সব রিকোয়েস্ট থেমে থাকে। শুরুর রেট 0 হলে প্রথম
+    থ্রটলিং পর্যন্ত কোনো সীমা নেই; তখনকার প্রকৃত রেটই পরে সর্বোচ্চ সীমা ধরা হয়। থ্রেড-সেফ; sync ইঞ্জিন
+    wait() এবং async ইঞ্জিন acquire() ব্যবহার করে।
+    """
+    # সীমাহীন অবস্থায় প্রকৃত রেট মাপার সময়সীমা (সেকেন্ড)
+    OBSERVE_WINDOW_SECONDS = 5.0
+
+    def __init__(self, endpoint: str, rate: float, backoff_initial: float, backoff_max: float):
+        self.endpoint = endpoint
+        self.rate = max(0.0, rate)
+        self.ceiling = self.rate * max(1.0, RATE_LIMIT_CEILING_FACTOR)
+        self.step = self.rate * RATE_LIMIT_INCREASE
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.throttles = 0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._streak = 0
+        self._recent: deque = deque()
+
+    def _observed_rate(self, now: float) -> float:
+        while self._recent and self._recent[0][0] < now - self.OBSERVE_WINDOW_SECONDS:
+            self._recent.popleft()
+        if not self._recent:
+            return RATE_LIMIT_MIN
+        return sum(cost for _, cost in self._recent) / max(1.0, now - self._recent[0][0])
+
+    def _reserve(self, cost: float) -> float:
+        """cost টি টোকেনের স্লট সংরক্ষণ করে এবং সেটি আসতে কত সেকেন্ড বাকি তা ফেরত দেয়।"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._blocked_until)
+            if self.rate > 0:
+                due = max(self._next_slot, now)
+                slot = max(slot, due - 1.0)
+                self._next_slot = max(due, slot) + cost / self.rate
+            else:
+                self._recent.append((now, cost))
+                self._observed_rate(now)
+            return slot - now
+
+    def wait(self, cost: float = 1):
+        metrics.sleep(self._reserve(cost), self.endpoint)
+
+    async def acquire(self, cost: float = 1):
+        delay = self._reserve(cost)
+        if delay > 0:
+            metrics.record_sleep(delay, self.endpoint)
+            await asyncio.sleep(delay)
+
+    def record_success(self):
+        """সুস্থ রেসপন্স: ব্যাকঅফ শূন্যে ফেরে এবং রেট সর্বোচ্চ সীমা পর্যন্ত যোগফলে বাড়ে।"""
+        with self._lock:
+            self._streak = 0
+            if 0 < self.rate < self.ceiling:
+                self.rate = min(self.ceiling, self.rate + self.step)
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> float:
+        """
+        429/5xx বা রেট লিমিট ত্রুটি: রেট কমায় এবং এন্ডপয়েন্টটি Retry-After বা ব্যাকঅফ পর্যন্ত থামিয়ে রাখে।
+        Retry-After-ও backoff_max-এ সীমিত, যাতে একটি বড় মান (যেমন 3600) পুরো রান আটকে না রাখে।
+        আগের থামা শেষ হওয়ার আগে আসা থ্রটলিং (একই ঢেউয়ের অন্য রিকোয়েস্ট) রেট আবার কমায় না।
+        কত সেকেন্ড থামা থাকবে তা ফেরত দেয়।
+        """
+        metrics.increment(f'rate_limit_throttles_{self.endpoint}')
+        with self._lock:
+            now = time.monotonic()
+            self.throttles += 1
+            delay = 0.0
+            if now >= self._blocked_until:
+                if self.rate <= 0:
+                    self.ceiling = max(RATE_LIMIT_MIN, self._observed_rate(now))
+                    self.step = self.ceiling * RATE_LIMIT_INCREASE
+                    self.rate = self.ceiling
+                self.rate = max(RATE_LIMIT_MIN, self.rate * RATE_LIMIT_DECREASE)
+                delay = min(self.backoff_max, self.backoff_initial * (2 ** self._streak)) + random.uniform(0, self.backoff_initial)
+                self._streak += 1
+            if retry_after is not None:
+                delay = min(self.backoff_max, retry_after)
+            self._blocked_until = max(self._blocked_until, now + delay)
+            return self._blocked_until - now
+
+def endpoint_rate_settings(endpoint: str) -> Tuple[float, float, float]:
+    """এন্ডপয়েন্টের (শুরুর রেট, প্রাথমিক ব্যাকঅফ, সর্বোচ্চ ব্যাকঅফ)।"""
+    if endpoint == 'blogger':
+        return BLOGGER_MUTATION_RATE, BLOGGER_BACKOFF_INITIAL, BLOGGER_BACKOFF_MAX
+    if endpoint == 'bdjobs_details':
+        return DETAIL_FETCH_RATE_PER_HOST, HTTP_BACKOFF_FACTOR, HTTP_BACKOFF_MAX
+    return LIST_FETCH_RATE, HTTP_BACKOFF_FACTOR, HTTP_BACKOFF_MAX
+
+class EndpointRateLimits:
+    """রানের সব AdaptiveRateLimiter, এন্ডপয়েন্টের নাম অনুযায়ী (প্রথম ব্যবহারে তৈরি হয়)।"""
     def __init__(self):
-        super().__init__()
-        self.reset()
-        self.strict = False
-        self.convert_charrefs= True
-        self.fed = []
-    def handle_data(self, d):
-        self.fed.append(d)
-    def get_data(self):
-        return ''.join(self.fed)
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+    def get(self, endpoint: str) -> AdaptiveRateLimiter:
+        with self._lock:
+            if endpoint not in self._limiters:
+                self._limiters[endpoint] = AdaptiveRateLimiter(endpoint, *endpoint_rate_settings(endpoint))
+            return self._limiters[endpoint]
+
+    def limiters(self) -> List[AdaptiveRateLimiter]:
+        with self._lock:
+            return list(self._limiters.values())
+
+rate_limits = EndpointRateLimits()
+
+class CountingRetry(Retry):
+    """urllib3 Retry, যা প্রতিটি পুনঃচেষ্টা মেট্রিক্সে 'http_retries' হিসেবে গণনা করে।"""
+    def increment(self, *args, **kwargs):
+        metrics.increment('http_retries')
+        return super().increment(*args, **kwargs)
+
+def create_http_session(pool_size: int = 10) -> requests.Session:
+    """
+    একাধিক থ্রেড থেকে ব্যবহারের উপযোগী কানেকশন পুল (keep-alive, gzip) সহ Session তৈরি করে। সংযোগ ত্রুটিতে
+    HTTPAdapter নিজেই জিটারসহ এক্সপোনেনশিয়াল ব্যাকঅফে আবার চেষ্টা করে; 429 ও 5xx রেসপন্সের রিট্রাই
+    fetch_json করে, যাতে এন্ডপয়েন্টের অ্যাডাপ্টিভ রেট লিমিটার সেগুলো দেখে রেট কমাতে পারে।
+    """
+    retry = CountingRetry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        backoff_jitter=HTTP_BACKOFF_FACTOR,
+        backoff_max=HTTP_BACKOFF_MAX,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        # স্ট্যাটাসভিত্তিক রিট্রাই (Retry-After সহ) পুরোপুরি fetch_json-এর রেট লিমিটারের হাতে
+        status=0,
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.hooks['response'].append(metrics.record_http)
+    return session
+
+class JobDetailCache:
+    """
+    Job ID অনুযায়ী বিস্তারিত ডেটা ও যাচাইয়ের ফলাফল (গ্রহণ/বাতিল) SQLite ফাইলে সংরক্ষণ করে,
+    যাতে পরের রানে একই পোস্টের জন্য আবার API কল ও যাচাই করতে না হয়। ডেডলাইন পার হলে এন্ট্রি মুছে যায়।
+    কন্ডিশনাল রিকোয়েস্টের জন্য URL অনুযায়ী ETag/Last-Modified ও রেসপন্স বডিও এখানে রাখা হয়, আর প্রাক-যাচাইয়ের
+    জন্য কোম্পানিভিত্তিক যাচাই ফলাফলের হিসাব ও স্থগিত চাকরির তালিকা (JobPrescreener)।
+    """
+    def __init__(self, path: str):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_details ("
+            "job_id TEXT PRIMARY KEY, end_date TEXT NOT NULL, accepted INTEGER NOT NULL, "
+            "details TEXT, checked_at TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT NOT NULL, fetched_at TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS company_history ("
+            "company TEXT PRIMARY KEY, accepted INTEGER NOT NULL, rejected INTEGER NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS postponed_jobs ("
+            "job_id TEXT PRIMARY KEY, end_date TEXT NOT NULL, recheck_on TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def prune_expired(self, today: date) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM job_details WHERE end_date < ?", (today.isoformat(),))
+            removed = cursor.rowcount
+            oldest = (today - timedelta(days=HTTP_CACHE_MAX_AGE_DAYS)).isoformat()
+            self._conn.execute("DELETE FROM http_cache WHERE fetched_at < ?", (oldest,))
+            self._conn.execute("DELETE FROM postponed_jobs WHERE end_date < ?", (today.isoformat(),))
+            self._conn.commit()
+            return removed
+
+    def get(self, job_id: str) -> Optional[Tuple[bool, Optional[Dict[str, str]]]]:
+        """(গৃহীত কিনা, বিস্তারিত ডেটা) ফেরত দেয়; ক্যাশে না থাকলে None।"""
+        with self._lock:
+            row = self._conn.execute("SELECT accepted, details FROM job_details WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        accepted, details_json = row
+        return bool(accepted), (json.loads(details_json) if accepted and details_json else None)
+
+    def put(self, job_id: str, end_date: date, details: Optional[Dict[str, str]]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_details (job_id, end_date, accepted, details, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, end_date.isoformat(), 1 if details else 0,
+                 json.dumps(details, ensure_ascii=False) if details else None, datetime.now().isoformat(timespec='seconds'))
+            )
+            self._conn.commit()
+
+    def get_response(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+        """সংরক্ষিত (etag, last_modified, body) ফেরত দেয়; না থাকলে None।"""
+        with self._lock:
+            return self._conn.execute("SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (url,)).fetchone()
+
+    def put_response(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, datetime.now().isoformat(timespec='seconds'))
+            )
+            self._conn.commit()
+
+    def load_company_history(self) -> Dict[str, Tuple[int, int]]:
+        """কোম্পানি -> (গৃহীত, বাতিল) যাচাই ফলাফলের সংখ্যা।"""
+        with self._lock:
+            rows = self._conn.execute("SELECT company, accepted, rejected FROM company_history").fetchall()
+        return {company: (accepted, rejected) for company, accepted, rejected in rows}
+
+    def record_company_outcome(self, company: str, accepted: bool):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO company_history (company, accepted, rejected, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(company) DO UPDATE SET accepted = accepted + excluded.accepted, "
+                "rejected = rejected + excluded.rejected, updated_at = excluded.updated_at",
+                (company, 1 if accepted else 0, 0 if accepted else 1, datetime.now().isoformat(timespec='seconds'))
+            )
+            self._conn.commit()
+
+    def load_postponed(self) -> Dict[str, date]:
+        """স্থগিত চাকরি: job_id -> যেদিন থেকে আবার বিস্তারিত আনা হবে।"""
+        with self._lock:
+            rows = self._conn.execute("SELECT job_id, recheck_on FROM postponed_jobs").fetchall()
+        return {job_id: date.fromisoformat(recheck_on) for job_id, recheck_on in rows}
+
+    def postpone(self, job_id: str, end_date: date, recheck_on: date):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO postponed_jobs (job_id, end_date, recheck_on) VALUES (?, ?, ?)",
+                (job_id, end_date.isoformat(), recheck_on.isoformat())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class SyncJournal:
+    """
+    চলমান রানের চেকপয়েন্ট জার্নাল (JSONL; প্রতি লাইনে একটি রেকর্ড, লেখার সাথে সাথেই flush করা হয়)।
+    রেকর্ড হয়: তালিকার প্রতিটি পেজ ('page'), প্রতিটি চাকরির যাচাই ফলাফল ('screened'), ব্লগারে মিউটেশন
+    পাঠানোর আগে 'intent' এবং সফল হলে পোস্ট ID সহ 'commit' (নিশ্চিত ব্যর্থ হলে 'abort')।
+    রান সম্পূর্ণ হলে ফাইলটি মুছে ফেলা হয়। টাইমআউট বা ক্র্যাশে থেকে গেলে পরের রান এটি রিপ্লে করে: আগের পেজ
+    ও বিস্তারিত আবার আনা হয় না, commit হওয়া পোস্টগুলো ইনভেন্টরিতে যোগ হয়, আর যে মিউটেশনের ফলাফল অজানা
+    (intent আছে, commit নেই) সেই ব্লগের সম্পূর্ণ পোস্ট তালিকা আবার আনা হয় — ফলে ডুপ্লিকেট পোস্ট হয় না।
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.started_at = datetime.now(timezone.utc)
+        self.resumed = False
+        self.pages: Dict[int, List[Dict[str, Any]]] = {}
+        self.screened: Dict[str, Optional[Dict[str, str]]] = {}
+        self.commits: List[Dict[str, Any]] = []
+        self.intents: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        records = self._replay() if os.path.exists(path) else []
+        if not records:
+            records = [{'type': 'run', 'started_at': self.started_at.isoformat(timespec='seconds')}]
+        self._rewrite(records)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _replay(self) -> List[Dict[str, Any]]:
+        records = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # প্রসেস থেমে যাওয়ায় শেষ লাইনটি অসম্পূর্ণ; এর পরের কিছু নির্ভরযোগ্য নয়
+                    break
+        if not records:
+            return []
+        self.resumed = True
+        
+        if records[0].get('type') == 'run':
+            self.started_at = datetime.fromisoformat(records[0]['started_at'])
+        if datetime.now(timezone.utc) - self.started_at >= timedelta(hours=SYNC_JOURNAL_MAX_AGE_HOURS):
+            # পুরনো তালিকা/বিস্তারিত বাদ, কিন্তু মিউটেশনের রেকর্ড রাখা হয় (ডুপ্লিকেট এড়াতে)
+            self.started_at = datetime.now(timezone.utc)
+            records = [{'type': 'run', 'started_at': self.started_at.isoformat(timespec='seconds')}] + [
+                record for record in records if record.get('type') in ('intent', 'commit', 'abort', 'refreshed')
+            ]
+        
+        for record in records:
+            kind = record.get('type')
+            if kind == 'page':
+                self.pages[record['page']] = record['jobs']
+            elif kind == 'screened':
+                self.screened[record['job_id']] = record['details']
+            elif kind == 'intent':
+                self.intents[(record['blog_id'], record['op'], record['job_id'])] = record
+            elif kind in ('commit', 'abort'):
+                self.intents.pop((record['blog_id'], record['op'], record['job_id']), None)
+                if kind == 'commit':
+                    self.commits.append(record)
+            elif kind == 'refreshed':
+                self.intents = {key: intent for key, intent in self.intents.items() if key[0] != record['blog_id']}
+        return records
+
+    def _rewrite(self, records: List[Dict[str, Any]]):
+        # অসম্পূর্ণ শেষ লাইন বাদ দিয়ে ফাইলটি নতুন করে লেখা হয়, যাতে নতুন রেকর্ড তার সাথে জুড়ে না যায়
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.path)
+
+    def _write(self, *records: Dict[str, Any]):
+        with self._lock:
+            for record in records:
+                self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def record_page(self, page_num: int, job_list: List[Dict[str, Any]]):
+        if page_num not in self.pages:
+            self._write({'type': 'page', 'page': page_num, 'jobs': job_list})
+
+    def record_screened(self, job_id: str, details: Optional[Dict[str, str]]):
+        if job_id not in self.screened:
+            self._write({'type': 'screened', 'job_id': job_id, 'details': details})
+
+    def record_intents(self, blog_id: str, operations: List[Tuple[str, str, Optional[str]]]):
+        """(op, job_id, post_id) মিউটেশনগুলো ব্লগারে পাঠানোর ঠিক আগে লেখা হয়।"""
+        records = [
+            {'type': 'intent', 'blog_id': blog_id, 'op': op, 'job_id': job_id, 'post_id': post_id}
+            for op, job_id, post_id in operations
+        ]
+        for record in records:
+            self.intents[(blog_id, record['op'], record['job_id'])] = record
+        self._write(*records)
+
+    def record_result(self, blog_id: str, op: str, job_id: str, post: Optional[Dict[str, str]] = None, committed: bool = True):
+        """
+        মিউটেশনের ফলাফল: committed হলে পোস্টের এন্ট্রিসহ (ডিলিটের ক্ষেত্রে None) 'commit', আর ব্লগার
+        নিশ্চিতভাবে প্রত্যাখ্যান করলে 'abort'। ফলাফল অজানা থাকলে এটি ডাকা হয় না, intent থেকে যায়।
+        """
+        self.intents.pop((blog_id, op, job_id), None)
+        self._write({'type': 'commit' if committed else 'abort', 'blog_id': blog_id, 'op': op, 'job_id': job_id, 'post': post})
+
+    def needs_full_refresh(self, blog_id: str) -> bool:
+        return any(key[0] == blog_id for key in self.intents)
+
+    def mark_refreshed(self, blog_id: str):
+        """ব্লগের সম্পূর্ণ পোস্ট তালিকা আনা হয়েছে; অজানা ফলাফলের intent-গুলো এখন তালিকা থেকেই মীমাংসিত।"""
+        if self.needs_full_refresh(blog_id):
+            self.intents = {key: intent for key, intent in self.intents.items() if key[0] != blog_id}
+            self._write({'type': 'refreshed', 'blog_id': blog_id})
+
+    def apply_commits(self, blog_id: str, inventory: Dict[str, Dict[str, str]]) -> int:
+        """আগের রানের সম্পন্ন মিউটেশনগুলো ইনভেন্টরিতে প্রয়োগ করে (ব্লগারের তালিকায় দেরিতে এলেও)।"""
+        applied = 0
+        for record in self.commits:
+            if record['blog_id'] != blog_id:
+                continue
+            if record['op'] == 'delete':
+                inventory.pop(record['job_id'], None)
+            else:
+                inventory[record['job_id']] = record['post']
+            applied += 1
+        return applied
+
+    def complete(self):
+        """রান সম্পূর্ণ: জার্নাল মুছে ফেলা হয়, তবে অজানা ফলাফলের intent থাকলে শুধু সেগুলো রেখে দেওয়া হয়।"""
+        self.close()
+        if self.intents:
+            self._rewrite([{'type': 'run', 'started_at': datetime.now(timezone.utc).isoformat(timespec='seconds')}] + list(self.intents.values()))
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+def fetch_json(session: requests.Session, url: str, cache: Optional[JobDetailCache] = None, endpoint: str = 'bdjobs_list') -> Any:
+    """
+    endpoint-এর রেট লিমিটার মেনে GET করে JSON ফেরত দেয়। 429/5xx এলে লিমিটারকে জানিয়ে (রেট কমে, Retry-After
+    মানা হয়) HTTP_MAX_RETRIES বার পর্যন্ত আবার চেষ্টা হয়। cache দিলে আগের ETag/Last-Modified পাঠানো হয় এবং
+    304 এলে সংরক্ষিত বডি ব্যবহার হয়। রিট্রাইয়ের পরেও HTTP ত্রুটি থাকলে requests.HTTPError ওঠে।
+    """
+    limiter = rate_limits.get(endpoint)
+    headers = HEADERS
+    cached = cache.get_response(url) if cache else None
+    if cached:
+        etag, last_modified, _ = cached
+        headers = dict(HEADERS)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
     
-def strip_html_tags(html_content: str) -> str:
-    if not html_content:
-        return ""
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        limiter.wait()
+        response = session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if response.status_code not in RETRY_STATUS_CODES:
+            limiter.record_success()
+            break
+        if attempt < HTTP_MAX_RETRIES:
+            metrics.increment('http_retries')
+            limiter.record_throttle(parse_retry_after(response.headers.get('Retry-After')))
+    
+    if response.status_code == 304 and cached:
+        metrics.increment('http_not_modified')
+        return json.loads(cached[2])
+    response.raise_for_status()
+    
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if cache and (etag or last_modified):
+        cache.put_response(url, etag, last_modified, response.text)
+    return response.json()
+
+def open_detail_cache() -> Optional[JobDetailCache]:
+    """DETAIL_CACHE_PATH সেট থাকলে ক্যাশ খোলে এবং মেয়াদ উত্তীর্ণ এন্ট্রি মুছে ফেলে।"""
+    if not DETAIL_CACHE_PATH:
+        return None
+    try:
+        cache = JobDetailCache(DETAIL_CACHE_PATH)
+        removed = cache.prune_expired(date.today())
+        print(f"💾 বিস্তারিত ক্যাশ লোড হয়েছে ({DETAIL_CACHE_PATH}); {removed} টি মেয়াদ উত্তীর্ণ এন্ট্রি মুছে ফেলা হয়েছে।")
+        return cache
+    except Exception as e:
+        print(f"⚠️ বিস্তারিত ক্যাশ খোলা যায়নি, ক্যাশ ছাড়াই চলবে: {e}")
+        return None
+
+def open_sync_journal() -> Optional[SyncJournal]:
+    """SYNC_JOURNAL_PATH সেট থাকলে জার্নাল খোলে; অসমাপ্ত আগের রানের জার্নাল থাকলে সেটি রিপ্লে হয়।"""
+    if not SYNC_JOURNAL_PATH:
+        return None
     try:
-        stripper = HTMLStripper()
-        stripper.feed(html_content)
-        return stripper.get_data().strip().replace('\n', ' ').replace('\r', '').strip()
-    except Exception:
-        return html_content
+        journal = SyncJournal(SYNC_JOURNAL_PATH)
+    except Exception as e:
+        print(f"⚠️ চেকপয়েন্ট জার্নাল খোলা যায়নি, জার্নাল ছাড়াই চলবে: {e}")
+        return None
+    if journal.resumed:
+        print(f"♻️ অসমাপ্ত আগের রানের জার্নাল পাওয়া গেছে ({journal.started_at.isoformat(timespec='seconds')}): "
+              f"{len(journal.pages)} টি পেজ, {len(journal.screened)} টি যাচাই ফলাফল ও {len(journal.commits)} টি সম্পন্ন মিউটেশন থেকে পুনরায় শুরু হচ্ছে।")
+        if journal.intents:
+            print(f"   ⚠️ {len(journal.intents)} টি মিউটেশনের ফলাফল অজানা; সংশ্লিষ্ট ব্লগের সম্পূর্ণ পোস্ট তালিকা আবার আনা হবে।")
+    return journal
+
+def build_blogger_client(creds: Any) -> Any:
+    """
+    নেটওয়ার্ক থেকে discovery ডকুমেন্ট না এনে ব্লগার ক্লায়েন্ট তৈরি করে: BLOGGER_DISCOVERY_DOC দেওয়া থাকলে
+    সেই ফাইল থেকে, নইলে googleapiclient প্যাকেজে বান্ডেল করা স্ট্যাটিক ডকুমেন্ট থেকে।
+    """
+    from googleapiclient.discovery import build, build_from_document
+
+    if BLOGGER_DISCOVERY_DOC and os.path.exists(BLOGGER_DISCOVERY_DOC):
+        with open(BLOGGER_DISCOVERY_DOC, 'r', encoding='utf-8') as f:
+            return build_from_document(f.read(), credentials=creds)
+    return build('blogger', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
 
 def get_blogger_service() -> Optional[Any]:
+    # গুগল ক্লায়েন্ট লাইব্রেরিগুলো ভারী, তাই শুধু ব্লগারের প্রয়োজন হলেই লোড করা হয় (স্টার্টআপ দ্রুত রাখতে)
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
     creds = None
     # গিটহাব সিক্রেট থেকে ডেটা সংগ্রহ
     token_json = os.environ.get('BLOGGER_TOKEN_JSON')
@@ -99,164 +804,308 @@ def get_blogger_service() -> Optional[Any]:
         print("FATAL ERROR: কোনো বৈধ ক্রেডেনশিয়াল পাওয়া যায়নি। প্রথমে পিসিতে রান করে টোকেন নিন।")
         return None
 
-    return build('blogger', 'v3', credentials=creds)
+    try:
+        return build_blogger_client(creds)
+    except Exception as e:
+        print(f"❌ ব্লগার ক্লায়েন্ট তৈরি করতে ব্যর্থ: {e}")
+        return None
 
-def format_api_date(date_str: str, format_list: List[str]) -> str:
+@functools.lru_cache(maxsize=4096)
+def parse_api_deadline(date_str: str) -> Optional[date]:
+    """
+    API-র deadlineDB (UTC) থেকে বাংলাদেশ সময় (+৬ ঘণ্টা) অনুযায়ী ডেডলাইনের তারিখ বের করে।
+    সব ফরম্যাট একে একে চেষ্টা না করে স্ট্রিং দেখেই ফরম্যাট বেছে নেওয়া হয় ('T' থাকলে ISO, '/' থাকলে mm/dd/YYYY)।
+    """
     if not date_str:
-        return "N/A"
-    for fmt in format_list:
-        try:
-            dt_object = datetime.strptime(date_str.split('.')[0], fmt)
-            dt_object_bdt = dt_object + timedelta(hours=6)
-            return dt_object_bdt.strftime("%d-%m-%Y")
-        except ValueError:
-            continue
-    return "N/A"
+        return None
+    value = date_str.split('.')[0]
+    try:
+        if 'T' in value:
+            dt_object = datetime.fromisoformat(value.rstrip('Z'))
+        elif '/' in value:
+            dt_object = datetime.strptime(value, '%m/%d/%Y %H:%M:%S')
+        else:
+            return None
+    except ValueError:
+        return None
+    return (dt_object + timedelta(hours=6)).date()
 
-def parse_end_date_for_check(date_str: str) -> Optional[datetime.date]:
+def format_label_date(value: date) -> str:
+    return f"{value.day:02d}-{value.month:02d}-{value.year}"
+
+def job_fingerprint(data: Dict[str, Any]) -> str:
+    """পোস্টে দেখানো তালিকার ফিল্ডগুলোর (শিরোনাম, কোম্পানি, ডেডলাইন) ছোট SHA-1 হ্যাশ।"""
+    raw = '\x1f'.join((data['title'], data['company_name'], data['end_date_label']))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]
+
+@functools.lru_cache(maxsize=4096)
+def parse_end_date_for_check(date_str: str) -> Optional[date]:
+    """লেবেলের তারিখ ('dd-mm-YYYY', পুরনো পোস্টে 'YYYY-mm-dd') পার্স করে; একই তারিখ বারবার পার্স হয় না।"""
     if not date_str or date_str == "N/A":
         return None
-    for fmt in ['%d-%m-%Y', '%Y-%m-%d']:
-        try:
-            return datetime.strptime(date_str, fmt).date()
-        except ValueError:
-            continue
-    return None
+    parts = date_str.split('-')
+    if len(parts) != 3:
+        return None
+    try:
+        if len(parts[0]) == 4:
+            year, month, day = parts
+        else:
+            day, month, year = parts
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
-def check_for_contact_info(text: str) -> bool:
+class BloggerInventory(dict):
     """
-    ⚠️⚠️ চূড়ান্ত সংশোধিত: কঠোরভাবে শুধুমাত্র Gmail বা বৈধ বাংলাদেশী ফোন নাম্বার যাচাই করা হবে। 
-    অন্য ডোমেইনের ইমেইল পাওয়া গেলে বাতিল করা হবে।
+    job_id -> {'post_id', 'title', 'end_date', 'content_hash'} ম্যাপ, সাথে ডেডলাইন অনুযায়ী সাজানো হিপ (end_date, job_id, post_id)।
+    এন্ট্রি যোগ বা হালনাগাদ করলে হিপেও যোগ হয়; মুছে ফেলা বা পুরনো হয়ে যাওয়া হিপ এন্ট্রি তোলার সময় বাদ পড়ে।
+    ফলে মেয়াদ উত্তীর্ণ পোস্ট খুঁজতে পুরো ইনভেন্টরি স্ক্যান করতে হয় না।
     """
-    if not text:
-        return False
-        
-    # --- ফোন নাম্বার যাচাইকরণ ---
-    
-    # 1. টেক্সট থেকে শুধুমাত্র ডিজিটগুলো বের করে ফোন নাম্বার ফরম্যাট চেক করা।
-    # ফোন নাম্বারে ব্যবহৃত হতে পারে এমন ক্যারেক্টার অপসারণ করা
-    cleaned_phone_text = re.sub(r'[\s\-\(\)\.\+\/]', '', text) 
-    
-    # 2. বাংলাদেশের প্রচলিত মোবাইল নাম্বার ফরম্যাট (11 ডিজিট) যাচাই
-    # এটি 01[3-9]XXXXXXXX ফরম্যাটের ১১ ডিজিটের নাম্বার খুঁজবে।
-    phone_pattern_11_digit = r'\b(01[3-9]\d{8})\b'
-    
-    # 3. এটি +8801[3-9]XXXXXXXX ফরম্যাটের নাম্বার খুঁজবে (যদিও উপরেরটি কভার করবে, তবুও ব্যাকআপ)
-    phone_pattern_13_digit = r'\b(\+8801[3-9]\d{8})\b' 
+    def __init__(self, posts: Optional[Dict[str, Dict[str, str]]] = None, deadline_entries: Optional[List[List[Any]]] = None):
+        super().__init__(posts or {})
+        if deadline_entries is None:
+            self._deadlines: List[Tuple[int, str, str]] = []
+            for job_id, post_data in self.items():
+                self._push(job_id, post_data)
+        else:
+            self._deadlines = [(int(ordinal), str(job_id), str(post_id)) for ordinal, job_id, post_id in deadline_entries]
+            heapq.heapify(self._deadlines)
 
-    if re.search(phone_pattern_11_digit, cleaned_phone_text) or re.search(phone_pattern_13_digit, text):
-        print("       ✅ যোগাযোগ তথ্য পাওয়া গেছে: বৈধ বাংলাদেশি ফোন নাম্বার।")
-        return True
+    def __setitem__(self, job_id: str, post_data: Dict[str, str]):
+        super().__setitem__(job_id, post_data)
+        self._push(job_id, post_data)
 
-    # --- ইমেইল যাচাইকরণ ---
-    
-    # 1. ইমেইল ফরম্যাট খোঁজা (যেকোনো ডোমেইন)
-    # এই প্যাটার্নটি সমস্ত ইমেইল খুঁজে বের করবে
-    email_pattern = r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
-    all_emails = re.findall(email_pattern, text, re.IGNORECASE)
-    
-    if not all_emails:
-        # যদি কোনো ফোন বা ইমেইল না পাওয়া যায়
-        print("       ❌ কোনো বৈধ যোগাযোগের তথ্য (Gmail বা ফোন) পাওয়া যায়নি।")
-        return False
-        
-    # 2. ইমেইল ডোমেইন যাচাইকরণ (Gmail চেক)
-    valid_gmail_found = False
-    
-    for email in all_emails:
-        if email.lower().endswith('@gmail.com'):
-            valid_gmail_found = True
-            break
-            
-        # ⚠️ কঠোরতা: যদি ইমেইল থাকে কিন্তু তা Gmail না হয়, তবে এই পোস্টটি বাতিল।
-        # তবে এটি নিশ্চিত করার জন্য আগে ফোন নাম্বার চেক করা হয়েছে।
-        # যদি Gmail পাওয়া যায়, তবেই বৈধতা পাবে।
-    
-    if valid_gmail_found:
-        print("       ✅ যোগাযোগ তথ্য পাওয়া গেছে: বৈধ Gmail.")
-        return True
-        
-    # যদি ফোন নাম্বার না পাওয়া যায় এবং Gmail-ও না পাওয়া যায়, তবে False রিটার্ন হবে।
-    print("       ❌ কঠোরতা: শুধুমাত্র অন্য ডোমেইনের ইমেইল পাওয়া গেছে, যা বৈধ নয়। বাতিল করা হলো।")
-    return False
+    def _push(self, job_id: str, post_data: Dict[str, str]):
+        end_date = parse_end_date_for_check(post_data.get('end_date'))
+        if end_date and post_data.get('post_id'):
+            heapq.heappush(self._deadlines, (end_date.toordinal(), job_id, post_data['post_id']))
+
+    def pop_expired(self, cutoff: date) -> List[Tuple[str, Dict[str, str], date]]:
+        """cutoff বা তার আগে মেয়াদ শেষ হওয়া বর্তমান পোস্টগুলো হিপের মাথা থেকে তুলে (job_id, post_data, end_date) ফেরত দেয়।"""
+        expired = []
+        seen = set()
+        limit = cutoff.toordinal()
+        while self._deadlines and self._deadlines[0][0] <= limit:
+            ordinal, job_id, post_id = heapq.heappop(self._deadlines)
+            post_data = self.get(job_id)
+            if not post_data or post_data.get('post_id') != post_id or job_id in seen:
+                continue
+            end_date = parse_end_date_for_check(post_data.get('end_date'))
+            if not end_date or end_date.toordinal() != ordinal:
+                # ডেডলাইন বদলেছে; নতুন তারিখের এন্ট্রি হিপে আলাদাভাবে আছে
+                continue
+            seen.add(job_id)
+            expired.append((job_id, post_data, end_date))
+        return expired
+
+    def restore(self, job_id: str):
+        """ডিলিট ব্যর্থ হলে এন্ট্রিটি আবার হিপে ফিরিয়ে দেয়, যাতে পরের রানে চেষ্টা হয়।"""
+        if job_id in self:
+            self._push(job_id, self[job_id])
+
+    def deadline_entries(self) -> List[Tuple[int, str, str]]:
+        """স্ন্যাপশটে রাখার জন্য ডুপ্লিকেট-মুক্ত, সাজানো হিপ এন্ট্রি (সাজানো তালিকা নিজেই বৈধ হিপ)।"""
+        return sorted(set(self._deadlines))
+
+class ContactMatch(NamedTuple):
+    kind: str   # 'phone', 'gmail' অথবা 'email' (অন্য ডোমেইন)
+    value: str
+    field: str
+
+# ফোন নাম্বারের ডিজিটগুলোর মাঝে থাকতে পারে এমন ক্যারেক্টার (স্পেস, -, (, ), ., +, /)
+_PHONE_SEP = r'[\s\-().+/]*'
+
+# বাংলাদেশি মোবাইল নাম্বার (01[3-9]XXXXXXXX, সামনে ঐচ্ছিক +88); শুরুর lookahead-এর কারণে +, 8 বা 0 ছাড়া
+# অন্য অক্ষরে মিলানোর চেষ্টা সাথে সাথেই বাদ পড়ে
+_PHONE_REGEX = r'(?P<phone>(?=[+80])(?<!\w)(?:\+?88' + _PHONE_SEP + r')?0' + _PHONE_SEP + r'1' + _PHONE_SEP + r'[3-9](?:' + _PHONE_SEP + r'\d){8}(?!\w))'
+# একটি প্যাটার্নেই ফোন নাম্বার ও ইমেইল খোঁজা হয়; লেখায় '@' না থাকলে শুধু ফোনের প্যাটার্ন চালানো হয়,
+# কারণ ইমেইলের অংশটি প্রতিটি শব্দে ব্যাকট্র্যাক করে স্ক্যানের বেশিরভাগ সময় নেয়
+CONTACT_PATTERN = re.compile(_PHONE_REGEX + r'|(?P<email>\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b)')
+_PHONE_PATTERN = re.compile(_PHONE_REGEX)
+_NON_DIGIT_PATTERN = re.compile(r'\D')
+_HTML_TAG_PATTERN = re.compile(r'<[a-zA-Z/!][^>]*>')
+
+def html_to_text(html_content: str) -> str:
+    """
+    যাচাইয়ের জন্য দ্রুত HTML থেকে টেক্সট বের করে: ট্যাগগুলো স্পেসে বদলে যায় (যাতে আলাদা ট্যাগের লেখা
+    জুড়ে না যায়) এবং প্রয়োজনে HTML entity ডিকোড হয়। প্রদর্শনের জন্য নয়, শুধু স্ক্যানিংয়ের জন্য।
+    """
+    if not html_content:
+        return ""
+    text = _HTML_TAG_PATTERN.sub(' ', html_content) if '<' in html_content else html_content
+    return html_unescape(text) if '&' in text else text
+
+def html_to_clean_text(html_content: Optional[str]) -> str:
+    """html_to_text-এর ফলাফল, সব ধরনের ফাঁকা জায়গা একটি স্পেসে সংকুচিত করে।"""
+    return ' '.join(html_to_text(html_content).split()) if html_content else ""
+
+def scan_contact_info(fields: Dict[str, Optional[str]]) -> List[ContactMatch]:
+    """
+    প্রতিটি HTML ফিল্ড আলাদাভাবে (একত্রিত না করে) একবার স্ক্যান করে ফোন নাম্বার ও ইমেইল খুঁজে বের করে।
+    কিছু প্রিন্ট করে না; প্রতিটি ম্যাচ (kind, value, field) আকারে ফেরত দেয়।
+    """
+    return scan_contact_text({field: html_to_text(html_content) for field, html_content in fields.items() if html_content})
+
+def scan_contact_text(texts: Dict[str, str]) -> List[ContactMatch]:
+    """scan_contact_info-এর মতোই, তবে ফিল্ডগুলো আগেই টেক্সটে রূপান্তরিত।"""
+    matches: List[ContactMatch] = []
+    for field, text in texts.items():
+        if not text:
+            continue
+        pattern = CONTACT_PATTERN if '@' in text else _PHONE_PATTERN
+        for match in pattern.finditer(text):
+            if match.lastgroup == 'phone':
+                digits = _NON_DIGIT_PATTERN.sub('', match.group())
+                matches.append(ContactMatch('phone', digits[-11:], field))
+            else:
+                email = match.group()
+                kind = 'gmail' if email.lower().endswith('@gmail.com') else 'email'
+                matches.append(ContactMatch(kind, email, field))
+    return matches
+
+def contact_rejection_reason(matches: List[ContactMatch]) -> Optional[str]:
+    """
+    ⚠️ কঠোর নিয়ম: শুধুমাত্র Gmail বা বৈধ বাংলাদেশী ফোন নাম্বার থাকলেই পোস্ট গ্রহণযোগ্য।
+    গ্রহণযোগ্য হলে None, না হলে বাতিলের কারণ ('no_contact_info' বা 'non_gmail_email_only') ফেরত দেয়।
+    """
+    kinds = {match.kind for match in matches}
+    if 'phone' in kinds or 'gmail' in kinds:
+        return None
+    if 'email' in kinds:
+        return 'non_gmail_email_only'
+    return 'no_contact_info'
 
 # =========================================================
 # ধাপ ১: API থেকে তালিকা ফেচ করা
-# (অপরিবর্তিত)
 # =========================================================
 
-def fetch_job_list_from_page(session: requests.Session, page_num: int) -> List[Dict[str, Any]]:
+@timed_stage('fetch_job_list_page')
+def fetch_job_list_from_page(session: requests.Session, page_num: int, cache: Optional[JobDetailCache] = None, journal: Optional[SyncJournal] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    একটি তালিকা পেজ আনে। শেষ পেজের পরে (খালি, 404 বা 400) [] ফেরত দেয়, কিন্তু রিট্রাইয়ের পরেও ব্যর্থ হলে
+    None ফেরত দেয়, যাতে একটি অস্থায়ী ত্রুটিকে তালিকার শেষ ভেবে সংগ্রহ থেমে না যায়।
+    অসমাপ্ত আগের রানের জার্নালে পেজটি থাকলে রিকোয়েস্ট না পাঠিয়ে সেখান থেকেই নেওয়া হয়।
+    """
+    if journal and page_num in journal.pages:
+        metrics.increment('journal_pages_replayed')
+        return journal.pages[page_num]
     api_url = API_BDS_LIST.format(page_num=page_num)
     try:
-        response = session.get(api_url, headers=HEADERS, timeout=20)
-        response.raise_for_status()
-        json_response = response.json()
-        return json_response.get('data', [])
-    except Exception as e:
-        if hasattr(response, 'status_code') and response.status_code in [404, 400]:
+        return fetch_json(session, api_url, cache, endpoint='bdjobs_list').get('data', []) or []
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code in [404, 400]:
             print(f"       - Page {page_num}: শেষ পেজে পৌঁছেছে বা Invalid Page।")
-        else:
-            print(f"       ❌ API লিস্ট ফেচ ব্যর্থ (Page {page_num}): {e}")
-        return []
+            return []
+        error = e
+    except Exception as e:
+        error = e
+    print(f"       ❌ API লিস্ট ফেচ ব্যর্থ (Page {page_num}): {error}")
+    metrics.increment('list_fetch_failures')
+    return None
 
-def fetch_all_target_jobs() -> Dict[str, Dict[str, Any]]:
-    print("\n▶️ ধাপ ২: API থেকে সমস্ত তালিকা সংগ্রহ শুরু...")
-    all_jobs: Dict[str, Dict[str, Any]] = {}
-    session = requests.Session()
-    time.sleep(2)
-    
-    current_date = date.today()
+def iter_job_list_pages(session: requests.Session, max_pages: Optional[int] = None, concurrency: Optional[int] = None, cache: Optional[JobDetailCache] = None, journal: Optional[SyncJournal] = None):
+    """
+    একসাথে সর্বোচ্চ `concurrency` টি পেজ ফেচ করে, কিন্তু ফলাফল পেজ নম্বরের ক্রমেই ফেরত দেয়।
+    প্রথম খালি (বা 404/400) পেজ পেলেই থেমে যায়; max_pages 0 হলে কোনো সীমা নেই। ব্যর্থ পেজ বাদ দিয়ে
+    পরের পেজে যাওয়া হয়, তবে পরপর LIST_MAX_CONSECUTIVE_FAILURES টি পেজ ব্যর্থ হলে সংগ্রহ থামে।
+    """
+    max_pages = MAX_PAGES_TO_FETCH if max_pages is None else max_pages
+    concurrency = max(1, PAGE_FETCH_CONCURRENCY if concurrency is None else concurrency)
+    in_flight = {}
+    next_page = 1
+    consecutive_failures = 0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        def submit_more():
+            nonlocal next_page
+            while len(in_flight) < concurrency and (not max_pages or next_page <= max_pages):
+                in_flight[next_page] = executor.submit(fetch_job_list_from_page, session, next_page, cache, journal)
+                next_page += 1
+
+        submit_more()
+        current_page = 1
+        try:
+            while current_page in in_flight:
+                job_list = in_flight.pop(current_page).result()
+                if job_list is None:
+                    consecutive_failures += 1
+                    if consecutive_failures >= LIST_MAX_CONSECUTIVE_FAILURES:
+                        print(f"   ❌ পরপর {consecutive_failures} টি পেজ ব্যর্থ হওয়ায় তালিকা সংগ্রহ থামানো হলো।")
+                        break
+                    current_page += 1
+                    submit_more()
+                    continue
+                consecutive_failures = 0
+                if not job_list:
+                    break
+                if journal:
+                    journal.record_page(current_page, job_list)
+                yield current_page, job_list
+                current_page += 1
+                submit_more()
+        finally:
+            # শেষ পেজের পরের অপ্রয়োজনীয় রিকোয়েস্টগুলো বাতিল করা
+            for future in in_flight.values():
+                future.cancel()
+
+def print_listing_scope(current_date: date):
     print(f"   ⚠️ শুধুমাত্র {current_date.strftime('%d-%m-%Y')} বা তার পরের ডেডলাইন যুক্ত পোস্টগুলি সংগ্রহ করা হবে।")
+    page_limit_text = MAX_PAGES_TO_FETCH if MAX_PAGES_TO_FETCH else 'সীমাহীন'
+    print(f"   📄 সর্বোচ্চ পেজ: {page_limit_text}, একসাথে ফেচ: {PAGE_FETCH_CONCURRENCY} টি পেজ।")
 
-    current_page = 1
+def iter_listing_page_jobs(current_page: int, job_list: List[Dict[str, Any]], current_date: date):
+    """একটি তালিকা পেজের আইটেমগুলো থেকে ডেডলাইন যাচাই করে বৈধ চাকরিগুলো (job_id, data) আকারে ফেরত দেয়।"""
+    print(f"   🔎 Page {current_page} প্রক্রিয়াকরণ করা হচ্ছে...")
+    metrics.mark_once('first_listing_page_s')
+    metrics.increment('listing_pages')
     
-    # ⚠️ শুধুমাত্র প্রথম পেজ রান করতে চাইলে নিচে দেওয়া 'MAX_PAGES_TO_FETCH' ভ্যারিয়েবলটি কমেন্ট আউট করে দিন
-    MAX_PAGES_TO_FETCH = 4
-    
-    while True:
-        if current_page > 1 and MAX_PAGES_TO_FETCH == 1:
-            print(f"   ⚠️ শুধুমাত্র একটি পেজের উপর চলছে। সমস্ত পেজের জন্য 'MAX_PAGES_TO_FETCH' কমেন্ট আউট করুন।")
-            break
+    for position, job_item in enumerate(job_list):
+        job_id = str(job_item.get('Jobid'))
+        title = job_item.get('jobTitle') or job_item.get('JobTitleBng', 'পদবিহীন').strip()
+        company = job_item.get('companyName', 'অজানা সংস্থা').strip()
+        deadline_db = job_item.get('deadlineDB')
         
-        if current_page > MAX_PAGES_TO_FETCH: 
-            break
+        job_end_date = parse_api_deadline(deadline_db)
+        end_date_clean = format_label_date(job_end_date) if job_end_date else "N/A"
         
-        print(f"   🔎 Page {current_page} প্রক্রিয়াকরণ করা হচ্ছে...")
-        job_list = fetch_job_list_from_page(session, current_page)
+        if not job_end_date:
+            print(f"       - ডেডলাইন অনুপস্থিত/ত্রুটিপূর্ণ (ID: {job_id})। এড়িয়ে যাওয়া হলো।")
+            continue
         
-        if not job_list:
-            break
+        if job_end_date < current_date:
+            print(f"       - মেয়াদ উত্তীর্ণ ({job_end_date.strftime('%d-%m-%Y')} < {current_date.strftime('%d-%m-%Y')}) (ID: {job_id})। এড়িয়ে যাওয়া হলো।")
+            continue
         
-        for job_item in job_list:
-            job_id = str(job_item.get('Jobid'))
-            title = job_item.get('jobTitle') or job_item.get('JobTitleBng', 'পদবিহীন').strip()
-            company = job_item.get('companyName', 'অজানা সংস্থা').strip()
-            deadline_db = job_item.get('deadlineDB')
-            
-            end_date_clean = format_api_date(deadline_db, API_DATE_FORMATS) if deadline_db else "N/A"
-            
-            job_end_date = parse_end_date_for_check(end_date_clean)
-            
-            if not job_end_date:
-                print(f"       - ডেডলাইন অনুপস্থিত/ত্রুটিপূর্ণ (ID: {job_id})। এড়িয়ে যাওয়া হলো।")
-                continue
-            
-            if job_end_date < current_date:
-                print(f"       - মেয়াদ উত্তীর্ণ ({job_end_date.strftime('%d-%m-%Y')} < {current_date.strftime('%d-%m-%Y')}) (ID: {job_id})। এড়িয়ে যাওয়া হলো।")
-                continue
+        if job_id and len(title) > 2 and end_date_clean != "N/A":
+            full_title = f"{title} - {company}"
+            metrics.increment('listing_jobs_valid')
             
-            if job_id and len(title) > 2 and end_date_clean != "N/A":
-                full_title = f"{title} - {company}"
-                
-                all_jobs[job_id] = {
-                    'title': full_title,
-                    'company_name': company,
-                    'end_date_label': end_date_clean,
-                    'page_order': current_page * 1000 + job_list.index(job_item)
-                }
-        
-        current_page += 1
-        time.sleep(1)
+            yield job_id, {
+                'title': full_title,
+                'company_name': company,
+                'end_date_label': end_date_clean,
+                'page_order': current_page * 1000 + position
+            }
+
+def iter_target_jobs(session: Optional[requests.Session] = None, cache: Optional[JobDetailCache] = None, journal: Optional[SyncJournal] = None):
+    """
+    তালিকার প্রতিটি পেজ আসার সাথে সাথে ডেডলাইন যাচাই করে বৈধ চাকরিগুলো (job_id, data) আকারে ফেরত দেয়।
+    সম্পূর্ণ তালিকা মেমোরিতে জমা না করেই পরের ধাপগুলো কাজ শুরু করতে পারে। cache দিলে পেজগুলো
+    কন্ডিশনাল রিকোয়েস্টে আনা হয় (অপরিবর্তিত পেজ 304)।
+    """
+    session = session or create_http_session(PAGE_FETCH_CONCURRENCY)
+    
+    current_date = date.today()
+    print_listing_scope(current_date)
+    
+    for current_page, job_list in iter_job_list_pages(session, cache=cache, journal=journal):
+        yield from iter_listing_page_jobs(current_page, job_list, current_date)
+
+@timed_stage('fetch_all_target_jobs')
+def fetch_all_target_jobs() -> Dict[str, Dict[str, Any]]:
+    """সম্পূর্ণ তালিকা একবারে সংগ্রহ করে dict আকারে ফেরত দেয় (স্ট্রিমিং প্রয়োজন না হলে)।"""
+    print("\n▶️ ধাপ ২: API থেকে সমস্ত তালিকা সংগ্রহ শুরু...")
+    all_jobs: Dict[str, Dict[str, Any]] = dict(iter_target_jobs())
 
     print(f"✅ লক্ষ্য সাইট থেকে সংগ্রহ সম্পন্ন। মোট {len(all_jobs)} টি মেয়াদ শেষ না হওয়া পোস্ট পাওয়া গেছে।")
     return all_jobs
@@ -264,34 +1113,44 @@ def fetch_all_target_jobs() -> Dict[str, Dict[str, Any]]:
 
 # =========================================================
 # ধাপ ২: Job ID ব্যবহার করে বিস্তারিত ডেটা ফেচ করা
-# (অপরিবর্তিত)
 # =========================================================
 
-def fetch_job_details_by_id(session: requests.Session, job_id: str) -> Optional[Dict[str, str]]:
-    """Job ID ব্যবহার করে বিস্তারিত API কল করে সমস্ত ডেটা সংগ্রহ করে, এবং যোগাযোগের তথ্য যাচাই করে।"""
+def extract_job_details(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """বিস্তারিত API-র JSON থেকে প্রথম রেকর্ডটি বের করে; না থাকলে None।"""
+    details = data.get('data', [])[0] if data.get('data') else {}
+    
+    if not details:
+        print("       ❌ বিস্তারিত JSON ডেটা পাওয়া যায়নি।")
+        metrics.increment('detail_fetch_failures')
+        return None
+    return details
+
+@timed_stage('fetch_job_details')
+def fetch_job_detail_payload(session: requests.Session, job_id: str) -> Optional[Dict[str, Any]]:
+    """বিস্তারিত API থেকে কাঁচা JSON ডেটা আনে; রিকোয়েস্ট বা পার্সিং ব্যর্থ হলে None ফেরত দেয়।"""
     print(f"       ⚙️ বিস্তারিত API কল শুরু (ID: {job_id})...")
     api_url = API_BDS_DETAILS.format(job_id=job_id)
     
     try:
-        response = session.get(api_url, headers=HEADERS, timeout=20)
-        response.raise_for_status()
-        data = response.json()
-        
-        details = data.get('data', [])[0] if data.get('data') else {}
-        
-        if not details:
-            print("       ❌ বিস্তারিত JSON ডেটা পাওয়া যায়নি।")
-            return None
-        
-        job_description_full = details.get('JobDescription', '')
-        education_req_raw = details.get('EducationRequirements', '')
-        experience_req_raw = details.get('experience', '')
-        additional_req_raw = details.get('AdditionJobRequirements', '')
-        read_before_apply_raw = details.get('RecruitmentProcessingInformation', '')
-        apply_instruction_raw = details.get('ApplyInstruction', '')
-        apply_email = details.get('ApplyEmail', '') 
+        return extract_job_details(fetch_json(session, api_url, endpoint='bdjobs_details'))
+            
+    except Exception as e:
+        print(f"       ❌ বিস্তারিত রিকোয়েস্ট/পার্সিং ব্যর্থ: {e}")
+        metrics.increment('detail_fetch_failures')
+        return None
 
-        job_nature = details.get('JobNature', 'N/A')
+@timed_stage('screen_job_details')
+def screen_job_details(job_id: str, details: Dict[str, Any], normalized: Optional['NormalizedDetails'] = None) -> Optional[Dict[str, str]]:
+    """
+    কাঁচা বিস্তারিত ডেটা থেকে পোস্টের ফিল্ডগুলো তৈরি করে এবং যোগাযোগের তথ্য যাচাই করে; বাতিল হলে None।
+    normalized (প্রসেস পুলে আগেই করা normalize_job_details) না দিলে এখানেই নর্মালাইজ করা হয়।
+    """
+    try:
+        if normalized is None:
+            normalized = normalize_job_details(details, skip_rejected_html=True)
+        apply_email = details.get('ApplyEmail', '') 
+
+        job_nature = details.get('JobNature', 'N/A')
         workplace = details.get('JobWorkPlace', 'N/A')
         job_location = details.get('JobLocation', 'N/A')
         salary_range = details.get('JobSalaryRange', 'Negotiable')
@@ -299,30 +1158,39 @@ def fetch_job_details_by_id(session: requests.Session, job_id: str) -> Optional[
         
         # --- ⚠️ কঠোর যোগাযোগ তথ্য যাচাইকরণ লজিক শুরু ⚠️ ---
         
-        # সমস্ত সম্ভাব্য টেক্সট ফিল্ড একত্রিত করা
-        all_text_content = job_description_full + " " + education_req_raw + " " + \
-                           experience_req_raw + " " + additional_req_raw + " " + \
-                           read_before_apply_raw + " " + apply_instruction_raw + " " + apply_email
-                           
-        # HTML ট্যাগ সরিয়ে প্লেইন টেক্সট যাচাই করা
-        clean_text_for_check = strip_html_tags(all_text_content).strip()
+        # সমস্ত সম্ভাব্য টেক্সট ফিল্ড আলাদাভাবে স্ক্যান করা হয়েছে (normalize_job_details)
+        contact_matches = normalized.contacts
+        rejection_reason = contact_rejection_reason(contact_matches)
+        
+        if rejection_reason == 'no_contact_info':
+            print("       ❌ কোনো বৈধ যোগাযোগের তথ্য (Gmail বা ফোন) পাওয়া যায়নি।")
+        elif rejection_reason == 'non_gmail_email_only':
+            print("       ❌ কঠোরতা: শুধুমাত্র অন্য ডোমেইনের ইমেইল পাওয়া গেছে, যা বৈধ নয়। বাতিল করা হলো।")
         
-        # যোগাযোগের তথ্য (Gmail বা Phone) যাচাই করা
-        if not check_for_contact_info(clean_text_for_check):
+        if rejection_reason:
+            metrics.increment('jobs_rejected')
+            metrics.increment(f'jobs_rejected_{rejection_reason}')
             # যদি যোগাযোগের তথ্য বৈধ না হয় (Gmail বা Phone), তবে কঠোরভাবে বাতিল করা হলো।
             print(f"       ❌ কঠোরতা: এই পোস্ট বাতিল করা হলো (ID: {job_id})।")
             return None
         
+        metrics.increment('jobs_accepted')
+        contact_kind = 'বৈধ বাংলাদেশি ফোন নাম্বার' if any(m.kind == 'phone' for m in contact_matches) else 'বৈধ Gmail'
+        print(f"       ✅ যোগাযোগ তথ্য পাওয়া গেছে: {contact_kind}।")
+        
         # --- যোগাযোগ তথ্য যাচাইকরণ লজিক শেষ ---
         
         print("       ✅ বিস্তারিত ডেটা সফলভাবে পাওয়া গেছে এবং যোগাযোগের তথ্য বৈধ।")
+        # HTML ফিল্ডগুলো ইতিমধ্যে sanitize করা, তাই রেন্ডারের সময় আবার করতে হয় না
+        html = normalized.html
         return {
-            'job_description_html': job_description_full,
-            'apply_instruction_html': apply_instruction_raw,
-            'read_before_apply_html': read_before_apply_raw,
-            'education': education_req_raw,
-            'experience': experience_req_raw,
-            'additional_req': additional_req_raw,
+            'job_description_html': html['JobDescription'],
+            'apply_instruction_html': html['ApplyInstruction'],
+            'read_before_apply_html': html['RecruitmentProcessingInformation'],
+            'education': html['EducationRequirements'],
+            'experience': html['experience'],
+            'additional_req': html['AdditionJobRequirements'],
+            'html_sanitized': True,
             'job_nature': job_nature,
             'workplace': workplace,
             'job_location': job_location,
@@ -332,39 +1200,633 @@ def fetch_job_details_by_id(session: requests.Session, job_id: str) -> Optional[
         }
             
     except Exception as e:
-        print(f"       ❌ বিস্তারিত রিকোয়েস্ট/পার্সিং ব্যর্থ: {e}")
+        print(f"       ❌ বিস্তারিত ডেটা প্রক্রিয়াকরণ ব্যর্থ (ID: {job_id}): {e}")
+        return None
+
+def fetch_job_details_by_id(session: requests.Session, job_id: str) -> Optional[Dict[str, str]]:
+    """Job ID ব্যবহার করে বিস্তারিত API কল করে সমস্ত ডেটা সংগ্রহ করে, এবং যোগাযোগের তথ্য যাচাই করে।"""
+    details = fetch_job_detail_payload(session, job_id)
+    if not details:
         return None
+    return screen_job_details(job_id, details)
+
+def classify_listed_job(job_id: str, data: Dict[str, Any], blogger_posts: Dict[str, Dict[str, str]]) -> Optional[Dict[str, Any]]:
+    """
+    নতুন চাকরির জন্য data, তালিকার তথ্য বদলে যাওয়া প্রকাশিত চাকরির জন্য 'update_post_id' যুক্ত data এবং
+    অপরিবর্তিত চাকরির জন্য None ফেরত দেয়। BdHash লেবেল ছাড়া পুরনো পোস্টের ক্ষেত্রে শুধু ডেডলাইন তুলনা হয়।
+    """
+    post_data = blogger_posts.get(job_id)
+    if post_data is None:
+        return data
+    
+    if post_data.get('content_hash'):
+        changed = post_data['content_hash'] != job_fingerprint(data)
+    else:
+        changed = parse_end_date_for_check(post_data.get('end_date')) != parse_end_date_for_check(data['end_date_label'])
+    
+    if changed and post_data.get('post_id'):
+        print(f"   🔄 তালিকার তথ্য বদলেছে, পোস্টটি হালনাগাদ করা হবে: {data['title']} (শেষ তারিখ: {post_data.get('end_date')} → {data['end_date_label']})")
+        metrics.increment('jobs_changed')
+        return dict(data, update_post_id=post_data['post_id'])
+    return None
+
+def plan_target_jobs(job_id: str, data: Dict[str, Any], targets: List[SyncTarget], inventories: Dict[str, Dict[str, Dict[str, str]]]) -> Dict[str, Dict[str, Any]]:
+    """কোন কোন টার্গেটে চাকরিটি প্রকাশ বা হালনাগাদ দরকার: {টার্গেটের নাম: সেই টার্গেটের job data}।"""
+    wanted = {}
+    for target in targets:
+        if not target.accepts(data):
+            continue
+        job_data = classify_listed_job(job_id, data, inventories[target.name])
+        if job_data is not None:
+            wanted[target.name] = job_data
+    return wanted
+
+def iter_changed_jobs(jobs, targets: List[SyncTarget], inventories: Dict[str, Dict[str, Dict[str, str]]]):
+    """
+    যে চাকরিগুলো অন্তত একটি টার্গেটে নতুন বা পরিবর্তিত, সেগুলো data-তে 'targets' (plan_target_jobs) যোগ করে
+    ফেরত দেয়; বাকিগুলো এবং এই রানে আগেই পাওয়া (একাধিক পেজে থাকা) চাকরি বাদ যায়। ফলে একাধিক টার্গেট
+    থাকলেও প্রতিটি চাকরির বিস্তারিত একবারই আনা হয়।
+    """
+    seen = set()
+    for job_id, data in jobs:
+        if job_id in seen:
+            continue
+        seen.add(job_id)
+        
+        wanted = plan_target_jobs(job_id, data, targets, inventories)
+        if wanted:
+            yield job_id, dict(data, targets=wanted)
+
+def needs_fresh_details(data: Dict[str, Any]) -> bool:
+    """কোনো টার্গেটে হালনাগাদ ('update_post_id') হলে ক্যাশ এড়িয়ে বিস্তারিত নতুন করে আনতে হয়।"""
+    return any('update_post_id' in job_data for job_data in data.get('targets', {}).values())
+
+def company_key(company: Optional[str]) -> str:
+    """কোম্পানির ইতিহাসের কী: ছোট হাতের অক্ষর, ফাঁকা জায়গা একটি স্পেসে।"""
+    return ' '.join((company or '').lower().split())
+
+class JobPrescreener:
+    """
+    বিস্তারিত API কল করার আগে তালিকার তথ্য দিয়ে প্রাক-যাচাই। প্রতিটি কোম্পানির আগের যোগাযোগ যাচাই ফলাফল থেকে
+    Laplace-smoothed গ্রহণের হার স্কোর হিসেবে ধরা হয়: (গৃহীত + 1) / (মোট + 2); অচেনা কোম্পানির স্কোর 0.5।
+    - সাজানো: PRESCREEN_WINDOW আকারের ভাগে হালনাগাদ ও বেশি স্কোরের চাকরি আগে আনা হয় (সমান হলে তালিকার ক্রম)।
+    - স্থগিত: স্কোর PRESCREEN_SKIP_BELOW-এর নিচে হলে বিস্তারিত আনা PRESCREEN_RECHECK_DAYS দিনের জন্য স্থগিত হয়;
+      তারপর একবার আনা হয়, যাতে কোম্পানির ইতিহাস হালনাগাদ হওয়ার সুযোগ থাকে।
+    - বাজেট: DETAIL_CALL_BUDGET টি বিস্তারিত কলের পরে বাকি চাকরিগুলো পরের রানে যায়।
+    ইতিহাস ও স্থগিত তালিকা ক্যাশে থাকে (ক্যাশ না থাকলে শুধু এই রানের জন্য), এবং রানের ভেতরেও প্রতিটি নতুন
+    যাচাই ফলাফল থেকে শেখে। হালনাগাদ হওয়া (ইতিমধ্যে প্রকাশিত) চাকরি কখনো স্থগিত হয় না।
+    """
+    def __init__(self, cache: Optional[JobDetailCache] = None, today: Optional[date] = None):
+        self.cache = cache
+        self.today = today or date.today()
+        self.history: Dict[str, Tuple[int, int]] = cache.load_company_history() if cache else {}
+        self.postponed: Dict[str, date] = cache.load_postponed() if cache else {}
+        self.detail_calls = 0
+        self.skipped = {'postponed': 0, 'budget': 0}
+
+    def company_score(self, company: Optional[str]) -> float:
+        accepted, rejected = self.history.get(company_key(company), (0, 0))
+        return (accepted + 1) / (accepted + rejected + 2)
+
+    def sort_window(self, window: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
+        return sorted(window, key=lambda item: (not needs_fresh_details(item[1]), -self.company_score(item[1].get('company_name'))))
+
+    def _postpone(self, job_id: str, data: Dict[str, Any]) -> date:
+        recheck_on = self.today + timedelta(days=max(1, PRESCREEN_RECHECK_DAYS))
+        self.postponed[job_id] = recheck_on
+        end_date = parse_end_date_for_check(data.get('end_date_label'))
+        if self.cache and end_date:
+            self.cache.postpone(job_id, end_date, recheck_on)
+        return recheck_on
+
+    def skip_reason(self, job_id: str, data: Dict[str, Any]) -> Optional[str]:
+        """
+        ক্যাশে ফলাফল নেই এমন চাকরির বিস্তারিত আনার আগে ডাকা হয়: 'postponed' (স্থগিত), 'budget' (এই রানের
+        বাজেট শেষ) অথবা None — তখন বিস্তারিত আনতে হবে এবং কলটি বাজেটে গণনা হয়।
+        """
+        if not needs_fresh_details(data):
+            recheck_on = self.postponed.get(job_id)
+            if recheck_on is None and self.company_score(data.get('company_name')) < PRESCREEN_SKIP_BELOW:
+                recheck_on = self._postpone(job_id, data)
+            if recheck_on is not None and self.today < recheck_on:
+                self.skipped['postponed'] += 1
+                metrics.increment('jobs_postponed')
+                print(f"       ⏭️ প্রাক-যাচাই: এই কোম্পানির আগের পোস্টে যোগাযোগের তথ্য পাওয়া যায়নি; বিস্তারিত আনা "
+                      f"{recheck_on.strftime('%d-%m-%Y')} পর্যন্ত স্থগিত (ID: {job_id})।")
+                return 'postponed'
+        
+        if DETAIL_CALL_BUDGET and self.detail_calls >= DETAIL_CALL_BUDGET:
+            if not self.skipped['budget']:
+                print(f"   ⚠️ এই রানের বিস্তারিত API কলের বাজেট ({DETAIL_CALL_BUDGET}) শেষ; বাকি চাকরিগুলো পরের রানে আনা হবে।")
+            self.skipped['budget'] += 1
+            metrics.increment('jobs_deferred_budget')
+            return 'budget'
+        self.detail_calls += 1
+        return None
+
+    def record_outcome(self, data: Dict[str, Any], accepted: bool):
+        """নতুন করে আনা বিস্তারিতের যোগাযোগ যাচাই ফলাফল কোম্পানির ইতিহাসে যোগ করে।"""
+        company = company_key(data.get('company_name'))
+        if not company:
+            return
+        accepted_count, rejected_count = self.history.get(company, (0, 0))
+        self.history[company] = (accepted_count + int(accepted), rejected_count + int(not accepted))
+        if self.cache:
+            self.cache.record_company_outcome(company, accepted)
+
+    def report(self):
+        if self.skipped['postponed'] or self.skipped['budget']:
+            print(f"   🧮 প্রাক-যাচাই: {self.detail_calls} টি বিস্তারিত কল, {self.skipped['postponed']} টি স্থগিত, "
+                  f"{self.skipped['budget']} টি বাজেটের কারণে পরের রানে।")
+
+def iter_prescreened_jobs(jobs, prescreener: JobPrescreener):
+    """(job_id, data) জোড়াগুলো PRESCREEN_WINDOW আকারের ভাগে prescreener-এর স্কোর অনুযায়ী সাজিয়ে ফেরত দেয়।"""
+    if PRESCREEN_WINDOW <= 1:
+        yield from jobs
+        return
+    window = []
+    for item in jobs:
+        window.append(item)
+        if len(window) >= PRESCREEN_WINDOW:
+            yield from prescreener.sort_window(window)
+            window = []
+    yield from prescreener.sort_window(window)
+
+def lookup_screened_result(cache: Optional[JobDetailCache], journal: Optional[SyncJournal], job_id: str, data: Dict[str, Any]) -> Optional[Tuple[bool, Optional[Dict[str, str]]]]:
+    """
+    আগের যাচাই ফলাফল (গৃহীত কিনা, বিস্তারিত): অসমাপ্ত আগের রানের জার্নাল থেকে, নইলে ক্যাশ থেকে।
+    হালনাগাদ হওয়া চাকরির ক্ষেত্রে ক্যাশ এড়িয়ে যাওয়া হয়, তবে জার্নালের ফলাফল এই রানের জন্যই আনা বলে ব্যবহার হয়।
+    """
+    if journal and job_id in journal.screened:
+        metrics.increment('journal_screened_hits')
+        details = journal.screened[job_id]
+        return bool(details), details
+    cached = cache.get(job_id) if cache and not needs_fresh_details(data) else None
+    if cached is not None:
+        metrics.increment('detail_cache_hits')
+    return cached
+
+def store_screened_result(cache: Optional[JobDetailCache], job_id: str, data: Dict[str, Any], fetched: bool, screened: Optional[Dict[str, str]], journal: Optional[SyncJournal] = None, prescreener: Optional[JobPrescreener] = None):
+    # শুধুমাত্র সফলভাবে আনা ডেটার ফলাফল ক্যাশ করা হয়; নেটওয়ার্ক ত্রুটি পরের রানে আবার চেষ্টা হবে
+    if journal and fetched:
+        journal.record_screened(job_id, screened)
+    if prescreener and fetched:
+        prescreener.record_outcome(data, screened is not None)
+    end_date = parse_end_date_for_check(data.get('end_date_label'))
+    if cache and fetched and end_date:
+        cache.put(job_id, end_date, screened)
+
+def screened_job_entry(job_id: str, data: Dict[str, Any], fetched: bool, screened: Optional[Dict[str, str]]):
+    """(job_id, data, details_data) তৈরি করে; বাতিল হলে data-তে কারণও ('rejection_reason') যোগ হয়।"""
+    if screened is None:
+        data = dict(data, rejection_reason='invalid_contact_info' if fetched else 'detail_fetch_failed')
+    return job_id, data, screened
+
+def iter_screened_jobs(session: requests.Session, jobs, cache: Optional[JobDetailCache] = None, journal: Optional[SyncJournal] = None):
+    """
+    প্রতিটি চাকরির বিস্তারিত ডেটা সীমিত থ্রেড পুলে সংগ্রহ ও যাচাই করে (job_id, data, details_data) আকারে
+    তালিকার ক্রম অনুযায়ী ফেরত দেয়। একসাথে সর্বোচ্চ DETAIL_FETCH_WINDOW টি কাজ চলমান থাকে, তাই উপরের
+    তালিকা যত বড়ই হোক মেমোরি সীমিত থাকে। ক্যাশে আগের রানের ফলাফল থাকলে নেটওয়ার্ক কল এড়িয়ে যাওয়া হয়;
+    তবে কোনো টার্গেটে হালনাগাদ হওয়া চাকরির বিস্তারিত সবসময় নতুন করে আনা হয় (needs_fresh_details)।
+    অসমাপ্ত আগের রানের জার্নালে থাকা ফলাফল আবার আনা হয় না (lookup_screened_result)। বিস্তারিত আনার আগে
+    JobPrescreener চাকরিগুলো সম্ভাব্য গৃহীতগুলো আগে আসে এমনভাবে সাজায় এবং সম্ভাব্য বাতিল বা বাজেটের বাইরের
+    চাকরিগুলো বাদ দেয় (এগুলো এই রানে ফেরত আসে না)।
+    """
+    prescreener = JobPrescreener(cache)
+    workers = max(1, DETAIL_FETCH_WORKERS)
+    window = DETAIL_FETCH_WINDOW if DETAIL_FETCH_WINDOW > 0 else workers * 2
+
+    html_pool = get_html_process_pool()
+
+    def fetch_and_screen(job_id: str):
+        details = fetch_job_detail_payload(session, job_id)
+        if not details:
+            return False, None
+        normalized = html_pool.submit(normalize_job_details, details, True).result() if html_pool else None
+        return True, screen_job_details(job_id, details, normalized)
+
+    def finish(entry):
+        job_id, data, future, cached = entry
+        if future is None:
+            return screened_job_entry(job_id, data, True, cached)
+        fetched, screened = future.result()
+        store_screened_result(cache, job_id, data, fetched, screened, journal, prescreener)
+        return screened_job_entry(job_id, data, fetched, screened)
+
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for job_id, data in iter_prescreened_jobs(jobs, prescreener):
+                cached = lookup_screened_result(cache, journal, job_id, data)
+                if cached is None:
+                    if prescreener.skip_reason(job_id, data):
+                        continue
+                    in_flight.append((job_id, data, executor.submit(fetch_and_screen, job_id), None))
+                else:
+                    in_flight.append((job_id, data, None, cached[1]))
+                
+                while len(in_flight) >= window:
+                    yield finish(in_flight.popleft())
+            
+            while in_flight:
+                yield finish(in_flight.popleft())
+            prescreener.report()
+        finally:
+            for _, _, future, _ in in_flight:
+                if future is not None:
+                    future.cancel()
+
+# =========================================================
+# পোস্ট রেন্ডারিং (টেমপ্লেট ও HTML পরিষ্কারকরণ)
+# =========================================================
+
+# bdjobs HTML থেকে বাদ দেওয়া হবে এমন অ্যাট্রিবিউট ও র‍্যাপার ট্যাগ (লেখা রেখে শুধু ট্যাগ মুছে যায়)
+_HTML_COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.S)
+_HTML_WRAPPER_TAG_PATTERN = re.compile(r'</?(?:font|span|o:p)\b[^>]*>', re.I)
+_HTML_ATTR_TAG_PATTERN = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)\s([^>]*)>')
+_HTML_BLOATED_ATTR_PATTERN = re.compile(
+    r'\s(?:style|class|id|lang|dir|align|face|size|color|width|height|valign|data-[\w-]+)\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+)',
+    re.I,
+)
+_HTML_EMPTY_TAG_PATTERN = re.compile(
+    r'<(p|div|strong|b|i|em|u|li|ul|ol|h[1-6])>(?:\s|&nbsp;|<br\s*/?>)*</\1>', re.I
+)
+_HTML_BLOCK_LEADING_SPACE_PATTERN = re.compile(r' (?=</?(?:p|div|ul|ol|li|br|hr|h[1-6]|table|tr|td|th)\b)', re.I)
+_HTML_BLOCK_TRAILING_SPACE_PATTERN = re.compile(r'(</?(?:p|div|ul|ol|li|br|hr|h[1-6]|table|tr|td|th)\b[^>]*>) ', re.I)
+_HTML_NBSP_RUN_PATTERN = re.compile(r'&nbsp;(?:\s*&nbsp;)+')
+
+def _strip_bloated_attributes(match) -> str:
+    attributes = _HTML_BLOATED_ATTR_PATTERN.sub('', ' ' + match.group(2)).strip()
+    return f"<{match.group(1)} {attributes}>" if attributes else f"<{match.group(1)}>"
+
+@functools.lru_cache(maxsize=1024)
+def sanitize_job_html(html_content: Optional[str]) -> str:
+    """
+    bdjobs-এর HTML ছোট করে: কমেন্ট, font/span র‍্যাপার, style/class-জাতীয় অ্যাট্রিবিউট ও খালি ট্যাগ বাদ দেয়
+    এবং অপ্রয়োজনীয় ফাঁকা জায়গা সংকুচিত করে। লেখা ও লিংক (href) অপরিবর্তিত থাকে।
+    একই কোম্পানির পোস্টে বারবার আসা একই নির্দেশনা/শর্তের জন্য ক্যাশ করা ফলাফল ব্যবহার হয়।
+    """
+    if not html_content:
+        return ""
+    if '<!--' in html_content:
+        html_content = _HTML_COMMENT_PATTERN.sub('', html_content)
+    html_content = _HTML_WRAPPER_TAG_PATTERN.sub('', html_content)
+    html_content = _HTML_ATTR_TAG_PATTERN.sub(_strip_bloated_attributes, html_content)
+    html_content = _HTML_NBSP_RUN_PATTERN.sub(' ', html_content)
+    # বাংলা লেখায় রেগুলার এক্সপ্রেশনের চেয়ে str.split() অনেক দ্রুত সব ধরনের ফাঁকা জায়গা সংকুচিত করে
+    html_content = ' '.join(html_content.split())
+    html_content = _HTML_BLOCK_LEADING_SPACE_PATTERN.sub('', html_content)
+    html_content = _HTML_BLOCK_TRAILING_SPACE_PATTERN.sub(r'\1', html_content)
+    # <ul><li></li></ul>-এর মতো নেস্টেড খালি ট্যাগ এক ধাপে মোছে না, তাই পরিবর্তন থামা পর্যন্ত চালানো হয়
+    while True:
+        html_content, removed = _HTML_EMPTY_TAG_PATTERN.subn('', html_content)
+        if not removed:
+            break
+    return html_content.strip()
+
+# ফিড রিডার ও ইমেইল <style> ব্লক বাদ দেয়, তাই জরুরি স্টাইল (ডেডলাইন বক্স, শিরোনাম, লাল সতর্কতা) inline থাকে;
+# শুধু বোল্ডের জন্য style-এর বদলে <b> ব্যবহার হয়
+POST_HEADING = '<h3 style="color:#007456">'
+
+# পোস্টের টেমপ্লেট একবারই কম্পাইল হয়; প্রতিটি পোস্টে শুধু মান বসানো হয়
+POST_TEMPLATE = Template(
+    '<div style="padding:15px;border:1px solid #c00;background-color:#ffe0e0">'
+    '<h3 style="color:#c00;margin-top:0">আবেদনের শেষ তারিখ</h3>'
+    '<p style="font-weight:bold;color:#c00">$end_date (সকাল ০৬:০০ টা পর্যন্ত)</p></div><hr/>'
+    + POST_HEADING + 'চাকরির সংক্ষিপ্ত তথ্য</h3>'
+    '<p><b>কাজের স্থান (Workplace):</b> $workplace</p>'
+    '<p><b>কর্মসংস্থান অবস্থা (Employment Status):</b> $job_nature</p>'
+    '<p><b>বেতন সীমা (Salary):</b> $salary_range</p>'
+    '<p><b>চাকরির অবস্থান (Job Location):</b> $job_location</p><hr/>'
+    + POST_HEADING + 'দায়িত্ব ও প্রেক্ষাপট (Job Context and Responsibilities)</h3>$job_description<hr/>'
+    + POST_HEADING + 'যোগ্যতা ও অভিজ্ঞতা</h3>'
+    '<p><b>শিক্ষাগত যোগ্যতা (Education):</b></p>$education'
+    '<p><b>অভিজ্ঞতা (Experience):</b></p>$experience'
+    '<p><b>অতিরিক্ত প্রয়োজন (Additional Requirements):</b></p>$additional_req<hr/>'
+    + POST_HEADING + 'আবেদনের প্রক্রিয়া ও যোগাযোগ</h3>'
+    '<p style="font-weight:bold;color:#c00">আবেদন করার আগে পড়ুন:</p>$read_before_apply'
+    '<p><b>সম্পূর্ণ প্রক্রিয়া:</b></p>$apply_instruction<hr/>'
+    '<p><b>সরাসরি আবেদনের লিঙ্ক: <a href="$apply_url" target="_blank">Bdjobs-এ আবেদন/বিস্তারিত দেখতে ক্লিক করুন</a></b></p>'
+    '<p><b>যোগাযোগের ইমেইল (যদি থাকে): $apply_email</b></p>'
+)
+
+def render_post_content(end_date_label: str, details_data: Dict[str, str]) -> str:
+    """
+    কম্পাইল করা টেমপ্লেটে বিস্তারিত ডেটা বসিয়ে পোস্টের HTML তৈরি করে। যাচাইয়ের সময় sanitize হয়নি এমন
+    (পুরনো ক্যাশের) HTML ফিল্ডগুলো এখানে পরিষ্কার করা হয়।
+    """
+    sanitize = (lambda html_content: html_content or "") if details_data.get('html_sanitized') else sanitize_job_html
+    return POST_TEMPLATE.substitute(
+        end_date=end_date_label,
+        workplace=details_data['workplace'],
+        job_nature=details_data['job_nature'],
+        salary_range=details_data['salary_range'],
+        job_location=details_data['job_location'],
+        job_description=sanitize(details_data['job_description_html']),
+        education=sanitize(details_data['education']),
+        experience=sanitize(details_data['experience']),
+        additional_req=sanitize(details_data['additional_req']),
+        read_before_apply=sanitize(details_data['read_before_apply_html']),
+        apply_instruction=sanitize(details_data['apply_instruction_html']),
+        apply_url=details_data['apply_url'],
+        apply_email=details_data['apply_email'],
+    )
+
+def build_post_body(job_id: str, data: Dict[str, Any], details_data: Dict[str, str], labels: Tuple[str, ...] = DEFAULT_POST_LABELS) -> Dict[str, Any]:
+    """তালিকা ও বিস্তারিত ডেটা থেকে ব্লগারে পাঠানোর পোস্ট বডি তৈরি করে।"""
+    final_end_date_label = data['end_date_label']
+    
+    # লেবেল তৈরি
+    post_labels = [*labels, data['company_name']]
+    post_labels.append(f"{JOB_ID_LABEL_PREFIX}{job_id}")
+    post_labels.append(f"{END_DATE_LABEL_PREFIX}{final_end_date_label}")
+    post_labels.append(f"{CONTENT_HASH_LABEL_PREFIX}{job_fingerprint(data)}")
+
+    post_body = {
+        'kind': 'blogger#post',
+        'title': data['title'],
+        'content': render_post_content(final_end_date_label, details_data),
+        'labels': post_labels,
+        'isDraft': False
+    }
+    return post_body
+
+@timed_stage('render_posts')
+def build_post_bodies(entries: List[Tuple[str, Dict[str, Any], Dict[str, str]]], labels: Tuple[str, ...] = DEFAULT_POST_LABELS) -> List[Dict[str, Any]]:
+    """একটি ব্যাচের সব (job_id, data, details_data) একসাথে রেন্ডার করে পোস্ট বডির তালিকা ফেরত দেয়।"""
+    return [build_post_body(job_id, data, details_data, labels) for job_id, data, details_data in entries]
+
+
+# =========================================================
+# বিস্তারিত HTML নর্মালাইজেশন (ব্যাচ ও প্রসেস পুল)
+# =========================================================
+
+# যোগাযোগ যাচাই ও পোস্টে ব্যবহৃত বিস্তারিত API-র HTML ফিল্ড
+DETAIL_HTML_FIELDS = (
+    'JobDescription', 'EducationRequirements', 'experience', 'AdditionJobRequirements',
+    'RecruitmentProcessingInformation', 'ApplyInstruction', 'ApplyEmail',
+)
+
+class NormalizedDetails(NamedTuple):
+    """একটি চাকরির HTML ফিল্ডগুলোর পরিষ্কার টেক্সট ও sanitize করা HTML, সাথে টেক্সটে পাওয়া যোগাযোগের তথ্য।"""
+    text: Dict[str, str]
+    html: Dict[str, str]
+    contacts: List[ContactMatch]
+
+def normalize_job_details(details: Dict[str, Any], skip_rejected_html: bool = False) -> NormalizedDetails:
+    """
+    একটি চাকরির সব HTML ফিল্ড একবারে নর্মালাইজ করে: রেগুলার এক্সপ্রেশনভিত্তিক দ্রুত টেক্সট (যোগাযোগ স্ক্যানের জন্য)
+    এবং পোস্টের জন্য sanitize_job_html। skip_rejected_html দিলে যোগাযোগ যাচাইয়ে বাতিল চাকরির HTML তৈরি হয় না।
+    কিছু প্রিন্ট বা মেট্রিক্সে লেখে না, তাই প্রসেস পুলেও চালানো যায়।
+    """
+    text = {field: html_to_clean_text(details.get(field)) for field in DETAIL_HTML_FIELDS}
+    contacts = scan_contact_text(text)
+    html: Dict[str, str] = {}
+    if not (skip_rejected_html and contact_rejection_reason(contacts)):
+        html = {field: sanitize_job_html(details.get(field)) for field in DETAIL_HTML_FIELDS}
+    return NormalizedDetails(text, html, contacts)
+
+_html_process_pool: Optional[ProcessPoolExecutor] = None
+
+def get_html_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    HTML_NORMALIZE_PROCESSES > 1 হলে নর্মালাইজেশনের প্রসেস পুল (একবারই তৈরি হয়) ফেরত দেয়, নইলে None।
+    প্রথমবার একটি খালি কাজ পাঠিয়ে প্রসেসগুলো তখনই চালু করা হয়, যাতে থ্রেড চালুর পরে fork করতে না হয়।
+    """
+    global _html_process_pool
+    if HTML_NORMALIZE_PROCESSES <= 1:
+        return None
+    if _html_process_pool is None:
+        _html_process_pool = ProcessPoolExecutor(max_workers=HTML_NORMALIZE_PROCESSES)
+        _html_process_pool.submit(int).result()
+    return _html_process_pool
+
+def shutdown_html_process_pool():
+    global _html_process_pool
+    if _html_process_pool is not None:
+        _html_process_pool.shutdown(cancel_futures=True)
+        _html_process_pool = None
+
+@timed_stage('normalize_job_details_batch')
+def normalize_job_details_batch(details_list: List[Dict[str, Any]], processes: Optional[int] = None, skip_rejected_html: bool = False) -> List[NormalizedDetails]:
+    """
+    অনেকগুলো চাকরির বিস্তারিত একসাথে নর্মালাইজ করে (ক্রম অপরিবর্তিত)। processes > 1 হলে প্রসেস পুলে
+    বড় chunk আকারে পাঠানো হয়, যাতে প্রতি চাকরির জন্য আলাদা প্রসেস-যোগাযোগের খরচ না লাগে।
+    """
+    processes = HTML_NORMALIZE_PROCESSES if processes is None else processes
+    worker = functools.partial(normalize_job_details, skip_rejected_html=skip_rejected_html)
+    if processes <= 1 or len(details_list) < 2:
+        return [worker(details) for details in details_list]
+    chunksize = max(1, len(details_list) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(worker, details_list, chunksize=chunksize))
+
 
 # =========================================================
 # ধাপ ৩, ৪, ৫: ব্লগার ফেচিং, ডিলিট এবং অ্যাডিশন লজিক
-# (অপরিবর্তিত)
 # =========================================================
 
-def fetch_blogger_posts(service: Any, blog_id: str) -> Dict[str, Dict[str, str]]:
+def get_http_status(error: Any) -> Optional[int]:
+    """googleapiclient HttpError থেকে HTTP স্ট্যাটাস কোড বের করে।"""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    return int(status) if status is not None else None
+
+def is_rate_limit_error(error: Any) -> bool:
+    status = get_http_status(error)
+    if status == 429:
+        return True
+    if status == 403:
+        content = getattr(error, 'content', b'') or b''
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='ignore')
+        return 'rateLimitExceeded' in content or 'userRateLimitExceeded' in content
+    return False
+
+def get_error_retry_after(error: Any) -> Optional[float]:
+    """googleapiclient HttpError-এর Retry-After হেডার (থাকলে) সেকেন্ডে।"""
+    resp = getattr(error, 'resp', None)
+    return parse_retry_after(resp.get('retry-after')) if hasattr(resp, 'get') else None
+
+def execute_blogger_batch(service: Any, operations: List[Tuple[str, Any]]) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    (key, রিকোয়েস্ট তৈরির ফাংশন) তালিকার মিউটেশনগুলো BLOGGER_BATCH_SIZE আকারের মাল্টিপার্ট ব্যাচে পাঠায়।
+    প্রতিটি রিকোয়েস্টের ফলাফল আলাদা কলব্যাকে ধরা হয়; 429/403 rateLimitExceeded পেলে শুধু সেগুলো আবার
+    পাঠানো হয়। প্রতিটি ব্যাচ 'blogger' এন্ডপয়েন্টের অ্যাডাপ্টিভ রেট লিমিটার (প্রতি পোস্টে একটি টোকেন) মেনে
+    যায়, তাই রেট লিমিটে রেট কমে ও Retry-After/ব্যাকঅফ মানা হয়, আর সফল ব্যাচে রেট আবার বাড়ে।
+    ফলাফল: key -> (response, error)
+    """
+    results: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = {}
+    attempts: Dict[str, int] = {}
+    pending = list(operations)
+    batch_size = max(1, BLOGGER_BATCH_SIZE)
+    limiter = rate_limits.get('blogger')
+
+    while pending:
+        chunk, pending = pending[:batch_size], pending[batch_size:]
+        throttled: List[str] = []
+        retry_after: List[float] = []
+
+        def callback(request_id, response, exception):
+            if exception is not None and is_rate_limit_error(exception) and attempts.get(request_id, 0) < BLOGGER_MAX_RETRIES:
+                throttled.append(request_id)
+                delay = get_error_retry_after(exception)
+                if delay is not None:
+                    retry_after.append(delay)
+            else:
+                results[request_id] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=callback)
+        for key, make_request in chunk:
+            batch.add(make_request(), request_id=key)
+        metrics.increment('blogger_batches')
+        metrics.increment('blogger_batch_items', len(chunk))
+
+        limiter.wait(len(chunk))
+        try:
+            batch.execute()
+        except Exception as e:
+            # পুরো ব্যাচ ব্যর্থ হলে (যেমন নেটওয়ার্ক ত্রুটি) যেগুলোর ফলাফল আসেনি সেগুলো ব্যর্থ ধরা হয়
+            for key, _ in chunk:
+                if key not in results and key not in throttled:
+                    if is_rate_limit_error(e) and attempts.get(key, 0) < BLOGGER_MAX_RETRIES:
+                        throttled.append(key)
+                    else:
+                        results[key] = (None, e)
+
+        if throttled:
+            for key in throttled:
+                attempts[key] = attempts.get(key, 0) + 1
+            pending = [op for op in chunk if op[0] in throttled] + pending
+            pause = limiter.record_throttle(max(retry_after) if retry_after else None)
+            metrics.increment('blogger_retries', len(throttled))
+            print(f"       ⏸️ রেট লিমিট: {len(throttled)} টি রিকোয়েস্ট {pause:.1f} সেকেন্ড পরে আবার পাঠানো হবে "
+                  f"(নতুন রেট: {limiter.rate:.1f} পোস্ট/সেকেন্ড)...")
+        else:
+            limiter.record_success()
+
+    return results
+
+def get_blogger_snapshot_path(blog_id: str) -> str:
+    return BLOGGER_SNAPSHOT_PATH.format(blog_id=blog_id) if BLOGGER_SNAPSHOT_PATH else ''
+
+def load_blogger_snapshot(blog_id: str) -> Optional[Dict[str, Any]]:
+    """আগের রানের ব্লগার ইনভেন্টরি স্ন্যাপশট লোড করে; না থাকলে বা পড়া না গেলে None।"""
+    path = get_blogger_snapshot_path(blog_id)
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if snapshot.get('blog_id') != blog_id or 'posts' not in snapshot:
+            return None
+        return snapshot
+    except Exception as e:
+        print(f"   ⚠️ ব্লগার স্ন্যাপশট পড়া যায়নি, সম্পূর্ণ তালিকা আনা হবে: {e}")
+        return None
+
+def save_blogger_snapshot(blog_id: str, published_jobs: Dict[str, Dict[str, str]], synced_at: Optional[str] = None, full_synced_at: Optional[str] = None):
+    """
+    ব্লগার ইনভেন্টরি স্ন্যাপশট লিখে রাখে। synced_at/full_synced_at না দিলে আগের স্ন্যাপশটের মানই থাকে
+    (ডিলিট/অ্যাডিশনের পরে শুধু পোস্টের তালিকা হালনাগাদ করার জন্য)।
+    """
+    path = get_blogger_snapshot_path(blog_id)
+    if not path:
+        return
+    previous = load_blogger_snapshot(blog_id) or {}
+    synced_at = synced_at or previous.get('synced_at')
+    full_synced_at = full_synced_at or previous.get('full_synced_at')
+    if not synced_at or not full_synced_at:
+        # সফল তালিকা সংগ্রহের রেকর্ড না থাকলে স্ন্যাপশট লেখা নিরাপদ নয়
+        return
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'blog_id': blog_id,
+            'synced_at': synced_at,
+            'full_synced_at': full_synced_at,
+            'posts': published_jobs,
+            'deadline_index': published_jobs.deadline_entries() if isinstance(published_jobs, BloggerInventory) else None,
+        }, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+def list_blogger_posts(service: Any, blog_id: str, published_since: Optional[str] = None, label: str = DEFAULT_LIST_LABEL):
+    """
+    nextPageToken অনুসরণ করে `label` যুক্ত সমস্ত পোস্ট পেজ আকারে আনে; `fields` দিয়ে শুধু id, title ও labels চাওয়া হয়।
+    published_since দিলে ব্লগারের startDate দিয়ে শুধু ওই সময়ের পরে প্রকাশিত পোস্টগুলো আসে। startDate প্রকাশের
+    তারিখে ফিল্টার করে, তাই আগে প্রকাশিত পোস্টের হালনাগাদ বা মুছে ফেলা এই তালিকায় আসে না।
+    """
+    page_token = None
+    while True:
+        params = {
+            'blogId': blog_id,
+            'fetchBodies': False,
+            'fetchImages': False,
+            'maxResults': BLOGGER_LIST_PAGE_SIZE,
+            'labels': label,
+            'fields': 'nextPageToken,items(id,title,labels)',
+        }
+        if published_since:
+            params['startDate'] = published_since
+        if page_token:
+            params['pageToken'] = page_token
+
+        response = service.posts().list(**params).execute()
+        metrics.increment('blogger_list_calls')
+        for post in response.get('items', []):
+            yield post
+
+        page_token = response.get('nextPageToken')
+        if not page_token:
+            break
+
+@timed_stage('fetch_blogger_posts')
+def fetch_blogger_posts(service: Any, blog_id: str, list_label: str = DEFAULT_LIST_LABEL, full_refresh: bool = False) -> Dict[str, Dict[str, str]]:
     print("\n▶️ ধাপ ১: ব্লগার থেকে বর্তমান পোস্টের তালিকা সংগ্রহ শুরু...")
-    published_jobs: Dict[str, Dict[str, str]] = {}
+    published_jobs = BloggerInventory()
+    
+    now = datetime.now(timezone.utc)
+    snapshot = load_blogger_snapshot(blog_id)
+    published_since = None
+    full_synced_at = now.isoformat(timespec='seconds')
+    
+    if snapshot and snapshot.get('synced_at') and snapshot.get('full_synced_at') and not full_refresh:
+        snapshot_age = now - datetime.fromisoformat(snapshot['full_synced_at'])
+        if snapshot_age < timedelta(hours=BLOGGER_FULL_REFRESH_HOURS):
+            published_jobs = BloggerInventory(snapshot['posts'], snapshot.get('deadline_index'))
+            full_synced_at = snapshot['full_synced_at']
+            # ডেল্টায় শুধু নতুন প্রকাশিত পোস্ট আসে; স্ক্রিপ্টের বাইরে মুছে ফেলা পোস্ট পরের সম্পূর্ণ তালিকা পর্যন্ত
+            # স্ন্যাপশটে থেকে যায়, তাই ডিলিট ও patch-এর 404 আলাদাভাবে সামলানো হয়। ঘড়ির পার্থক্যের জন্য কিছুটা আগে থেকে চাওয়া হয়
+            since = datetime.fromisoformat(snapshot['synced_at']) - timedelta(minutes=10)
+            published_since = since.strftime('%Y-%m-%dT%H:%M:%SZ')
+            print(f"   💾 স্ন্যাপশট থেকে {len(published_jobs)} টি পোস্ট লোড হয়েছে; শুধু {published_since} এর পরে প্রকাশিত পোস্ট আনা হবে।")
     
     try:
-        response = service.posts().list(blogId=blog_id, fetchBodies=False, maxResults=500, labels='প্রাইভেট চাকরি').execute()
-        posts = response.get('items', [])
-
-        for post in posts:
+        for post in list_blogger_posts(service, blog_id, published_since, list_label):
             post_labels = post.get('labels', [])
             job_id = None
             end_date = None
+            content_hash = None
             
             for label in post_labels:
                 if label.startswith(JOB_ID_LABEL_PREFIX):
                     job_id = label[len(JOB_ID_LABEL_PREFIX):].strip()
                 elif label.startswith(END_DATE_LABEL_PREFIX):
                     end_date = label[len(END_DATE_LABEL_PREFIX):].strip()
+                elif label.startswith(CONTENT_HASH_LABEL_PREFIX):
+                    content_hash = label[len(CONTENT_HASH_LABEL_PREFIX):].strip()
             
             if job_id:
                 published_jobs[job_id] = {
                     'post_id': post['id'],
                     'title': post['title'],
-                    'end_date': end_date
+                    'end_date': end_date,
+                    'content_hash': content_hash
                 }
+        
+        save_blogger_snapshot(blog_id, published_jobs, synced_at=now.isoformat(timespec='seconds'), full_synced_at=full_synced_at)
 
     except Exception as e:
         print(f"❌ ব্লগার API থেকে ডেটা আনা ব্যর্থ হয়েছে: {e}")
@@ -372,7 +1834,12 @@ def fetch_blogger_posts(service: Any, blog_id: str) -> Dict[str, Dict[str, str]]
     print(f"✅ ব্লগার থেকে সংগ্রহ সম্পন্ন। মোট {len(published_jobs)} টি {JOB_ID_LABEL_PREFIX[:-1]} যুক্ত পোস্ট পাওয়া গেছে।")
     return published_jobs
 
-def perform_deletion(service: Any, blog_id: str, blogger_posts: Dict[str, Dict[str, str]]):
+@timed_stage('perform_deletion')
+def perform_deletion(service: Any, blog_id: str, blogger_posts: Dict[str, Dict[str, str]], target_plan: Optional[Dict[str, Any]] = None, journal: Optional[SyncJournal] = None):
+    """
+    মেয়াদ উত্তীর্ণ পোস্টগুলো ব্যাচে ডিলিট করে। target_plan দিলে (পরিকল্পনা মোড) ব্লগারে কিছু না পাঠিয়ে
+    পোস্টগুলো শুধু পরিকল্পনার 'to_delete' তালিকায় লেখা হয়।
+    """
     print("\n▶️ ধাপ ৪: ডিলিট প্রক্রিয়া শুরু (মেয়াদ উত্তীর্ণ পোস্ট)...")
     
     ids_to_delete = []
@@ -381,151 +1848,836 @@ def perform_deletion(service: Any, blog_id: str, blogger_posts: Dict[str, Dict[s
     
     print(f"   🗑️ ডিলিট করার কাট-অফ ডেট: **{deletion_cutoff_date.strftime('%d-%m-%Y')}** (এই তারিখ বা এর আগে মেয়াদ শেষ হওয়া পোস্ট ডিলিট হবে)।")
     
+    # ডেডলাইন ইনডেক্স থেকে শুধু মেয়াদ উত্তীর্ণ এন্ট্রিগুলোই তোলা হয় (পুরো ইনভেন্টরি স্ক্যান ছাড়া)
+    inventory = blogger_posts if isinstance(blogger_posts, BloggerInventory) else BloggerInventory(blogger_posts)
     
-    for job_id, post_data in blogger_posts.items():
-        is_expired = False
-        
-        if post_data.get('end_date'):
-            post_end_date = parse_end_date_for_check(post_data['end_date'])
-            
-            if post_end_date and post_end_date <= deletion_cutoff_date:
-                is_expired = True
-
-        if is_expired:
-            ids_to_delete.append(post_data['post_id'])
-            end_date_str = post_end_date.strftime('%d-%m-%Y') if post_end_date else 'N/A'
-            print(f"       - ডিলিটের জন্য চিহ্নিত: ID {job_id} (End Date: {end_date_str})")
+    for job_id, post_data, post_end_date in inventory.pop_expired(deletion_cutoff_date):
+        ids_to_delete.append((job_id, post_data['post_id']))
+        print(f"       - ডিলিটের জন্য চিহ্নিত: ID {job_id} (End Date: {format_label_date(post_end_date)})")
+        if target_plan is not None:
+            target_plan['to_delete'].append({'job_id': job_id, 'post_id': post_data['post_id'], 'end_date': post_data.get('end_date')})
 
-    if ids_to_delete:
+    if target_plan is not None:
+        print(f"   📝 পরিকল্পনা মোড: {len(ids_to_delete)} টি পোস্ট ডিলিটের তালিকায় রাখা হলো (ব্লগারে কিছু পাঠানো হয়নি)।")
+    elif ids_to_delete:
         print(f"   🗑️ মোট **{len(ids_to_delete)}** টি মেয়াদ উত্তীর্ণ Bdjobs পোস্ট ডিলিট করা হবে।")
-        for post_id in ids_to_delete:
-            try:
-                service.posts().delete(blogId=blog_id, postId=post_id).execute()
+        operations = [
+            (post_id, lambda post_id=post_id: service.posts().delete(blogId=blog_id, postId=post_id))
+            for _, post_id in ids_to_delete
+        ]
+        if journal:
+            journal.record_intents(blog_id, [('delete', job_id, post_id) for job_id, post_id in ids_to_delete])
+        results = execute_blogger_batch(service, operations)
+        
+        for job_id, post_id in ids_to_delete:
+            _, error = results.get(post_id, (None, None))
+            if error is None:
                 print(f"       - পোস্ট ID {post_id} ডিলিট সম্পন্ন।")
-                time.sleep(DELAY_AFTER_OPERATION)
-            except Exception as e:
-                print(f"       ❌ ডিলিট ব্যর্থ হয়েছে: পোস্ট ID {post_id}. ত্রুটি: {e}")
+                blogger_posts.pop(job_id, None)
+            elif get_http_status(error) == 404:
+                # ব্লগারে আগেই মুছে ফেলা হয়েছে; স্ন্যাপশট থেকেও সরিয়ে দেওয়া হলো
+                print(f"       - পোস্ট ID {post_id} আগেই মুছে ফেলা হয়েছে।")
+                blogger_posts.pop(job_id, None)
+            else:
+                print(f"       ❌ ডিলিট ব্যর্থ হয়েছে: পোস্ট ID {post_id}. ত্রুটি: {error}")
+                inventory.restore(job_id)
+                if journal and get_http_status(error) is not None:
+                    journal.record_result(blog_id, 'delete', job_id, committed=False)
+                continue
+            if journal:
+                journal.record_result(blog_id, 'delete', job_id)
     else:
         print("   ✅ jobs এর কোনো মেয়াদ উত্তীর্ণ পোস্ট ডিলিট করার মতো পাওয়া যায়নি।")
         
-def perform_addition(service: Any, blog_id: str, target_posts: Dict[str, Dict[str, str]], blogger_posts: Dict[str, Dict[str, str]]):
-    print("\n▶️ ধাপ ৫: নতুন পোস্ট প্রকাশের লজিক শুরু...")
-    
-    titles_to_add = {id: data for id, data in target_posts.items() if id not in blogger_posts}
+class PostPublisher:
+    """
+    যাচাই করা চাকরিগুলো বাফারে রাখে এবং BLOGGER_BATCH_SIZE পূর্ণ হলে অথবা প্রথম পোস্ট বাফারে আসার
+    PUBLISH_FLUSH_SECONDS পর ব্যাচ আকারে প্রকাশ করে, যাতে সম্পূর্ণ তালিকার জন্য অপেক্ষা করতে না হয়।
+    নতুন চাকরি insert হয়; 'update_post_id' থাকা চাকরির বিদ্যমান পোস্ট একই ব্যাচে patch করা হয়।
+    """
+    def __init__(self, service: Any, blog_id: str, blogger_posts: Dict[str, Dict[str, str]], labels: Tuple[str, ...] = DEFAULT_POST_LABELS, journal: Optional[SyncJournal] = None):
+        self.service = service
+        self.blog_id = blog_id
+        self.blogger_posts = blogger_posts
+        self.labels = labels
+        self.journal = journal
+        self.stats = {'candidates': 0, 'published': 0, 'updated': 0, 'rejected': 0, 'failed': 0}
+        self._pending: List[Tuple[str, Dict[str, Any], Dict[str, str]]] = []
+        self._buffer_started = 0.0
 
-    session = requests.Session()
+    def add(self, job_id: str, data: Dict[str, Any], details_data: Optional[Dict[str, str]]) -> bool:
+        """একটি যাচাই করা চাকরি বাফারে যোগ করে; ব্যাচ প্রকাশের সময় হলে True ফেরত দেয় (তখন flush() ডাকতে হবে)।"""
+        self.stats['candidates'] += 1
+        
+        if not details_data:
+            # হালনাগাদের ক্ষেত্রে বিদ্যমান পোস্টটি যেমন আছে তেমনই থাকে
+            print(f"       ❌ এই পোস্টটিতে পর্যাপ্ত যোগাযোগের তথ্য না থাকায় এড়িয়ে যাওয়া হলো: {data['title']}.")
+            self.stats['rejected'] += 1
+            # বাতিল চাকরির সময়ও সময়সীমা যাচাই হয়, যাতে বাফারের পোস্ট একটানা বাতিলের পেছনে আটকে না থাকে
+            return self.due()
+        
+        self._pending.append((job_id, data, details_data))
+        if len(self._pending) == 1:
+            self._buffer_started = time.monotonic()
+        return self.due()
+
+    def due(self) -> bool:
+        """বাফারে পোস্ট আছে এবং ব্যাচ পূর্ণ অথবা প্রথম পোস্ট আসার PUBLISH_FLUSH_SECONDS পার হয়েছে।"""
+        if not self._pending:
+            return False
+        return len(self._pending) >= BLOGGER_BATCH_SIZE or time.monotonic() - self._buffer_started >= PUBLISH_FLUSH_SECONDS
 
-    if titles_to_add:
-        print(f"\n   ✍️ মোট **{len(titles_to_add)}** টি নতুন পোস্ট প্রকাশ করা শুরু হচ্ছে...")
+    def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        service, blog_id = self.service, self.blog_id
         
-        posts_to_add_sorted = sorted(titles_to_add.items(), key=lambda item: item[1]['page_order'])
+        print(f"   📤 {len(pending)} টি পোস্ট ব্যাচ আকারে প্রকাশ করা হচ্ছে...")
+        post_bodies = build_post_bodies(pending, self.labels)
+        metrics.increment('post_content_bytes', sum(len(body['content'].encode('utf-8')) for body in post_bodies))
+        operations = []
+        for (job_id, data, _), post_body in zip(pending, post_bodies):
+            post_id = data.get('update_post_id')
+            if post_id:
+                patch_body = {key: post_body[key] for key in ('title', 'content', 'labels')}
+                operations.append((job_id, lambda post_id=post_id, patch_body=patch_body: service.posts().patch(blogId=blog_id, postId=post_id, body=patch_body)))
+            else:
+                operations.append((job_id, lambda post_body=post_body: service.posts().insert(blogId=blog_id, body=post_body)))
+        if self.journal:
+            self.journal.record_intents(blog_id, [
+                ('patch' if data.get('update_post_id') else 'insert', job_id, data.get('update_post_id'))
+                for job_id, data, _ in pending
+            ])
+        results = execute_blogger_batch(service, operations)
         
-        last_post_was_successful = False
+        for job_id, data, _ in pending:
+            response, error = results.get(job_id, (None, None))
+            op = 'patch' if data.get('update_post_id') else 'insert'
+            if error is None and response:
+                if op == 'patch':
+                    print(f"       🔄 সফলভাবে হালনাগাদ: {data['title']}")
+                    self.stats['updated'] += 1
+                else:
+                    print(f"       ✅ সফলভাবে প্রকাশিত: {data['title']}")
+                    metrics.mark_once('first_post_published_s')
+                    self.stats['published'] += 1
+                self.blogger_posts[job_id] = {
+                    'post_id': response.get('id') or data.get('update_post_id'),
+                    'title': data['title'],
+                    'end_date': data['end_date_label'],
+                    'content_hash': job_fingerprint(data)
+                }
+                if self.journal:
+                    self.journal.record_result(blog_id, op, job_id, self.blogger_posts[job_id])
+            else:
+                print(f"       ❌ API ERROR: পোস্ট করার সময় ব্যর্থ: {data['title']}. ত্রুটি: {error}")
+                self.stats['failed'] += 1
+                if op == 'patch' and get_http_status(error) == 404:
+                    # পোস্টটি ব্লগারে আর নেই (স্ন্যাপশট পুরনো); এন্ট্রি সরালে পরের রানে নতুন করে প্রকাশ হবে
+                    self.blogger_posts.pop(job_id, None)
+                # ব্লগার স্পষ্টভাবে প্রত্যাখ্যান করলে পোস্ট তৈরি হয়নি; নেটওয়ার্ক ত্রুটিতে ফলাফল অজানা থাকে
+                if self.journal and get_http_status(error) is not None:
+                    self.journal.record_result(blog_id, op, job_id, committed=False)
+
+class PlanRecorder:
+    """
+    PostPublisher-এর মতোই add()/flush()/stats, কিন্তু ব্লগারে কিছু না পাঠিয়ে রেন্ডার করা পোস্টগুলো টার্গেটের
+    পরিকল্পনায় ('to_insert', 'to_update') এবং বাতিল চাকরিগুলো কারণসহ ('rejected') লিখে রাখে।
+    """
+    def __init__(self, target_plan: Dict[str, Any], labels: Tuple[str, ...] = DEFAULT_POST_LABELS):
+        self.plan = target_plan
+        self.labels = labels
+        self.stats = {'candidates': 0, 'published': 0, 'updated': 0, 'rejected': 0, 'failed': 0}
+        self._pending: List[Tuple[str, Dict[str, Any], Dict[str, str]]] = []
+
+    def add(self, job_id: str, data: Dict[str, Any], details_data: Optional[Dict[str, str]]) -> bool:
+        self.stats['candidates'] += 1
         
-        for job_id, data in posts_to_add_sorted:
-            
-            if last_post_was_successful:
-                print(f"       ⏸️ পরবর্তী পোস্টের জন্য {DELAY_AFTER_OPERATION} সেকেন্ড অপেক্ষা করা হচ্ছে...")
-                time.sleep(DELAY_AFTER_OPERATION)
-            
-            last_post_was_successful = False
-            
-            details_data = fetch_job_details_by_id(session, job_id)
-            
-            if not details_data:
-                print(f"       ❌ এই পোস্টটিতে পর্যাপ্ত যোগাযোগের তথ্য না থাকায় এড়িয়ে যাওয়া হলো: {data['title']}.")
-                continue
-            
-            final_end_date_label = data['end_date_label']
-            
-            # কন্টেন্ট তৈরি
-            post_content = f"""
-            <div style="padding: 15px; border: 1px solid #CC0000; background-color: #ffe0e0;">
-                <h3 style="color: #CC0000; margin-top: 0;">আবেদনের শেষ তারিখ</h3>
-                <p style="font-weight: bold; color: #CC0000;">{final_end_date_label} (সকাল ০৬:০০ টা পর্যন্ত)</p>
-            </div>
-            <hr/>
-            <h3 style="color: #007456;">চাকরির সংক্ষিপ্ত তথ্য</h3>
-            <p><strong>কাজের স্থান (Workplace):</strong> {details_data['workplace']}</p>
-            <p><strong>কর্মসংস্থান অবস্থা (Employment Status):</strong> {details_data['job_nature']}</p>
-            <p><strong>বেতন সীমা (Salary):</strong> {details_data['salary_range']}</p>
-            <p><strong>চাকরির অবস্থান (Job Location):</strong> {details_data['job_location']}</p>
-            <hr/>
-            <h3 style="color: #007456;">দায়িত্ব ও প্রেক্ষাপট (Job Context and Responsibilities)</h3>
-            {details_data['job_description_html']}
-            <hr/>
-            <h3 style="color: #007456;">যোগ্যতা ও অভিজ্ঞতা</h3>
-            <p><strong>শিক্ষাগত যোগ্যতা (Education):</strong></p>
-            {details_data['education']}
-            <p><strong>অভিজ্ঞতা (Experience):</strong></p>
-            {details_data['experience']}
-            <p><strong>অতিরিক্ত প্রয়োজন (Additional Requirements):</strong></p>
-            {details_data['additional_req']}
-            <hr/>
-            <h3 style="color: #007456;">আবেদনের প্রক্রিয়া ও যোগাযোগ</h3>
-            <p style="font-weight: bold; color: #CC0000;">আবেদন করার আগে পড়ুন:</p>
-            {details_data['read_before_apply_html']}
-            
-            <p style="font-weight: bold;">সম্পূর্ণ প্রক্রিয়া:</p>
-            {details_data['apply_instruction_html']}
-            <hr/>
-            <p style="font-weight: bold;">সরাসরি আবেদনের লিঙ্ক: <a href="{details_data['apply_url']}" target="_blank">Bdjobs-এ আবেদন/বিস্তারিত দেখতে ক্লিক করুন</a></p>
-            <p style="font-weight: bold;">যোগাযোগের ইমেইল (যদি থাকে): {details_data['apply_email']}</p>
-            """
-            
-            # লেবেল তৈরি
-            post_labels = ['জব সার্কুলার', 'প্রাইভেট চাকরি', data['company_name']]
-            post_labels.append(f"{JOB_ID_LABEL_PREFIX}{job_id}")
-            post_labels.append(f"{END_DATE_LABEL_PREFIX}{final_end_date_label}")
+        if not details_data:
+            self.plan['rejected'].append({
+                'job_id': job_id,
+                'title': data['title'],
+                'reason': data.get('rejection_reason', 'invalid_contact_info'),
+                'post_id': data.get('update_post_id'),
+            })
+            self.stats['rejected'] += 1
+            return False
+        
+        self._pending.append((job_id, data, details_data))
+        return self.due()
 
-            post_body = {
-                'kind': 'blogger#post',
+    def due(self) -> bool:
+        return len(self._pending) >= BLOGGER_BATCH_SIZE
+
+    def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        
+        for (job_id, data, _), post_body in zip(pending, build_post_bodies(pending, self.labels)):
+            entry = {
+                'job_id': job_id,
                 'title': data['title'],
-                'content': post_content,
-                'labels': post_labels,
-                'isDraft': False
+                'end_date': data['end_date_label'],
+                'content_hash': job_fingerprint(data),
             }
-            
-            # পোস্ট করা
-            try:
-                service.posts().insert(blogId=blog_id, body=post_body).execute()
-                print(f"       ✅ সফলভাবে প্রকাশিত: {data['title']}")
-                last_post_was_successful = True
-            except Exception as e:
-                print(f"       ❌ API ERROR: পোস্ট করার সময় ব্যর্থ: {data['title']}. ত্রুটি: {e}")
-                
+            post_id = data.get('update_post_id')
+            if post_id:
+                patch_body = {key: post_body[key] for key in ('title', 'content', 'labels')}
+                self.plan['to_update'].append(dict(entry, post_id=post_id, body=patch_body))
+                self.stats['updated'] += 1
+            else:
+                self.plan['to_insert'].append(dict(entry, body=post_body))
+                self.stats['published'] += 1
+
+def create_publishers(service: Any, targets: List[SyncTarget], inventories: Dict[str, Dict[str, Dict[str, str]]], plan: Optional[Dict[str, Any]] = None, journal: Optional[SyncJournal] = None) -> Dict[str, Any]:
+    """প্রতিটি টার্গেটের জন্য আলাদা প্রকাশের সারি: PostPublisher, অথবা plan দিলে PlanRecorder।"""
+    if plan is not None:
+        return {target.name: PlanRecorder(plan['targets'][target.name], target.labels) for target in targets}
+    return {
+        target.name: PostPublisher(service, target.blog_id, inventories[target.name], target.labels, journal)
+        for target in targets
+    }
+
+def dispatch_screened_job(publishers: Dict[str, Any], job_id: str, data: Dict[str, Any], details_data: Optional[Dict[str, str]]) -> List[Any]:
+    """
+    যাচাই করা চাকরিটি তার টার্গেটগুলোর সারিতে যোগ করে; যেগুলোর ব্যাচ পাঠানোর সময় হয়েছে সেগুলো ফেরত দেয়।
+    চাকরিটি যে টার্গেটে যায় না, তার বাফারের সময়সীমাও এখানে যাচাই হয়।
+    """
+    due = []
+    for name, publisher in publishers.items():
+        job_data = data['targets'].get(name)
+        if job_data is None:
+            if publisher.due():
+                due.append(publisher)
+            continue
+        if 'rejection_reason' in data:
+            job_data = dict(job_data, rejection_reason=data['rejection_reason'])
+        if publisher.add(job_id, job_data, details_data):
+            due.append(publisher)
+    return due
+
+def publish_screened_jobs(publishers: Dict[str, Any], screened_jobs) -> Dict[str, Dict[str, int]]:
+    """যাচাই করা প্রতিটি চাকরি তার টার্গেটগুলোর সারিতে পাঠায় এবং ব্যাচে প্রকাশ করে; টার্গেটভিত্তিক হিসাব ফেরত দেয়।"""
+    for job_id, data, details_data in screened_jobs:
+        for publisher in dispatch_screened_job(publishers, job_id, data, details_data):
+            publisher.flush()
+    for publisher in publishers.values():
+        publisher.flush()
+    return {name: publisher.stats for name, publisher in publishers.items()}
+
+def report_addition(stats_by_target: Dict[str, Dict[str, int]]):
+    for name, stats in stats_by_target.items():
+        if len(stats_by_target) > 1:
+            print(f"\n🎯 টার্গেট: {name}")
+        report_target_addition(stats)
+    print("\n✅ নতুন পোস্ট প্রকাশ প্রক্রিয়া সম্পন্ন হয়েছে।")
+
+def report_target_addition(stats: Dict[str, int]):
+    if stats['candidates']:
+        print(f"\n   ✍️ মোট {stats['candidates']} টি নতুন/পরিবর্তিত পোস্ট: {stats['published']} টি প্রকাশিত, {stats['updated']} টি হালনাগাদ, {stats['rejected']} টি বাতিল, {stats['failed']} টি ব্যর্থ।")
     else:
         print("   ✅ কোনো নতুন পোস্ট প্রকাশের জন্য পাওয়া যায়নি।")
+
+@timed_stage('perform_addition')
+def perform_addition(service: Any, targets: List[SyncTarget], target_posts, inventories: Dict[str, Dict[str, Dict[str, str]]], cache: Optional[JobDetailCache] = None, plan: Optional[Dict[str, Any]] = None, journal: Optional[SyncJournal] = None) -> Dict[str, Dict[str, int]]:
+    """
+    নতুন ও বদলে যাওয়া চাকরিগুলো পাইপলাইনে পাঠায়: প্রতিটি টার্গেটের পোস্টের সাথে তুলনা → বিস্তারিত ফেচ ও
+    যোগাযোগ যাচাই (সব টার্গেটের জন্য একবার) → টার্গেটভিত্তিক সারিতে ব্যাচে প্রকাশ বা হালনাগাদ।
+    target_posts একটি dict (page_order অনুযায়ী সাজানো হয়) অথবা iter_target_jobs-এর মতো (job_id, data) জোড়ার
+    যেকোনো iterable হতে পারে; দ্বিতীয় ক্ষেত্রে তালিকা সংগ্রহ চলাকালীনই প্রকাশ শুরু হয়ে যায়।
+    plan দিলে কিছু প্রকাশ না করে ফলাফল পরিকল্পনায় লেখা হয় (PlanRecorder)।
+    """
+    print("\n▶️ ধাপ ৫: নতুন পোস্ট প্রকাশের লজিক শুরু...")
+    
+    if isinstance(target_posts, dict):
+        jobs = sorted(target_posts.items(), key=lambda item: item[1]['page_order'])
+    else:
+        jobs = target_posts
+
+    session = create_http_session(DETAIL_FETCH_WORKERS)
+    changed_jobs = iter_changed_jobs(jobs, targets, inventories)
+    screened_jobs = iter_screened_jobs(session, changed_jobs, cache=cache, journal=journal)
+    stats = publish_screened_jobs(create_publishers(service, targets, inventories, plan, journal), screened_jobs)
+    if plan is None:
+        report_addition(stats)
+    return stats
+
+
+# =========================================================
+# পরিকল্পনা (--plan) ও প্রয়োগ (--apply) মোড
+# =========================================================
+
+# পরিকল্পনা ফাইলের ফরম্যাট সংস্করণ; ফরম্যাট বদলালে বাড়াতে হবে, যাতে পুরনো ফাইল ভুলভাবে প্রয়োগ না হয়
+PLAN_FORMAT_VERSION = 1
+
+def new_sync_plan(targets: List[SyncTarget]) -> Dict[str, Any]:
+    return {
+        'version': PLAN_FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'targets': {
+            target.name: {
+                'blog_id': target.blog_id,
+                'list_label': target.list_label,
+                'to_delete': [],
+                'to_insert': [],
+                'to_update': [],
+                'rejected': [],
+            }
+            for target in targets
+        },
+    }
+
+def write_sync_plan(path: str, plan: Dict[str, Any]):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, path)
+
+def read_sync_plan(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        plan = json.load(f)
+    if plan.get('version') != PLAN_FORMAT_VERSION:
+        raise ValueError(f"পরিকল্পনা ফাইলের সংস্করণ মেলেনি: {plan.get('version')} (প্রত্যাশিত {PLAN_FORMAT_VERSION})")
+    return plan
+
+def load_snapshot_inventory(blog_id: str) -> Optional[BloggerInventory]:
+    """ব্লগার API কল না করে আগের রানের স্ন্যাপশট থেকে ইনভেন্টরি লোড করে; স্ন্যাপশট না থাকলে None।"""
+    snapshot = load_blogger_snapshot(blog_id)
+    if not snapshot:
+        return None
+    inventory = BloggerInventory(snapshot['posts'], snapshot.get('deadline_index'))
+    print(f"   💾 স্ন্যাপশট থেকে {len(inventory)} টি পোস্ট লোড হয়েছে (সর্বশেষ সিঙ্ক: {snapshot.get('synced_at')}); ব্লগার API কল করা হয়নি।")
+    return inventory
+
+def report_plan(plan: Dict[str, Any]):
+    print("\n📝 পরিকল্পনার সারাংশ:")
+    for name, target_plan in plan['targets'].items():
+        print(f"   🎯 {name} (ব্লগ: {target_plan['blog_id']}): {len(target_plan['to_delete'])} টি ডিলিট, "
+              f"{len(target_plan['to_insert'])} টি নতুন, {len(target_plan['to_update'])} টি হালনাগাদ, "
+              f"{len(target_plan['rejected'])} টি বাতিল।")
+
+def plan_synchronization(plan_path: str, engine: str = 'sync', targets_path: Optional[str] = None):
+    """
+    ব্লগারে কোনো পরিবর্তন না করে সম্পূর্ণ সিঙ্কের পরিকল্পনা তৈরি করে plan_path-এ JSON হিসেবে লেখে:
+    প্রতিটি টার্গেটের জন্য to_delete, to_insert ও to_update (রেন্ডার করা পোস্টসহ) এবং কারণসহ rejected।
+    ব্লগারের ইনভেন্টরি স্ন্যাপশট থেকে নেওয়া হয়; কোনো টার্গেটের স্ন্যাপশট না থাকলে শুধু সেটির জন্য
+    পোস্টের তালিকা (রিড-অনলি) আনা হয়। পরিকল্পনাটি পরে apply_sync_plan দিয়ে প্রয়োগ করা যায়।
+    """
+    global metrics, rate_limits
+    metrics = SyncMetrics()
+    rate_limits = EndpointRateLimits()
+    print("--- Private Job Sync: পরিকল্পনা মোড (ব্লগারে কিছু পরিবর্তন হবে না) ---")
+    engine = resolve_engine(engine)
+    
+    try:
+        targets = load_sync_targets(targets_path)
+        plan = new_sync_plan(targets)
+        inventories = {}
+        blogger_service = None
         
-    print("\n✅ নতুন পোস্ট প্রকাশ প্রক্রিয়া সম্পন্ন হয়েছে।")
+        for target in targets:
+            print(f"\n🎯 টার্গেট: {target.name} (ব্লগ: {target.blog_id}, লেবেল: {target.list_label})")
+            inventory = load_snapshot_inventory(target.blog_id)
+            if inventory is None:
+                blogger_service = blogger_service or get_blogger_service()
+                if not blogger_service:
+                    print("❌ স্ন্যাপশট নেই এবং ব্লগার অথেন্টিকেশন ব্যর্থ। পরিকল্পনা বাতিল করা হলো।")
+                    return
+                inventory = fetch_blogger_posts(blogger_service, target.blog_id, target.list_label)
+            inventories[target.name] = inventory
+            perform_deletion(None, target.blog_id, inventory, target_plan=plan['targets'][target.name])
+        
+        print("\n▶️ ধাপ ২: API থেকে তালিকা সংগ্রহ ও বিস্তারিত যাচাই শুরু...")
+        detail_cache = open_detail_cache()
+        try:
+            if engine == 'async':
+                asyncio.run(perform_addition_async(None, targets, inventories, cache=detail_cache, plan=plan))
+            else:
+                perform_addition(None, targets, iter_target_jobs(cache=detail_cache), inventories, cache=detail_cache, plan=plan)
+        finally:
+            if detail_cache:
+                detail_cache.close()
+            shutdown_html_process_pool()
+        
+        write_sync_plan(plan_path, plan)
+        report_plan(plan)
+        print(f"\n--- পরিকল্পনা সংরক্ষিত হয়েছে: {plan_path} (প্রয়োগ করতে: --apply {plan_path}) ---")
+    finally:
+        write_sync_metrics()
+
+@timed_stage('apply_plan')
+def apply_target_plan(service: Any, target_plan: Dict[str, Any], inventory: Dict[str, Dict[str, str]]) -> Dict[str, int]:
+    """
+    একটি টার্গেটের পরিকল্পনা ব্যাচ মিউটেশনে প্রয়োগ করে: আগে ডিলিট, পরে insert/patch। পরিকল্পনা তৈরির পরে
+    ব্লগারে যা বদলে গেছে (পোস্ট আগেই মুছে গেছে, আগেই প্রকাশিত বা হালনাগাদ হয়েছে) সেগুলো এড়িয়ে যাওয়া হয়,
+    তাই একই পরিকল্পনা দুবার প্রয়োগ করলেও ডুপ্লিকেট পোস্ট হয় না।
+    """
+    blog_id = target_plan['blog_id']
+    stats = {'deleted': 0, 'published': 0, 'updated': 0, 'skipped': 0, 'failed': 0}
+    
+    deletions = [entry for entry in target_plan['to_delete'] if inventory.get(entry['job_id'], {}).get('post_id') == entry['post_id']]
+    stats['skipped'] += len(target_plan['to_delete']) - len(deletions)
+    if deletions:
+        print(f"   🗑️ {len(deletions)} টি পোস্ট ডিলিট করা হচ্ছে...")
+        results = execute_blogger_batch(service, [
+            (entry['post_id'], lambda post_id=entry['post_id']: service.posts().delete(blogId=blog_id, postId=post_id))
+            for entry in deletions
+        ])
+        for entry in deletions:
+            _, error = results.get(entry['post_id'], (None, None))
+            if error is None or get_http_status(error) == 404:
+                inventory.pop(entry['job_id'], None)
+                stats['deleted'] += 1
+            else:
+                print(f"       ❌ ডিলিট ব্যর্থ হয়েছে: পোস্ট ID {entry['post_id']}. ত্রুটি: {error}")
+                stats['failed'] += 1
+    
+    operations = []
+    entries = []
+    for entry in target_plan['to_insert']:
+        if entry['job_id'] in inventory:
+            stats['skipped'] += 1
+            continue
+        entries.append(entry)
+        operations.append((entry['job_id'], lambda body=entry['body']: service.posts().insert(blogId=blog_id, body=body)))
+    for entry in target_plan['to_update']:
+        current = inventory.get(entry['job_id'])
+        if not current or current.get('post_id') != entry['post_id'] or current.get('content_hash') == entry['content_hash']:
+            stats['skipped'] += 1
+            continue
+        entries.append(entry)
+        operations.append((entry['job_id'], lambda post_id=entry['post_id'], body=entry['body']: service.posts().patch(blogId=blog_id, postId=post_id, body=body)))
+    
+    if operations:
+        print(f"   📤 {len(operations)} টি পোস্ট ব্যাচ আকারে প্রকাশ/হালনাগাদ করা হচ্ছে...")
+        results = execute_blogger_batch(service, operations)
+        for entry in entries:
+            response, error = results.get(entry['job_id'], (None, None))
+            if error is None and response:
+                stats['updated' if 'post_id' in entry else 'published'] += 1
+                inventory[entry['job_id']] = {
+                    'post_id': response.get('id') or entry.get('post_id'),
+                    'title': entry['title'],
+                    'end_date': entry['end_date'],
+                    'content_hash': entry['content_hash']
+                }
+            else:
+                print(f"       ❌ API ERROR: পোস্ট করার সময় ব্যর্থ: {entry['title']}. ত্রুটি: {error}")
+                stats['failed'] += 1
+                if 'post_id' in entry and get_http_status(error) == 404:
+                    inventory.pop(entry['job_id'], None)
+    
+    print(f"   ✅ {stats['deleted']} টি ডিলিট, {stats['published']} টি প্রকাশিত, {stats['updated']} টি হালনাগাদ, "
+          f"{stats['skipped']} টি আগেই প্রয়োগ হওয়ায় বাদ, {stats['failed']} টি ব্যর্থ।")
+    return stats
+
+def apply_sync_plan(plan_path: str):
+    """--plan দিয়ে সংরক্ষিত পরিকল্পনা প্রয়োগ করে; bdjobs-এ কোনো রিকোয়েস্ট যায় না।"""
+    global metrics, rate_limits
+    metrics = SyncMetrics()
+    rate_limits = EndpointRateLimits()
+    print(f"--- Private Job Sync: পরিকল্পনা প্রয়োগ ({plan_path}) ---")
+    
+    try:
+        plan = read_sync_plan(plan_path)
+        print(f"📝 পরিকল্পনা তৈরি হয়েছিল: {plan['created_at']}")
+        blogger_service = get_blogger_service()
+        if not blogger_service:
+            print("❌ ব্লগার অথেন্টিকেশন ব্যর্থ। স্ক্রিপ্ট বাতিল করা হলো।")
+            return
+        
+        for name, target_plan in plan['targets'].items():
+            print(f"\n🎯 টার্গেট: {name} (ব্লগ: {target_plan['blog_id']})")
+            # পরিকল্পনার পরের পরিবর্তন ধরতে ইনভেন্টরি হালনাগাদ করা হয় (স্ন্যাপশট থাকলে শুধু ডেল্টা)
+            inventory = fetch_blogger_posts(blogger_service, target_plan['blog_id'], target_plan['list_label'])
+            try:
+                apply_target_plan(blogger_service, target_plan, inventory)
+            finally:
+                save_blogger_snapshot(target_plan['blog_id'], inventory)
+        
+        print("\n--- পরিকল্পনা প্রয়োগ সমাপ্ত ---")
+    finally:
+        write_sync_metrics()
 
 
 # =========================================================
-# প্রধান নির্বাহ (Main Execution)
+# অ্যাসিঙ্ক ইঞ্জিন (--engine=async; aiohttp ঐচ্ছিক নির্ভরতা)
 # =========================================================
 
-def run_synchronization():
-    """সিঙ্ক্রোনাইজেশন প্রক্রিয়া শুরু করে (আগে ডিলিট, পরে অ্যাডিশন)।"""
-    print("--- Private Job Sync স্ক্রিপ্ট শুরু ---")
+class AsyncHttpStatusError(Exception):
+    """অ্যাসিঙ্ক ক্লায়েন্টে রিট্রাইয়ের পরেও ব্যর্থ HTTP স্ট্যাটাস।"""
+    def __init__(self, status: int, url: str):
+        super().__init__(f"{status} Error for url: {url}")
+        self.status = status
+
+class AsyncBdjobsClient:
+    """
+    aiohttp সেশনের উপর bdjobs ক্লায়েন্ট: হোস্টভিত্তিক সেমাফোর (একসাথে সর্বোচ্চ রিকোয়েস্ট), এন্ডপয়েন্টের
+    অ্যাডাপ্টিভ রেট লিমিটার (429/5xx ও Retry-After-এ রেট কমে ও থামে), রিট্রাই এবং ETag/Last-Modified
+    কন্ডিশনাল রিকোয়েস্ট — অর্থাৎ sync ইঞ্জিনের create_http_session ও fetch_json-এর সমতুল্য।
+    """
+    def __init__(self, http: Any, per_host_limit: int, cache: Optional[JobDetailCache] = None):
+        self._http = http
+        self._per_host_limit = max(1, per_host_limit)
+        self._cache = cache
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self._per_host_limit)
+        return self._semaphores[host]
+
+    async def fetch_json(self, url: str, conditional: bool = False, endpoint: str = 'bdjobs_list') -> Any:
+        import aiohttp
+
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphore(host)
+        limiter = rate_limits.get(endpoint)
+        headers = HEADERS
+        cached = self._cache.get_response(url) if conditional and self._cache else None
+        if cached:
+            etag, last_modified, _ = cached
+            headers = dict(HEADERS)
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            status, body, response_headers, error = None, b'', {}, None
+            await limiter.acquire()
+            async with semaphore:
+                try:
+                    async with self._http.get(url, headers=headers) as response:
+                        body = await response.read()
+                        status = response.status
+                        response_headers = response.headers
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+
+            if status is not None:
+                metrics.record_request(host, status, len(body))
+                if status == 304 and cached:
+                    metrics.increment('http_not_modified')
+                    return json.loads(cached[2])
+                if status not in RETRY_STATUS_CODES:
+                    limiter.record_success()
+                    if status >= 400:
+                        raise AsyncHttpStatusError(status, url)
+                    etag = response_headers.get('ETag')
+                    last_modified = response_headers.get('Last-Modified')
+                    if conditional and self._cache and (etag or last_modified):
+                        self._cache.put_response(url, etag, last_modified, body.decode('utf-8'))
+                    return json.loads(body)
+
+            if attempt == HTTP_MAX_RETRIES:
+                raise error or AsyncHttpStatusError(status, url)
+            metrics.increment('http_retries')
+            limiter.record_throttle(parse_retry_after(response_headers.get('Retry-After')))
+
+async def async_fetch_job_list_from_page(client: AsyncBdjobsClient, page_num: int, journal: Optional[SyncJournal] = None) -> Optional[List[Dict[str, Any]]]:
+    """fetch_job_list_from_page-এর অ্যাসিঙ্ক সংস্করণ (শেষ পেজে [], ব্যর্থ হলে None; জার্নালে থাকলে সেখান থেকে)।"""
+    with metrics.stage('fetch_job_list_page'):
+        if journal and page_num in journal.pages:
+            metrics.increment('journal_pages_replayed')
+            return journal.pages[page_num]
+        api_url = API_BDS_LIST.format(page_num=page_num)
+        try:
+            return (await client.fetch_json(api_url, conditional=True, endpoint='bdjobs_list')).get('data', []) or []
+        except AsyncHttpStatusError as e:
+            if e.status in [404, 400]:
+                print(f"       - Page {page_num}: শেষ পেজে পৌঁছেছে বা Invalid Page।")
+                return []
+            error = e
+        except Exception as e:
+            error = e
+        print(f"       ❌ API লিস্ট ফেচ ব্যর্থ (Page {page_num}): {error}")
+        metrics.increment('list_fetch_failures')
+        return None
+
+async def async_iter_job_list_pages(client: AsyncBdjobsClient, max_pages: Optional[int] = None, concurrency: Optional[int] = None, journal: Optional[SyncJournal] = None):
+    """iter_job_list_pages-এর অ্যাসিঙ্ক সংস্করণ: একই উইন্ডো, ক্রম ও থামার নিয়ম, শুধু থ্রেডের বদলে টাস্ক।"""
+    max_pages = MAX_PAGES_TO_FETCH if max_pages is None else max_pages
+    concurrency = max(1, PAGE_FETCH_CONCURRENCY if concurrency is None else concurrency)
+    in_flight: Dict[int, asyncio.Future] = {}
+    next_page = 1
+    consecutive_failures = 0
+
+    def submit_more():
+        nonlocal next_page
+        while len(in_flight) < concurrency and (not max_pages or next_page <= max_pages):
+            in_flight[next_page] = asyncio.ensure_future(async_fetch_job_list_from_page(client, next_page, journal))
+            next_page += 1
+
+    submit_more()
+    current_page = 1
+    try:
+        while current_page in in_flight:
+            job_list = await in_flight.pop(current_page)
+            if job_list is None:
+                consecutive_failures += 1
+                if consecutive_failures >= LIST_MAX_CONSECUTIVE_FAILURES:
+                    print(f"   ❌ পরপর {consecutive_failures} টি পেজ ব্যর্থ হওয়ায় তালিকা সংগ্রহ থামানো হলো।")
+                    break
+                current_page += 1
+                submit_more()
+                continue
+            consecutive_failures = 0
+            if not job_list:
+                break
+            if journal:
+                journal.record_page(current_page, job_list)
+            yield current_page, job_list
+            current_page += 1
+            submit_more()
+    finally:
+        for task in in_flight.values():
+            task.cancel()
+
+async def async_iter_target_jobs(client: AsyncBdjobsClient, journal: Optional[SyncJournal] = None):
+    current_date = date.today()
+    print_listing_scope(current_date)
     
-    blogger_service = get_blogger_service()
-    if not blogger_service:
-        print("❌ ব্লগার অথেন্টিকেশন ব্যর্থ। স্ক্রিপ্ট বাতিল করা হলো।")
-        return
+    async for current_page, job_list in async_iter_job_list_pages(client, journal=journal):
+        for job in iter_listing_page_jobs(current_page, job_list, current_date):
+            yield job
+
+async def async_iter_changed_jobs(jobs, targets: List[SyncTarget], inventories: Dict[str, Dict[str, Dict[str, str]]]):
+    seen = set()
+    async for job_id, data in jobs:
+        if job_id in seen:
+            continue
+        seen.add(job_id)
+        
+        wanted = plan_target_jobs(job_id, data, targets, inventories)
+        if wanted:
+            yield job_id, dict(data, targets=wanted)
+
+async def async_fetch_job_detail_payload(client: AsyncBdjobsClient, job_id: str) -> Optional[Dict[str, Any]]:
+    print(f"       ⚙️ বিস্তারিত API কল শুরু (ID: {job_id})...")
+    api_url = API_BDS_DETAILS.format(job_id=job_id)
+    
+    with metrics.stage('fetch_job_details'):
+        try:
+            return extract_job_details(await client.fetch_json(api_url, endpoint='bdjobs_details'))
+        except Exception as e:
+            print(f"       ❌ বিস্তারিত রিকোয়েস্ট/পার্সিং ব্যর্থ: {e}")
+            metrics.increment('detail_fetch_failures')
+            return None
+
+async def async_iter_prescreened_jobs(jobs, prescreener: JobPrescreener):
+    """iter_prescreened_jobs-এর অ্যাসিঙ্ক সংস্করণ।"""
+    window = []
+    async for item in jobs:
+        if PRESCREEN_WINDOW <= 1:
+            yield item
+            continue
+        window.append(item)
+        if len(window) >= PRESCREEN_WINDOW:
+            for sorted_item in prescreener.sort_window(window):
+                yield sorted_item
+            window = []
+    for sorted_item in prescreener.sort_window(window):
+        yield sorted_item
+
+async def async_iter_screened_jobs(client: AsyncBdjobsClient, jobs, cache: Optional[JobDetailCache] = None, journal: Optional[SyncJournal] = None):
+    """iter_screened_jobs-এর অ্যাসিঙ্ক সংস্করণ: একই উইন্ডো, ক্যাশ ও প্রাক-যাচাইয়ের নিয়ম।"""
+    prescreener = JobPrescreener(cache)
+    workers = max(1, DETAIL_FETCH_WORKERS)
+    window = DETAIL_FETCH_WINDOW if DETAIL_FETCH_WINDOW > 0 else workers * 2
+
+    html_pool = get_html_process_pool()
+
+    async def fetch_and_screen(job_id: str):
+        details = await async_fetch_job_detail_payload(client, job_id)
+        if not details:
+            return False, None
+        normalized = await asyncio.wrap_future(html_pool.submit(normalize_job_details, details, True)) if html_pool else None
+        return True, screen_job_details(job_id, details, normalized)
+
+    async def finish(entry):
+        job_id, data, task, cached = entry
+        if task is None:
+            return screened_job_entry(job_id, data, True, cached)
+        fetched, screened = await task
+        store_screened_result(cache, job_id, data, fetched, screened, journal, prescreener)
+        return screened_job_entry(job_id, data, fetched, screened)
+
+    in_flight = deque()
+    try:
+        async for job_id, data in async_iter_prescreened_jobs(jobs, prescreener):
+            cached = lookup_screened_result(cache, journal, job_id, data)
+            if cached is None:
+                if prescreener.skip_reason(job_id, data):
+                    continue
+                in_flight.append((job_id, data, asyncio.ensure_future(fetch_and_screen(job_id)), None))
+            else:
+                in_flight.append((job_id, data, None, cached[1]))
+            
+            while len(in_flight) >= window:
+                yield await finish(in_flight.popleft())
+        
+        while in_flight:
+            yield await finish(in_flight.popleft())
+        prescreener.report()
+    finally:
+        for _, _, task, _ in in_flight:
+            if task is not None:
+                task.cancel()
+
+async def perform_addition_async(service: Any, targets: List[SyncTarget], inventories: Dict[str, Dict[str, Dict[str, str]]], cache: Optional[JobDetailCache] = None, plan: Optional[Dict[str, Any]] = None, journal: Optional[SyncJournal] = None) -> Dict[str, Dict[str, int]]:
+    """
+    perform_addition-এর অ্যাসিঙ্ক সংস্করণ: তালিকা ও বিস্তারিত aiohttp কোরুটিনে আসে, আর ব্লগার ব্যাচ
+    (googleapiclient ব্লকিং) asyncio.to_thread-এ চলে — ফলে প্রকাশ চলাকালীনও বিস্তারিত ফেচ থেমে থাকে না।
+    """
+    import aiohttp
+
+    print("\n▶️ ধাপ ৫: নতুন পোস্ট প্রকাশের লজিক শুরু (async ইঞ্জিন)...")
+    publishers = create_publishers(service, targets, inventories, plan, journal)
     
-    blogger_posts = fetch_blogger_posts(blogger_service, BLOG_ID)
-    perform_deletion(blogger_service, BLOG_ID, blogger_posts)
-    target_posts = fetch_all_target_jobs()
+    with metrics.stage('perform_addition'):
+        connector = aiohttp.TCPConnector(limit=max(DETAIL_FETCH_WORKERS, PAGE_FETCH_CONCURRENCY) * 2, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+            client = AsyncBdjobsClient(http, DETAIL_FETCH_WORKERS, cache)
+            changed_jobs = async_iter_changed_jobs(async_iter_target_jobs(client, journal), targets, inventories)
+            
+            async for job_id, data, details_data in async_iter_screened_jobs(client, changed_jobs, cache=cache, journal=journal):
+                for publisher in dispatch_screened_job(publishers, job_id, data, details_data):
+                    await asyncio.to_thread(publisher.flush)
+            for publisher in publishers.values():
+                await asyncio.to_thread(publisher.flush)
     
-    if not target_posts:
-        print("❌ টার্গেট সাইট থেকে কোনো বৈধ পোস্ট ডেটা পাওয়া যায়নি। সিঙ্ক্রোনাইজেশন বাতিল করা হলো।")
-        print("\n--- Private Job Sync স্ক্রিপ্ট সমাপ্ত ---")
+    stats = {name: publisher.stats for name, publisher in publishers.items()}
+    if plan is None:
+        report_addition(stats)
+    return stats
+
+def resolve_engine(engine: str) -> str:
+    """অনুরোধ করা ইঞ্জিন ফেরত দেয়; async চাওয়া হলেও aiohttp না থাকলে sync-এ ফিরে যায়।"""
+    if engine == 'async':
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            print("⚠️ aiohttp ইনস্টল নেই (pip install aiohttp); sync ইঞ্জিনে চালানো হচ্ছে।")
+            return 'sync'
+    return engine
+
+
+# =========================================================
+# প্রধান নির্বাহ (Main Execution)
+# =========================================================
+
+def report_rate_limits():
+    """রানের মোট অপেক্ষার সময় এবং প্রতিটি এন্ডপয়েন্টের শেষ রেট ও থ্রটলিং প্রিন্ট করে (রেট মেট্রিক্সেও থাকে)।"""
+    parts = []
+    for limiter in rate_limits.limiters():
+        metrics.increment(f'rate_final_{limiter.endpoint}', round(limiter.rate, 3))
+        rate_text = f"{limiter.rate:.1f}/সে." if limiter.rate > 0 else 'সীমাহীন'
+        slept = metrics.counters.get(f'sleep_seconds_{limiter.endpoint}', 0.0)
+        parts.append(f"{limiter.endpoint}: {slept:.1f} সে., রেট {rate_text}, থ্রটলিং {limiter.throttles} বার")
+    print(f"⏱️ মোট অপেক্ষা (রেট লিমিট ও ব্যাকঅফ): {metrics.counters.get('sleep_seconds', 0.0):.1f} সেকেন্ড"
+          + (f" — {'; '.join(parts)}" if parts else ''))
+
+def write_sync_metrics():
+    report_rate_limits()
+    if not SYNC_METRICS_PATH:
         return
-        
-    perform_addition(blogger_service, BLOG_ID, target_posts, blogger_posts)
+    try:
+        metrics.write(SYNC_METRICS_PATH)
+        print(f"📊 রানের পরিমাপ সংরক্ষিত হয়েছে: {SYNC_METRICS_PATH}")
+    except Exception as e:
+        print(f"⚠️ রানের পরিমাপ লেখা যায়নি: {e}")
+
+def run_synchronization(engine: str = 'sync', targets_path: Optional[str] = None):
+    """
+    সিঙ্ক্রোনাইজেশন প্রক্রিয়া শুরু করে (আগে ডিলিট, পরে অ্যাডিশন)। তালিকা সংগ্রহ, বিস্তারিত যাচাই ও প্রকাশ
+    একটি স্ট্রিমিং পাইপলাইনে চলে, তাই প্রথম পেজ আসার পরপরই নতুন পোস্ট প্রকাশ শুরু হয়।
+    engine='async' দিলে এই পাইপলাইন asyncio/aiohttp-এ চলে (ব্লগার অংশ একই থাকে)।
+    একাধিক টার্গেট থাকলে একবার অথেন্টিকেশন, একবার তালিকা সংগ্রহ ও একটি বিস্তারিত ক্যাশ সবার জন্য ব্যবহার হয়।
+    অগ্রগতি চেকপয়েন্ট জার্নালে লেখা হয় (SyncJournal), তাই মাঝপথে থেমে গেলে পরের রান সেখান থেকেই শুরু হয়।
+    """
+    global metrics, rate_limits
+    metrics = SyncMetrics()
+    rate_limits = EndpointRateLimits()
+    print("--- Private Job Sync স্ক্রিপ্ট শুরু ---")
+    engine = resolve_engine(engine)
     
-    print("\n--- Private Job Sync স্ক্রিপ্ট সমাপ্ত ---")
+    try:
+        targets = load_sync_targets(targets_path)
+        blogger_service = get_blogger_service()
+        if not blogger_service:
+            print("❌ ব্লগার অথেন্টিকেশন ব্যর্থ। স্ক্রিপ্ট বাতিল করা হলো।")
+            return
+        
+        journal = open_sync_journal()
+        inventories = {}
+        detail_cache = None
+        try:
+            for target in targets:
+                if len(targets) > 1:
+                    print(f"\n🎯 টার্গেট: {target.name} (ব্লগ: {target.blog_id}, লেবেল: {target.list_label})")
+                full_refresh = bool(journal and journal.needs_full_refresh(target.blog_id))
+                inventories[target.name] = fetch_blogger_posts(blogger_service, target.blog_id, target.list_label, full_refresh)
+                if journal:
+                    if full_refresh:
+                        journal.mark_refreshed(target.blog_id)
+                    replayed = journal.apply_commits(target.blog_id, inventories[target.name])
+                    if replayed:
+                        print(f"   ♻️ জার্নাল থেকে আগের রানের {replayed} টি সম্পন্ন মিউটেশন ইনভেন্টরিতে যোগ করা হলো।")
+                perform_deletion(blogger_service, target.blog_id, inventories[target.name], journal=journal)
+                save_blogger_snapshot(target.blog_id, inventories[target.name])
+            
+            print("\n▶️ ধাপ ২: API থেকে তালিকা সংগ্রহ শুরু (সংগ্রহের সাথে সাথেই যাচাই ও প্রকাশ চলবে)...")
+            detail_cache = open_detail_cache()
+            if engine == 'async':
+                asyncio.run(perform_addition_async(blogger_service, targets, inventories, cache=detail_cache, journal=journal))
+            else:
+                perform_addition(blogger_service, targets, iter_target_jobs(cache=detail_cache, journal=journal), inventories, cache=detail_cache, journal=journal)
+            
+            if not metrics.counters.get('listing_jobs_valid'):
+                print("❌ টার্গেট সাইট থেকে কোনো বৈধ পোস্ট ডেটা পাওয়া যায়নি।")
+            if journal:
+                journal.complete()
+        finally:
+            for target in targets:
+                if target.name in inventories:
+                    save_blogger_snapshot(target.blog_id, inventories[target.name])
+            if detail_cache:
+                detail_cache.close()
+            if journal:
+                journal.close()
+            shutdown_html_process_pool()
+        
+        print("\n--- Private Job Sync স্ক্রিপ্ট সমাপ্ত ---")
+    finally:
+        write_sync_metrics()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='bdjobs প্রাইভেট চাকরি → ব্লগার সিঙ্ক')
+    parser.add_argument('--engine', choices=['sync', 'async'], default=SYNC_ENGINE,
+                        help="'sync' (ডিফল্ট, requests + থ্রেড পুল) অথবা 'async' (asyncio + aiohttp)")
+    parser.add_argument('--targets', metavar='FILE',
+                        help='একাধিক ব্লগ/ক্যাটাগরির টার্গেট তালিকা (JSON); না দিলে SYNC_TARGETS অথবা শুধু BLOG_ID')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--plan', metavar='FILE',
+                      help='ব্লগারে কিছু পরিবর্তন না করে ডিলিট/প্রকাশ/হালনাগাদের পরিকল্পনা এই ফাইলে (JSON) লিখবে')
+    mode.add_argument('--apply', metavar='FILE',
+                      help='--plan দিয়ে তৈরি পরিকল্পনা ব্লগারে প্রয়োগ করবে')
+    return parser.parse_args(argv)
 
 
 if __name__ == '__main__':
-    run_synchronization()
+    args = parse_args()
+    if args.apply:
+        apply_sync_plan(args.apply)
+    elif args.plan:
+        plan_synchronization(args.plan, engine=args.engine, targets_path=args.targets)
+    else:
+        run_synchronization(engine=args.engine, targets_path=args.targets)